@@ -2,6 +2,10 @@
 
 # shellcheck disable=SC2164
 cd starthub
+# Read by the settings too, several workers refuse to start without a shared cache.
+export WEB_CONCURRENCY="${WEB_CONCURRENCY:-3}"
 uv run manage.py collectstatic --noinput
 uv run manage.py migrate --noinput
-uv run gunicorn --bind 0.0.0.0:8000 --workers 3 config.wsgi
+# Uploads lost with the workers of the previous deployment never finish.
+uv run manage.py expire_pending_uploads
+uv run gunicorn --bind 0.0.0.0:8000 --workers "$WEB_CONCURRENCY" config.wsgi
@@ -1,7 +1,9 @@
 from datetime import date
-from typing import Any
+from typing import IO, Any, cast
 
+from django.core.files.uploadedfile import UploadedFile
 from domain.exceptions.validation import DateIsNotIsoFormatException, MissingRequiredFieldException
+from domain.utils.file_stream import FileStream
 from domain.value_objects.common import Pagination
 from loguru import logger
 
@@ -30,3 +32,8 @@ def parse_date(date_str: str) -> date:
     except ValueError as e:
         logger.exception(f"Exception during parsing established_date: {repr(e)}.")
         raise DateIsNotIsoFormatException("Date must be in iso format.") from e
+
+
+def uploaded_file_to_stream(uploaded_file: UploadedFile) -> FileStream:
+    """Django keeps small uploads in memory and bigger ones in a temporary file, the stream reads either in chunks."""
+    return FileStream(cast(IO[bytes], uploaded_file), size=uploaded_file.size)
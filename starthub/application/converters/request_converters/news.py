@@ -1,6 +1,6 @@
 from typing import Any
 
-from application.converters.request_converters.common import get_required_field
+from application.converters.request_converters.common import get_required_field, uploaded_file_to_stream
 from django.core.files.uploadedfile import UploadedFile
 from domain.value_objects.common import Id
 from domain.value_objects.file import ImageFile
@@ -13,8 +13,7 @@ def request_to_news_create_command(
     request_data: dict[str, Any], request_files: dict[str, UploadedFile], user_id: int
 ) -> NewsCreateCommand:
     project_image_file: UploadedFile = get_required_field(request_files, "project_image")
-    project_image_file.seek(0)
-    image = ImageFile(value=project_image_file.read())
+    image = ImageFile(value=uploaded_file_to_stream(project_image_file))
     logger.debug("request.FILES -> ImageFile conversion OK")
 
     return NewsCreateCommand(
@@ -31,8 +30,7 @@ def request_to_news_update_command(
     image: ImageFile | None = None
     if "image" in request_files:
         news_image: UploadedFile = request_files["image"]
-        news_image.seek(0)
-        image = ImageFile(value=news_image.read())
+        image = ImageFile(value=uploaded_file_to_stream(news_image))
     return NewsUpdateCommand(
         news_id=Id(value=news_id),
         title=NewsTitle(value=request_data["title"]) if "title" in request_data else None,
@@ -1,10 +1,23 @@
+import base64
+import dataclasses
 import json
+from datetime import date
+from decimal import Decimal
 from typing import Any, cast
 
-from application.converters.request_converters.common import get_required_field, parse_date
+import pydantic
+from application.converters.request_converters.common import get_required_field, parse_date, uploaded_file_to_stream
+from application.dto.project import ProjectCardDto
 from django.core.files.uploadedfile import UploadedFile
 from django.http import QueryDict
 from django.utils.datastructures import MultiValueDict
+from domain.enums.project_sort import ProjectSortEnum
+from domain.enums.project_view import ProjectViewEnum
+from domain.exceptions.project_management import (
+    InvalidProjectCursorException,
+    InvalidProjectFieldsException,
+    InvalidProjectSortException,
+)
 from domain.value_objects.common import (
     DeadlineDate,
     Description,
@@ -29,18 +42,24 @@ from domain.value_objects.filter import ProjectFilter
 from domain.value_objects.project_management import (
     GoalSum,
     ProjectCreateCommand,
+    ProjectCursor,
     ProjectImageCreateCommand,
     ProjectImageUpdateCommand,
     ProjectName,
+    ProjectPagination,
+    ProjectSearch,
+    ProjectSort,
     ProjectStage,
     ProjectStatus,
     ProjectUpdateCommand,
+    ProjectView,
     TeamMemberCreateCommand,
 )
 from loguru import logger
 
 
 def request_data_to_project_filter(data: QueryDict) -> ProjectFilter:
+    """:raises InvalidProjectSearchException:"""
     filter_ = ProjectFilter()
 
     if data.get("category_slug"):
@@ -51,10 +70,73 @@ def request_data_to_project_filter(data: QueryDict) -> ProjectFilter:
         filter_.status = ProjectStatus(value=cast(str, data.get("status")))
     if data.get("stage"):
         filter_.stage = ProjectStage(value=cast(str, data.get("stage")))
+    if data.get("search"):
+        filter_.search = ProjectSearch(value=cast(str, data.get("search")))
 
     return filter_
 
 
+def request_data_to_project_pagination(data: QueryDict) -> ProjectPagination:
+    """
+    :raises MissingRequiredFieldException:
+    :raises InvalidProjectSortException: Also if projects are sorted by relevance without a search.
+    :raises InvalidProjectCursorException:
+    :raises pydantic.ValidationError: If the limit is not a number.
+    """
+    limit = get_required_field(data, "limit")
+    default_sort: ProjectSortEnum = ProjectSortEnum.RELEVANCE if data.get("search") else ProjectSortEnum.NEWEST
+    sort = ProjectSortEnum(ProjectSort(value=data.get("sort") or default_sort).value)
+    if sort == ProjectSortEnum.RELEVANCE and not data.get("search"):
+        raise InvalidProjectSortException("Only searches are sorted by relevance.")
+    cursor: ProjectCursor | None = None
+    if data.get("cursor"):
+        cursor = token_to_project_cursor(cast(str, data.get("cursor")))
+        if cursor.sort != sort:
+            raise InvalidProjectCursorException("The cursor belongs to another sort.")
+    elif data.get("last_id"):
+        if sort != ProjectSortEnum.NEWEST:
+            raise InvalidProjectCursorException("last_id pages only the newest projects, use the cursor.")
+        cursor = ProjectCursor(sort=sort, last_id=cast(str, data.get("last_id")))
+    return ProjectPagination(limit=limit, sort=sort, cursor=cursor)
+
+
+def request_data_to_project_view(data: QueryDict) -> ProjectViewEnum:
+    """:raises InvalidProjectViewException:"""
+    return ProjectViewEnum(ProjectView(value=data.get("view") or ProjectViewEnum.CARD).value)
+
+
+def request_data_to_project_card_fields(data: QueryDict) -> tuple[str, ...] | None:
+    """
+    :return: The comma separated fields of ProjectCardDto in their order, None if every field is asked for.
+    :raises InvalidProjectFieldsException:
+    """
+    if data.get("fields") is None:
+        return None
+    fields: tuple[str, ...] = tuple(dict.fromkeys(i.strip() for i in cast(str, data.get("fields")).split(",")))
+    allowed: list[str] = [field.name for field in dataclasses.fields(ProjectCardDto)]
+    if not all(field in allowed for field in fields):
+        raise InvalidProjectFieldsException(
+            f"Invalid project fields: {data.get('fields')}. Allowed fields: {', '.join(allowed)}"
+        )
+    return fields
+
+
+def token_to_project_cursor(token: str) -> ProjectCursor:
+    """:raises InvalidProjectCursorException:"""
+    try:
+        sort, key, last_id = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        sort = ProjectSortEnum(sort)
+        if sort == ProjectSortEnum.NEWEST:
+            return ProjectCursor(sort=sort, last_id=last_id)
+        if sort == ProjectSortEnum.DEADLINE:
+            return ProjectCursor(sort=sort, key=date.fromisoformat(key), last_id=last_id)
+        if sort == ProjectSortEnum.RELEVANCE:
+            return ProjectCursor(sort=sort, key=float(key), last_id=last_id)
+        return ProjectCursor(sort=sort, key=Decimal(key), last_id=last_id)
+    except (ValueError, TypeError, ArithmeticError, pydantic.ValidationError):
+        raise InvalidProjectCursorException("Invalid cursor.")
+
+
 def _request_data_to_team_members(data: dict[str, str]) -> list[TeamMemberCreateCommand]:
     """
     :raises MissingRequiredFieldException:
@@ -91,8 +173,7 @@ def _request_data_to_company_founder_create_command(data: dict[str, Any]) -> Com
 
 def _request_files_to_project_plan(files: MultiValueDict[str, UploadedFile]) -> PdfFile:
     project_plan_file: UploadedFile = get_required_field(cast(dict[str, UploadedFile], files), field="project_plan")
-    project_plan_file.seek(0)
-    return PdfFile(value=project_plan_file.read())
+    return PdfFile(value=uploaded_file_to_stream(project_plan_file))
 
 
 def request_data_to_project_create_command(
@@ -123,8 +204,7 @@ def request_data_to_project_create_command(
 
     images: list[UploadedFile] = files.getlist("images")
     for image in images:
-        image.seek(0)
-        project_images.append(ImageFile(value=image.read()))
+        project_images.append(ImageFile(value=uploaded_file_to_stream(image)))
     logger.debug("request.FILES -> ImageFile conversion OK")
 
     return ProjectCreateCommand(
@@ -185,8 +265,7 @@ def request_data_to_the_project_update_command(
     project_plan: PdfFile | None = None
     if "project_plan" in files:
         project_plan_file: UploadedFile = files["project_plan"]
-        project_plan_file.seek(0)
-        project_plan = PdfFile(value=project_plan_file.read())
+        project_plan = PdfFile(value=uploaded_file_to_stream(project_plan_file))
 
     return ProjectUpdateCommand(
         project_id=Id(value=project_id),
@@ -210,8 +289,7 @@ def request_files_to_project_image_create_command(
     user_id: int,
 ) -> ProjectImageCreateCommand:
     project_image_file: UploadedFile = get_required_field(files, "project_image")
-    project_image_file.seek(0)
-    image = ImageFile(value=project_image_file.read())
+    image = ImageFile(value=uploaded_file_to_stream(project_image_file))
     logger.debug("request.FILES -> ImageFile conversion OK")
     project_image_create = ProjectImageCreateCommand(
         user_id=Id(value=user_id), project_id=Id(value=project_id), image_file=image
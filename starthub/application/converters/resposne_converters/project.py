@@ -1,5 +1,18 @@
-from application.dto.project import CategoryDto, CompanyDto, CompanyFounderDto, FundingModelDto, ProjectDto
+import base64
+import json
+from typing import Any, Callable
+
+from application.dto.project import (
+    CategoryDto,
+    CompanyDto,
+    CompanyFounderDto,
+    FundingModelDto,
+    ProjectCardDto,
+    ProjectDto,
+)
 from domain.models.project import Project
+from domain.models.project_card import ProjectCard
+from domain.value_objects.project_management import ProjectCursor
 
 
 def project_to_dto(project: Project, image_links: list[str] | None = None) -> ProjectDto:
@@ -8,7 +21,7 @@ def project_to_dto(project: Project, image_links: list[str] | None = None) -> Pr
         name=project.name,
         slug=project.slug,
         description=project.description,
-        creator_id=project.creator.id,
+        creator_id=project.creator_id,
         company=CompanyDto(
             name=project.company.name,
             slug=project.company.slug,
@@ -40,5 +53,65 @@ def project_to_dto(project: Project, image_links: list[str] | None = None) -> Pr
     )
 
 
+# The card column every field of ProjectCardDto is read from.
+PROJECT_CARD_COLUMNS: dict[str, str] = {
+    "id": "id",
+    "name": "name",
+    "slug": "slug",
+    "summary": "summary",
+    "cover_url": "cover_path",
+    "category": "category_id",
+    "funding_model": "funding_model_id",
+    "company_name": "company_name",
+    "country_code": "country_id",
+    "creator_id": "creator_id",
+    "goal_sum": "goal_sum",
+    "current_sum": "current_sum",
+    "deadline": "deadline",
+    "stage": "stage",
+    "status": "status",
+}
+
+
+def _project_card_fields(card: ProjectCard, cover_url: str | None) -> dict[str, Callable[[], Any]]:
+    """Every field is read when it is called, so a card with deferred columns only loads what is asked for."""
+    return {
+        "id": lambda: card.id,
+        "name": lambda: card.name,
+        "slug": lambda: card.slug,
+        "summary": lambda: card.summary,
+        "cover_url": lambda: cover_url,
+        "category": lambda: CategoryDto(id=card.category.id, name=card.category.name, slug=card.category.slug),
+        "funding_model": lambda: FundingModelDto(
+            id=card.funding_model.id, name=card.funding_model.name, slug=card.funding_model.slug
+        ),
+        "company_name": lambda: card.company_name,
+        "country_code": lambda: None if card.country is None else card.country.code,
+        "creator_id": lambda: card.creator_id,
+        "goal_sum": lambda: float(card.goal_sum),
+        "current_sum": lambda: float(card.current_sum),
+        "deadline": lambda: card.deadline,
+        "stage": lambda: card.stage,
+        "status": lambda: card.status,
+    }
+
+
+def project_card_to_dto(card: ProjectCard, cover_url: str | None = None) -> ProjectCardDto:
+    return ProjectCardDto(**{field: read() for field, read in _project_card_fields(card, cover_url).items()})
+
+
+def project_card_to_fields(card: ProjectCard, fields: tuple[str, ...], cover_url: str | None = None) -> dict[str, Any]:
+    """:param fields: Fields of ProjectCardDto, the card must have their columns loaded."""
+    readers: dict[str, Callable[[], Any]] = _project_card_fields(card, cover_url)
+    return {field: readers[field]() for field in fields}
+
+
 def projects_to_dtos(projects: list[Project]) -> list[ProjectDto]:
     return [project_to_dto(project) for project in projects]
+
+
+def project_cursor_to_token(cursor: ProjectCursor) -> str:
+    """The token is opaque to clients, only the server reads the sort key it holds."""
+    key: str | None = None if cursor.key is None else str(cursor.key)
+    data: bytes = json.dumps([cursor.sort, key, cursor.last_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
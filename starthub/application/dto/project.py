@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import date
+from typing import Any
 
 
 @dataclass
@@ -49,3 +50,31 @@ class ProjectDto:
     deadline: date
     stage: str
     status: str
+
+
+@dataclass
+class ProjectCardDto:
+    id: int
+    name: str
+    slug: str
+    summary: str
+    cover_url: str | None
+    category: CategoryDto
+    funding_model: FundingModelDto
+    company_name: str | None
+    country_code: str | None
+    creator_id: int
+    goal_sum: float
+    current_sum: float
+    deadline: date
+    stage: str
+    status: str
+
+
+@dataclass
+class ProjectPageDto:
+    # Cards, only the asked fields of the cards or full projects.
+    results: list[ProjectCardDto] | list[dict[str, Any]] | list[ProjectDto]
+    next_cursor: str | None
+    # Approximate, only counted on request.
+    total: int | None = None
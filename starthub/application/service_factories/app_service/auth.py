@@ -5,6 +5,7 @@ from application.service_factories.domain_service.auth import (
     TokenServiceFactory,
 )
 from application.services.auth import AuthAppService, RegistrationAppService
+from infrastructure.services.token_verifier import access_token_verifier
 
 
 class AuthAppServiceFactory(AbstractAppServiceFactory[AuthAppService]):
@@ -13,6 +14,7 @@ class AuthAppServiceFactory(AbstractAppServiceFactory[AuthAppService]):
         return AuthAppService(
             token_service=TokenServiceFactory.create_service(),
             auth_service=AuthServiceFactory.create_service(),
+            access_token_verifier=access_token_verifier,
         )
 
 
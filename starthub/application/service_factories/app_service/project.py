@@ -9,7 +9,7 @@ from application.service_factories.domain_service.project_management import (
     TeamMemberServiceFactory,
 )
 from application.services.project import ProjectAppService
-from infrastructure.cloud_storages.google import google_cloud_storage
+from infrastructure.cloud_storages.factory import cloud_storage
 
 
 class ProjectAppServiceFactory(AbstractAppServiceFactory[ProjectAppService]):
@@ -23,5 +23,5 @@ class ProjectAppServiceFactory(AbstractAppServiceFactory[ProjectAppService]):
             company_service=CompanyServiceFactory.create_service(),
             company_founder_service=CompanyFounderServiceFactory.create_service(),
             project_image_service=ProjectImageServiceFactory.create_service(),
-            google_cloud_storage=google_cloud_storage,
+            cloud_storage=cloud_storage,
         )
@@ -2,6 +2,7 @@ from application.ports.domain_service_factory import AbstractDomainServiceFactor
 from config import settings
 from domain.services.auth import AuthService, RegistrationService, TokenService
 from infrastructure.repositories.user import DjUserReadRepository, DjUserWriteRepository
+from infrastructure.services.revocation_index import revocation_index
 
 
 class AuthServiceFactory(AbstractDomainServiceFactory[AuthService]):
@@ -11,6 +12,7 @@ class AuthServiceFactory(AbstractDomainServiceFactory[AuthService]):
             token_service=TokenService(secret_key=settings.SECRET_KEY),
             user_read_repository=DjUserReadRepository(),
             user_write_repository=DjUserWriteRepository(),
+            revocation_index=revocation_index,
         )
 
 
@@ -1,8 +1,8 @@
 from application.ports.domain_service_factory import AbstractDomainServiceFactory
-from domain.services.file import ImageService
 from domain.services.news import NewsService
-from infrastructure.cloud_storages.google import google_cloud_storage
+from infrastructure.cloud_storages.factory import cloud_storage
 from infrastructure.repositories.news import DjNewsReadRepository, DjNewsWriteRepository
+from infrastructure.services.image_processor import image_processor
 
 
 class NewsServiceFactory(AbstractDomainServiceFactory[NewsService]):
@@ -11,6 +11,6 @@ class NewsServiceFactory(AbstractDomainServiceFactory[NewsService]):
         return NewsService(
             news_read_repository=DjNewsReadRepository(),
             news_write_repository=DjNewsWriteRepository(),
-            cloud_storage=google_cloud_storage,
-            image_service=ImageService(),
+            cloud_storage=cloud_storage,
+            image_processor=image_processor,
         )
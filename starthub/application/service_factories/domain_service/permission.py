@@ -2,6 +2,7 @@ from application.ports.domain_service_factory import AbstractDomainServiceFactor
 from domain.services.permission import PermissionService
 from infrastructure.repositories.permission import DjPermissionReadRepository
 from infrastructure.repositories.user import DjUserReadRepository
+from infrastructure.services.permission_cache import permission_cache
 
 
 class PermissionServiceFactory(AbstractDomainServiceFactory[PermissionService]):
@@ -10,4 +11,5 @@ class PermissionServiceFactory(AbstractDomainServiceFactory[PermissionService]):
         return PermissionService(
             user_read_repository=DjUserReadRepository(),
             permission_read_repository=DjPermissionReadRepository(),
+            permission_cache=permission_cache,
         )
@@ -8,7 +8,7 @@ from domain.services.project_management import (
     ProjectSocialLinkService,
     TamMemberService,
 )
-from infrastructure.cloud_storages.google import google_cloud_storage
+from infrastructure.cloud_storages.factory import cloud_storage
 from infrastructure.repositories.company import (
     DjCompanyFounderReadRepository,
     DjCompanyFounderWriteRepository,
@@ -18,6 +18,7 @@ from infrastructure.repositories.company import (
 from infrastructure.repositories.country import DjCountryReadRepository
 from infrastructure.repositories.project_management import (
     DjFundingModelReadRepository,
+    DjProjectCardReadRepository,
     DjProjectCategoryReadRepository,
     DjProjectImageReadRepository,
     DjProjectImageWriteRepository,
@@ -31,6 +32,8 @@ from infrastructure.repositories.project_management import (
     DjTeamMemberWriteRepository,
 )
 from infrastructure.repositories.user import DjUserReadRepository
+from infrastructure.services.image_processor import image_processor
+from infrastructure.services.upload_queue import upload_queue
 
 
 class ProjectServiceFactory(AbstractDomainServiceFactory[ProjectService]):
@@ -39,12 +42,14 @@ class ProjectServiceFactory(AbstractDomainServiceFactory[ProjectService]):
         return ProjectService(
             project_read_repository=DjProjectReadRepository(),
             project_write_repository=DjProjectWriteRepository(),
+            project_card_read_repository=DjProjectCardReadRepository(),
             project_category_read_repository=DjProjectCategoryReadRepository(),
             funding_model_read_repository=DjFundingModelReadRepository(),
             user_read_repository=DjUserReadRepository(),
             company_read_repository=DjCompanyReadRepository(),
             company_write_repository=DjCompanyWriteRepository(),
-            cloud_storage=google_cloud_storage,
+            cloud_storage=cloud_storage,
+            upload_queue=upload_queue,
             pdf_service=PdfService(),
         )
 
@@ -102,5 +107,7 @@ class ProjectImageServiceFactory(AbstractDomainServiceFactory[ProjectImageServic
             project_image_read_repository=DjProjectImageReadRepository(),
             project_image_write_repository=DjProjectImageWriteRepository(),
             project_read_repository=DjProjectReadRepository(),
-            cloud_storage=google_cloud_storage,
+            cloud_storage=cloud_storage,
+            upload_queue=upload_queue,
+            image_processor=image_processor,
         )
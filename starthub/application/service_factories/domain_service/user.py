@@ -1,23 +1,25 @@
 from application.ports.domain_service_factory import AbstractDomainServiceFactory
 from domain.services.file import ImageService
 from domain.services.user_management import UserService
-from infrastructure.cloud_storages.google import google_cloud_storage
+from infrastructure.cloud_storages.factory import cloud_storage
 from infrastructure.repositories.user import (
     DjUserPhoneReadRepository,
     DjUserPhoneWriteRepository,
     DjUserReadRepository,
     DjUserWriteRepository,
 )
+from infrastructure.services.image_processor import image_processor
 
 
 class UserServiceFactory(AbstractDomainServiceFactory[UserService]):
     @staticmethod
     def create_service() -> UserService:
         return UserService(
-            cloud_storage=google_cloud_storage,
+            cloud_storage=cloud_storage,
             user_read_repository=DjUserReadRepository(),
             user_write_repository=DjUserWriteRepository(),
             user_phone_write_repository=DjUserPhoneWriteRepository(),
             user_phone_read_repository=DjUserPhoneReadRepository(),
             image_service=ImageService(),
+            image_processor=image_processor,
         )
@@ -5,14 +5,12 @@ from application.converters.request_converters.auth import (
     request_data_to_login_credentials,
     request_data_to_user_create_payload,
 )
-from application.converters.resposne_converters.auth import (
-    access_payload_to_dto,
-    access_token_to_dto,
-    token_pair_to_dto,
-)
-from application.dto.auth import AccessPayloadDto, AccessTokenDto, TokenPairDto
+from application.converters.resposne_converters.auth import access_payload_to_dto, token_pair_to_dto
+from application.dto.auth import AccessPayloadDto, TokenPairDto
 from application.ports.service import AbstractAppService
+from domain.enums.token import TokenNameEnum
 from domain.models.user import User
+from domain.ports.token_verifier import AbstractAccessTokenVerifier
 from domain.services.auth import AuthService, RegistrationService, TokenService
 from domain.value_objects.auth import LoginCredentials
 from domain.value_objects.token import AccessPayload, AccessTokenVo, RefreshTokenVo, TokenPairVo
@@ -40,17 +38,12 @@ class RegistrationAppService(AbstractAppService):
 
 
 class AuthAppService(AbstractAppService):
-    def __init__(self, auth_service: AuthService, token_service: TokenService):
+    def __init__(
+        self, auth_service: AuthService, token_service: TokenService, access_token_verifier: AbstractAccessTokenVerifier
+    ):
         self._auth_service = auth_service
         self._token_service = token_service
-
-    def _check_user_existence(self, credentials_raw: dict[str, str]) -> None:
-        """
-        :raises KeyError: If missing email field.
-        :raises UserNotFoundException:
-        """
-        email: Email = request_data_to_email(credentials_raw)
-        self._auth_service.check_user_existence(email)
+        self._access_token_verifier = access_token_verifier
 
     def login(self, credentials_raw: dict[str, str]) -> TokenPairDto:
         """
@@ -62,27 +55,35 @@ class AuthAppService(AbstractAppService):
         :raises pydantic.ValidationError: If fields has incorrect types
         :raises InvalidCredentialsException:
         """
-        self._check_user_existence(credentials_raw=credentials_raw)
+        # The user is looked up before the password is validated, an unknown email is reported as such.
+        email: Email = request_data_to_email(credentials_raw)
+        user: User = self._auth_service.get_user_by_email(email)
 
         credentials: LoginCredentials = request_data_to_login_credentials(data=credentials_raw)
         logger.info("Credentials parsed successfully")
 
-        token_pair_vo: TokenPairVo = self._auth_service.login(credentials=credentials)
+        token_pair_vo: TokenPairVo = self._auth_service.login(credentials=credentials, user=user)
         token_pair_dto: TokenPairDto = token_pair_to_dto(token_pair_vo)
 
         return token_pair_dto
 
-    def reissue_access(self, cookies: dict[str, str]) -> AccessTokenDto:
+    def reissue(self, cookies: dict[str, str]) -> TokenPairDto:
         """
         :raises ValidationException:
         :raises InvalidTokenException:
+        :raises TokenExpiredException:
         """
         refresh_token: RefreshTokenVo = request_cookies_to_refresh_token(cookies)
-        access_token: AccessTokenVo = self._auth_service.reissue_access(refresh_token)
+        token_pair_vo: TokenPairVo = self._auth_service.reissue(refresh_token)
         logger.debug("Access token issued successfully.")
 
-        access_token_dto = access_token_to_dto(access_token)
-        return access_token_dto
+        token_pair_dto: TokenPairDto = token_pair_to_dto(token_pair_vo)
+        return token_pair_dto
+
+    def logout(self, cookies: dict[str, str]) -> None:
+        """Revokes the refresh token of the cookies if there is one."""
+        if cookies.get(TokenNameEnum.REFRESH_TOKEN):
+            self._auth_service.logout(request_cookies_to_refresh_token(cookies))
 
     def verify_access(self, cookies: dict[str, str]) -> AccessPayloadDto:
         """
@@ -91,7 +92,7 @@ class AuthAppService(AbstractAppService):
         :raises TokenExpiredException:
         """
         access_token: AccessTokenVo = request_cookies_to_access_token(cookies)
-        access_payload: AccessPayload = self._token_service.verify_access(access_token)
+        access_payload: AccessPayload = self._access_token_verifier.verify(access_token)
         logger.debug("Access token verified successfully.")
 
         access_payload_dto: AccessPayloadDto = access_payload_to_dto(access_payload)
@@ -8,6 +8,8 @@ from application.services.news import NewsAppService
 from application.services.project import ProjectAppService
 from application.services.user import UserAppService
 from application.services.user_favorite import UserFavoriteAppService
+from infrastructure.cloud_storages.factory import storage
+from infrastructure.cloud_storages.local import LocalCloudStorage
 from infrastructure.services.cookie import CookieService, cookie_service
 
 
@@ -64,5 +66,10 @@ class Gateway:
             self._cookie_service = cookie_service
         return self._cookie_service
 
+    @property
+    def local_cloud_storage(self) -> LocalCloudStorage | None:
+        """The cloud storage whose files are served by the application, None when another backend is configured."""
+        return storage if isinstance(storage, LocalCloudStorage) else None
+
 
 gateway = Gateway()
@@ -7,23 +7,35 @@ from application.converters.inner.project_command_to_company_create_command impo
 from application.converters.inner.team_members_create_command_to_payload import (
     convert_team_members_create_command_to_payload,
 )
-from application.converters.request_converters.common import request_to_pagination
 from application.converters.request_converters.project import (
+    request_data_to_project_card_fields,
     request_data_to_project_create_command,
     request_data_to_project_filter,
+    request_data_to_project_pagination,
+    request_data_to_project_view,
     request_data_to_the_project_update_command,
     request_files_to_project_image_create_command,
     request_project_data_to_project_images_update_command,
 )
-from application.converters.resposne_converters.project import project_to_dto
-from application.dto.project import ProjectDto
+from application.converters.resposne_converters.project import (
+    PROJECT_CARD_COLUMNS,
+    project_card_to_dto,
+    project_card_to_fields,
+    project_cursor_to_token,
+    project_to_dto,
+)
+from application.dto.project import ProjectCardDto, ProjectDto, ProjectPageDto
 from application.ports.service import AbstractAppService
 from django.core.files.uploadedfile import UploadedFile
 from django.db import transaction
 from django.http import QueryDict
 from django.utils.datastructures import MultiValueDict
+from domain.enums.image_variant import ImageVariantEnum
+from domain.enums.project_view import ProjectViewEnum
+from domain.exceptions.project_management import InvalidProjectFieldsException
 from domain.models.company import Company, CompanyFounder
 from domain.models.project import Project, ProjectPhone, TeamMember
+from domain.ports.cloud_storage import AbstractCloudStorage
 from domain.services.company import CompanyFounderService, CompanyService
 from domain.services.project_management import (
     ProjectImageService,
@@ -32,19 +44,21 @@ from domain.services.project_management import (
     ProjectSocialLinkService,
     TamMemberService,
 )
-from domain.value_objects.cloud_storage import CloudStorageCreateUrlPayload
-from domain.value_objects.common import Id, Pagination
+from domain.value_objects.cloud_storage import CloudStorageCreateUrlsPayload
+from domain.value_objects.common import Id
 from domain.value_objects.filter import ProjectFilter
 from domain.value_objects.project_management import (
     ProjectCreateCommand,
+    ProjectCursor,
     ProjectImageCreateCommand,
     ProjectImageDeleteCommand,
+    ProjectImagesCreateCommand,
     ProjectImageUpdateCommand,
+    ProjectPagination,
     ProjectPhoneCreatePayload,
     ProjectSocialLinkCreatePayload,
     ProjectUpdateCommand,
 )
-from infrastructure.cloud_storages.google import GoogleCloudStorage
 from loguru import logger
 
 
@@ -58,7 +72,7 @@ class ProjectAppService(AbstractAppService):
         company_service: CompanyService,
         company_founder_service: CompanyFounderService,
         project_image_service: ProjectImageService,
-        google_cloud_storage: GoogleCloudStorage,
+        cloud_storage: AbstractCloudStorage,
     ):
         self._project_service = project_service
         self._team_member_service = team_member_service
@@ -67,40 +81,89 @@ class ProjectAppService(AbstractAppService):
         self._company_service = company_service
         self._company_founder_service = company_founder_service
         self._project_image_service = project_image_service
-        self._google_cloud_storage = google_cloud_storage
+        self._cloud_storage = cloud_storage
 
     def get_by_id(self, project_id: int) -> ProjectDto:
         """:raises ProjectNotFoundException:"""
         project: Project = self._project_service.get_by_id(Id(value=project_id))
         images: list[str] = self._project_image_service.get_paths(project_id=Id(value=project.id))
-        image_links: list[str] = list()
-        for i in images:
-            image_links.append(self._google_cloud_storage.create_url(payload=CloudStorageCreateUrlPayload(file_path=i)))
+        urls: dict[str, str] = self._cloud_storage.create_urls(CloudStorageCreateUrlsPayload(file_paths=images))
+        image_links: list[str] = [urls[i] for i in images]
         return project_to_dto(project=project, image_links=image_links)
 
-    def get(self, data: QueryDict) -> list[ProjectDto]:
+    def get(self, data: QueryDict) -> ProjectPageDto:
+        """
+        Returns cards of the projects, only the asked `fields` of them, or the full projects with `view=full`.
+        :raises MissingRequiredFieldException:
+        :raises InvalidProjectSearchException:
+        :raises InvalidProjectSortException:
+        :raises InvalidProjectCursorException:
+        :raises InvalidProjectViewException:
+        :raises InvalidProjectFieldsException:
+        """
         project_filter: ProjectFilter = request_data_to_project_filter(data)
-        pagination: Pagination = request_to_pagination(request_data=data)
+        pagination: ProjectPagination = request_data_to_project_pagination(data)
+        view: ProjectViewEnum = request_data_to_project_view(data)
+        fields: tuple[str, ...] | None = request_data_to_project_card_fields(data)
         logger.debug(f"pagination = {pagination}")
         logger.debug(f"project_filter = {project_filter}")
 
-        projects: list[Project] = self._project_service.get(filter_=project_filter, pagination=pagination)
-        logger.debug(f"found {len(projects)} projects.")
-        project_dtos: list[ProjectDto] = list()
-
-        for project in projects:
-            images: list[str] = self._project_image_service.get_paths(project_id=Id(value=project.id))
-            logger.debug(f"{images=}")
-            images_links: list[str] = list()
-            if images:
-                first_image: str = images[0]
-                images_links = [
-                    self._google_cloud_storage.create_url(payload=CloudStorageCreateUrlPayload(file_path=first_image))
-                ]
-            project_dtos.append(project_to_dto(project=project, image_links=images_links))
+        results: list[ProjectCardDto] | list[ProjectDto] | list[dict[str, Any]]
+        next_cursor: ProjectCursor | None
+        if view == ProjectViewEnum.FULL:
+            if fields is not None:
+                raise InvalidProjectFieldsException("Fields are only selected from the project cards.")
+            results, next_cursor = self._get_full_projects(project_filter, pagination)
+        else:
+            results, next_cursor = self._get_cards(project_filter, pagination, fields)
+        logger.debug(f"found {len(results)} projects.")
+
+        return ProjectPageDto(
+            results=results,
+            next_cursor=None if next_cursor is None else project_cursor_to_token(next_cursor),
+            total=self._project_service.estimate_count(project_filter) if data.get("with_total") == "true" else None,
+        )
+
+    def _get_cards(
+        self, filter_: ProjectFilter, pagination: ProjectPagination, fields: tuple[str, ...] | None
+    ) -> tuple[list[ProjectCardDto] | list[dict[str, Any]], ProjectCursor | None]:
+        columns: frozenset[str] | None = None if fields is None else frozenset(PROJECT_CARD_COLUMNS[i] for i in fields)
+        cards, next_cursor = self._project_service.get_cards(filter_=filter_, pagination=pagination, columns=columns)
+
+        urls: dict[str, str] = dict()
+        if fields is None or "cover_url" in fields:
+            urls = self._cloud_storage.create_urls(
+                CloudStorageCreateUrlsPayload(file_paths=[card.cover_path for card in cards if card.cover_path])
+            )
+        if fields is None:
+            card_dtos: list[ProjectCardDto] = [
+                project_card_to_dto(card=card, cover_url=urls.get(card.cover_path or "")) for card in cards
+            ]
+            return card_dtos, next_cursor
+        return [
+            project_card_to_fields(card=card, fields=fields, cover_url=urls.get(card.cover_path or ""))
+            for card in cards
+        ], next_cursor
 
-        logger.debug(f"project_dtos amount: {len(project_dtos)}")
-        return project_dtos
+    def _get_full_projects(
+        self, filter_: ProjectFilter, pagination: ProjectPagination
+    ) -> tuple[list[ProjectDto], ProjectCursor | None]:
+        projects, next_cursor = self._project_service.get(filter_=filter_, pagination=pagination)
+        urls: dict[str, str] = self._cloud_storage.create_urls(
+            CloudStorageCreateUrlsPayload(
+                file_paths=[
+                    image.get_path(ImageVariantEnum.CARD) for project in projects for image in project.first_images
+                ]
+            )
+        )
+        project_dtos: list[ProjectDto] = [
+            project_to_dto(
+                project=project,
+                image_links=[urls[image.get_path(ImageVariantEnum.CARD)] for image in project.first_images],
+            )
+            for project in projects
+        ]
+        return project_dtos, next_cursor
 
     def create(self, data: dict[str, Any], files: MultiValueDict[str, UploadedFile], user_id: int) -> Project:
         logger.warning("Started creating project.")
@@ -120,13 +183,12 @@ class ProjectAppService(AbstractAppService):
             )
             logger.info(f"A company_founder created successfully. Founder id = {founder.id}")
 
-            for image in command.images:
-                self._project_image_service.create(
-                    command=ProjectImageCreateCommand(
-                        user_id=Id(value=user_id), project_id=Id(value=project.id), image_file=image
-                    )
+            self._project_image_service.create_many(
+                command=ProjectImagesCreateCommand(
+                    user_id=Id(value=user_id), project_id=Id(value=project.id), image_files=command.images
                 )
-                logger.debug("ProjectImage uploaded successfully.")
+            )
+            logger.debug("ProjectImages created successfully.")
 
             for member_payload in convert_team_members_create_command_to_payload(
                 command.team_members, Id(value=project.id)
@@ -52,6 +52,8 @@ _db_port = os.getenv("DB_PORT")
 _allowed_hosts = os.getenv("ALLOWED_HOSTS")
 _csrf_trusted_origins = os.getenv("CSRF_TRUSTED_ORIGINS")
 _google_cloud_bucket_name = os.getenv("GOOGLE_CLOUD_BUCKET_NAME")
+# "google" stores files in the bucket, "local" in LOCAL_CLOUD_STORAGE_ROOT and "memory" in the worker process.
+_cloud_storage_backend = os.getenv("CLOUD_STORAGE_BACKEND", "google")
 
 if not (
     _mode
@@ -64,7 +66,7 @@ if not (
     and _db_port
     and _allowed_hosts
     and _csrf_trusted_origins
-    and _google_cloud_bucket_name
+    and (_google_cloud_bucket_name or _cloud_storage_backend != "google")
 ):
     logger.warning(f"{bool(_mode)=}")
     logger.warning(f"{bool(_secret_key)=}")
@@ -90,7 +92,8 @@ else:
     DB_PORT: str = _db_port
     ALLOWED_HOSTS: list[str] = _allowed_hosts.split(",")
     CSRF_TRUSTED_ORIGINS: list[str] = _csrf_trusted_origins.split(",")
-    GOOGLE_CLOUD_BUCKET_NAME: str = _google_cloud_bucket_name
+    CLOUD_STORAGE_BACKEND: str = _cloud_storage_backend
+    GOOGLE_CLOUD_BUCKET_NAME: str = _google_cloud_bucket_name or ""
 logger.warning(f"{DEBUG=}")
 # =====================================================================================================================
 
@@ -101,6 +104,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "setup",
     "rest_framework",
     "domain",
@@ -145,9 +149,80 @@ DATABASES = {
         "PORT": DB_PORT,
     }
 }
+
+# Gunicorn reads the same variable for its amount of worker processes.
+WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# The versions invalidating what every worker process keeps are stored in the default cache, so the workers must
+# share it. The in-process LocMemCache only fits a single worker, use redis for more.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "starthub"),
+    }
+}
+if WEB_CONCURRENCY > 1 and CACHES["default"]["BACKEND"] == "django.core.cache.backends.locmem.LocMemCache":
+    raise ValueError("Several worker processes need a shared CACHE_BACKEND, such as redis.")
+
+# "memory" keeps signed urls in the worker process, "django" shares them through the default cache.
+SIGNED_URL_CACHE_BACKEND: str = os.getenv("SIGNED_URL_CACHE_BACKEND", "memory")
+SIGNED_URL_CACHE_MAX_SIZE: int = int(os.getenv("SIGNED_URL_CACHE_MAX_SIZE", "10000"))
+SIGNED_URL_CACHE_SAFETY_MARGIN: int = int(os.getenv("SIGNED_URL_CACHE_SAFETY_MARGIN", "120"))  # in seconds
+# Threads used to sign batches of urls, 0 signs them in the request thread.
+GOOGLE_CLOUD_SIGNING_WORKERS: int = int(os.getenv("GOOGLE_CLOUD_SIGNING_WORKERS", "0"))
+# Used by the "local" and "memory" cloud storage backends, their files are served by a view under this url.
+LOCAL_CLOUD_STORAGE_ROOT: Path = Path(os.getenv("LOCAL_CLOUD_STORAGE_ROOT", BASE_DIR / "../local_storage"))
+LOCAL_CLOUD_STORAGE_URL: str = os.getenv("LOCAL_CLOUD_STORAGE_URL", "/api/v2/storage/")
+# Background uploads of project plans and images.
+UPLOAD_QUEUE_WORKERS: int = int(os.getenv("UPLOAD_QUEUE_WORKERS", "4"))
+UPLOAD_QUEUE_MAX_ATTEMPTS: int = int(os.getenv("UPLOAD_QUEUE_MAX_ATTEMPTS", "3"))
+# Uploads pending for longer are expired by the "expire_pending_uploads" command, their worker was lost.
+UPLOAD_PENDING_TIMEOUT: int = int(os.getenv("UPLOAD_PENDING_TIMEOUT", "3600"))  # in seconds
+# Verified access tokens kept by every worker process until they expire.
+ACCESS_TOKEN_CACHE_MAX_SIZE: int = int(os.getenv("ACCESS_TOKEN_CACHE_MAX_SIZE", "10000"))
+# Permission names of users, kept by every worker process and in the default cache.
+PERMISSION_CACHE_MAX_SIZE: int = int(os.getenv("PERMISSION_CACHE_MAX_SIZE", "10000"))
+PERMISSION_CACHE_TIMEOUT: int = int(os.getenv("PERMISSION_CACHE_TIMEOUT", "3600"))  # in seconds
+PERMISSION_CACHE_LOCAL_TIMEOUT: int = int(os.getenv("PERMISSION_CACHE_LOCAL_TIMEOUT", "60"))  # in seconds
+# Seconds after which categories, funding models and countries are loaded again by every worker process.
+REFERENCE_DATA_VERSION_TIMEOUT: int = int(os.getenv("REFERENCE_DATA_VERSION_TIMEOUT", "300"))
+# Seconds a filtered count of projects is cached for, unfiltered counts are estimated by postgres.
+PROJECT_COUNT_CACHE_TIMEOUT: int = int(os.getenv("PROJECT_COUNT_CACHE_TIMEOUT", "60"))
+# Seconds public GET responses are cached for, 0 caches none. Must be shorter than SIGNED_URL_CACHE_SAFETY_MARGIN.
+# It also bounds how long a change is served stale when its invalidation is missed.
+RESPONSE_CACHE_TIMEOUT: int = int(os.getenv("RESPONSE_CACHE_TIMEOUT", "60"))
+# Revoked refresh tokens, kept by every worker process as a bloom filter sized for the capacity.
+REVOKED_TOKENS_CAPACITY: int = int(os.getenv("REVOKED_TOKENS_CAPACITY", "100000"))
+REVOKED_TOKENS_REBUILD_INTERVAL: int = int(os.getenv("REVOKED_TOKENS_REBUILD_INTERVAL", "300"))  # in seconds
+# Processes resizing uploaded images.
+IMAGE_PROCESSING_WORKERS: int = int(os.getenv("IMAGE_PROCESSING_WORKERS", "2"))
+
 STATIC_URL = "static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# "pbkdf2", "scrypt" or "argon2" (needs argon2-cffi) hashes new passwords. The other hashers only verify old
+# passwords, which are rehashed on the next successful login. A changed cost is applied the same way.
+PASSWORD_HASHER: str = os.getenv("PASSWORD_HASHER", "pbkdf2")
+PASSWORD_HASHER_CLASSES: dict[str, str] = {
+    "pbkdf2": "infrastructure.services.password_hashers.TunedPBKDF2PasswordHasher",
+    "scrypt": "infrastructure.services.password_hashers.TunedScryptPasswordHasher",
+    "argon2": "infrastructure.services.password_hashers.TunedArgon2PasswordHasher",
+}
+if PASSWORD_HASHER not in PASSWORD_HASHER_CLASSES:
+    raise ValueError(f"Unknown password hasher: {PASSWORD_HASHER}.")
+# Django's other default hashers stay to verify passwords hashed before the policy existed.
+PASSWORD_HASHERS: list[str] = [
+    PASSWORD_HASHER_CLASSES[PASSWORD_HASHER],
+    *(path for name, path in PASSWORD_HASHER_CLASSES.items() if name != PASSWORD_HASHER),
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+]
+# Hashing costs, unset ones keep the Django defaults.
+PBKDF2_ITERATIONS: int | None = int(os.getenv("PBKDF2_ITERATIONS", "0")) or None
+SCRYPT_WORK_FACTOR: int | None = int(os.getenv("SCRYPT_WORK_FACTOR", "0")) or None  # a power of 2
+ARGON2_TIME_COST: int | None = int(os.getenv("ARGON2_TIME_COST", "0")) or None
+ARGON2_MEMORY_COST: int | None = int(os.getenv("ARGON2_MEMORY_COST", "0")) or None  # in KiB
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -164,7 +239,11 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 REST_FRAMEWORK: dict[str, list[str]] = {
-    "DEFAULT_AUTHENTICATION_CLASSES": [],
+    "DEFAULT_AUTHENTICATION_CLASSES": ["presentation.authentication.AccessTokenAuthentication"],
+    "DEFAULT_RENDERER_CLASSES": [
+        "presentation.renderers.DtoJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
 }
 
 LANGUAGE_CODE = "en-us"
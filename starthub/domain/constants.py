@@ -20,6 +20,8 @@ PASSWORD_PATTERN = re.compile(r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d).+$")
 
 ACCESS_TOKEN_LIFETIME = 15 * 60  # 15 minutes
 REFRESH_TOKEN_LIFETIME = 15 * 24 * 3600  # 15 days
+REFRESH_TOKEN_ROTATION_AGE = 24 * 3600  # 1 day, older refresh tokens are replaced when they are used
+SIGNED_URL_LIFETIME = 15 * 60  # 15 minutes
 
 
 JWT_ALGORITHM = "HS256"
@@ -31,14 +33,30 @@ REFRESH_DECODE_OPTIONS = {
     "verify_signature": True,
     "require": ["sub", "iat", "exp", "type"],
 }
+# Required in refresh tokens since they are rotated, tokens issued before carry none of them.
+REFRESH_IDENTITY_CLAIMS = ("email", "jti")
 
 COUNTRY_CODE_LENGTH = 2
+# Projects are written in several languages, words are matched as they are written instead of by one language's stems.
+SEARCH_CONFIG = "simple"
+# Letters and digits, everything else separates the words of a search.
+SEARCH_WORD_PATTERN = re.compile(r"[^\W_]+", flags=re.UNICODE)
+# Project cards show the beginning of the description.
+PROJECT_CARD_SUMMARY_LENGTH = 200
 FUNDING_GOAL_MAX_DIGITS = 12
 KZ_BIN_LENGTH = 12
 
 PDF_MAX_SIZE_IN_BYTES = 20 * MEGABYTE
 IMAGE_MAX_SIZE_IN_BYTES = 5 * MEGABYTE
 PROJECT_IMAGES_MAX_AMOUNT = 7
+FILE_CHUNK_SIZE = 256 * 1024  # in bytes
+FILE_SIGNATURE_SIZE = 8192  # in bytes, the amount `filetype` reads to guess a file type
+# Longest side in pixels and jpeg quality of the generated image variants, images are never upscaled.
+IMAGE_VARIANTS: dict[str, tuple[int, int]] = {
+    "thumbnail": (160, 70),
+    "card": (640, 80),
+    "full": (1920, 85),
+}
 
 DESCRIPTION_MAX_LENGTH = 2_000
 NEWS_CONTENT_MAX_LENGTH = 2_000
@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class ImageVariantEnum(StrEnum):
+    THUMBNAIL = "thumbnail"
+    CARD = "card"
+    FULL = "full"
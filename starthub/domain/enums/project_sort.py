@@ -0,0 +1,10 @@
+from enum import StrEnum
+
+
+class ProjectSortEnum(StrEnum):
+    NEWEST = "newest"
+    DEADLINE = "deadline"
+    GOAL_SUM = "goal_sum"
+    CURRENT_SUM = "current_sum"
+    # Only searches are sorted by relevance, it is their default sort.
+    RELEVANCE = "relevance"
@@ -0,0 +1,8 @@
+from enum import StrEnum
+
+
+class ProjectViewEnum(StrEnum):
+    """How much of every project a listing returns."""
+
+    CARD = "card"
+    FULL = "full"
@@ -0,0 +1,10 @@
+from enum import StrEnum
+
+
+class ResponseScopeEnum(StrEnum):
+    """The data a cached response is built from, changing it invalidates every response of the scope."""
+
+    PROJECTS = "projects"
+    NEWS = "news"
+    USERS = "users"
+    FAVORITES = "favorites"
@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class UploadStatusEnum(StrEnum):
+    PENDING = "pending"
+    UPLOADED = "uploaded"
+    FAILED = "failed"
@@ -7,3 +7,7 @@ class CloudStorageException(DomainException):
 
 class FileNotFoundCloudStorageException(CloudStorageException):
     pass
+
+
+class InvalidSignatureCloudStorageException(CloudStorageException):
+    pass
@@ -43,6 +43,14 @@ class ProjectNameAlreadyExistsException(AlreadyExistsException, ProjectException
     pass
 
 
+class ProjectPlanNotFoundException(NotFoundException, ProjectException):
+    pass
+
+
+class ProjectPlanNotReadyException(ProjectException):
+    pass
+
+
 # ==== Project Image Exceptions ====
 class ProjectImageException(ProjectException):
     pass
@@ -103,3 +111,23 @@ class ProjectStatusException(ProjectException):
 
 class InvalidProjectStatusException(ValidationException, ProjectStatusException):
     pass
+
+
+class InvalidProjectSortException(ValidationException, ProjectException):
+    pass
+
+
+class InvalidProjectCursorException(ValidationException, ProjectException):
+    pass
+
+
+class InvalidProjectSearchException(ValidationException, ProjectException):
+    pass
+
+
+class InvalidProjectViewException(ValidationException, ProjectException):
+    pass
+
+
+class InvalidProjectFieldsException(ValidationException, ProjectException):
+    pass
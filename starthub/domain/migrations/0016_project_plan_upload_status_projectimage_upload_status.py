@@ -0,0 +1,31 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0015_merge_20250629_1856"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="plan_upload_status",
+            field=models.CharField(
+                choices=[("pending", "PENDING"), ("uploaded", "UPLOADED"), ("failed", "FAILED")],
+                default="uploaded",
+                max_length=16,
+            ),
+        ),
+        migrations.AddField(
+            model_name="projectimage",
+            name="upload_status",
+            field=models.CharField(
+                choices=[("pending", "PENDING"), ("uploaded", "UPLOADED"), ("failed", "FAILED")],
+                default="uploaded",
+                max_length=16,
+            ),
+        ),
+    ]
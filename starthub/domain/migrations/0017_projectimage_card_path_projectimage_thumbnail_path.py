@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0016_project_plan_upload_status_projectimage_upload_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectimage",
+            name="card_path",
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name="projectimage",
+            name="thumbnail_path",
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+    ]
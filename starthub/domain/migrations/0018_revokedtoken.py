@@ -0,0 +1,28 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:02
+
+import domain.ports.model
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0017_projectimage_card_path_projectimage_thumbnail_path"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RevokedToken",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("jti", models.CharField(blank=True, max_length=32, null=True, unique=True)),
+                ("user_id", models.PositiveIntegerField(db_index=True)),
+                ("revoked_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("expires_at", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "db_table": "revoked_tokens",
+            },
+            bases=(models.Model, domain.ports.model.AbstractModel),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0018_revokedtoken"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="roles",
+            field=models.ManyToManyField(related_name="users", to="domain.role"),
+        ),
+    ]
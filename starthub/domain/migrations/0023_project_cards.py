@@ -0,0 +1,126 @@
+# Generated by Django 5.2.1 on 2026-10-18 19:20
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+import domain.ports.model
+from django.db import migrations, models
+
+# Existing projects get their cards once, afterwards they are written with the projects.
+FILL_PROJECT_CARDS = """
+INSERT INTO project_cards (
+    id, name, slug, summary, category_id, funding_model_id, creator_id, company_name, country_id,
+    stage, status, goal_sum, current_sum, deadline, cover_path, search_vector
+)
+SELECT
+    p.id, p.name, p.slug, LEFT(p.description, 200), p.category_id, p.funding_model_id, p.creator_id,
+    c.name, c.country_id, p.stage, p.status, p.goal_sum, p.current_sum, p.deadline,
+    (
+        SELECT COALESCE(NULLIF(i.card_path, ''), i.file_path)
+        FROM project_images i
+        WHERE i.project_id = p.id AND i.upload_status = 'uploaded'
+        ORDER BY i."order", i.id
+        LIMIT 1
+    ),
+    p.search_vector
+FROM projects p
+LEFT JOIN company c ON c.project_id = p.id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0022_project_search"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectCard",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=255)),
+                ("slug", models.CharField(max_length=255)),
+                ("summary", models.CharField(max_length=200)),
+                ("creator_id", models.BigIntegerField()),
+                ("company_name", models.CharField(blank=True, max_length=255, null=True)),
+                (
+                    "stage",
+                    models.CharField(
+                        choices=[
+                            ("idea", "IDEA"),
+                            ("mvp", "MVP"),
+                            ("scale", "SCALE"),
+                            ("validation", "VALIDATION"),
+                            ("prototype", "PROTOTYPE"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("active", "ACTIVE"),
+                            ("completed", "COMPLETED"),
+                            ("draft", "DRAFT"),
+                            ("under_moderation", "UNDER_MODERATION"),
+                            ("fundraising", "FUNDRAISING"),
+                            ("suspended", "SUSPENDED"),
+                            ("cancelled", "CANCELLED"),
+                        ],
+                        max_length=50,
+                    ),
+                ),
+                ("goal_sum", models.DecimalField(decimal_places=2, max_digits=12)),
+                ("current_sum", models.DecimalField(decimal_places=2, max_digits=12)),
+                ("deadline", models.DateField()),
+                ("cover_path", models.CharField(blank=True, max_length=255, null=True)),
+                ("search_vector", django.contrib.postgres.search.SearchVectorField(null=True)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="+",
+                        to="domain.projectcategory",
+                    ),
+                ),
+                (
+                    "country",
+                    models.ForeignKey(
+                        blank=True,
+                        db_index=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="+",
+                        to="domain.country",
+                    ),
+                ),
+                (
+                    "funding_model",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="+",
+                        to="domain.fundingmodel",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "project_cards",
+                "indexes": [
+                    models.Index(fields=["deadline", "id"], name="project_cards_deadline_id_idx"),
+                    models.Index(fields=["goal_sum", "id"], name="project_cards_goal_sum_id_idx"),
+                    models.Index(fields=["current_sum", "id"], name="project_cards_current_sum_idx"),
+                    models.Index(fields=["status", "-id"], name="project_cards_status_id_idx"),
+                    models.Index(fields=["stage", "-id"], name="project_cards_stage_id_idx"),
+                    models.Index(fields=["category", "status", "-id"], name="project_cards_category_idx"),
+                    models.Index(fields=["funding_model", "status", "-id"], name="project_cards_funding_idx"),
+                    django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="project_cards_search_idx"),
+                ],
+            },
+            bases=(models.Model, domain.ports.model.AbstractModel),
+        ),
+        migrations.RunSQL(FILL_PROJECT_CARDS, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.1 on 2026-10-18 21:05
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+def has_pg_trgm(schema_editor) -> bool:
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+class TrigramExtensionIfAvailable(TrigramExtension):
+    """Servers built without the contrib modules only lose the typo tolerant search."""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if has_pg_trgm(schema_editor):
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if has_pg_trgm(schema_editor):
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class AddTrigramIndex(migrations.AddIndex):
+    """Skipped with the extension, unapplying drops the index only if it was created."""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if has_pg_trgm(schema_editor):
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if has_pg_trgm(schema_editor):
+            schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(self.index.name)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0023_project_cards"),
+    ]
+
+    operations = [
+        TrigramExtensionIfAvailable(),
+        AddTrigramIndex(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"], name="projects_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddTrigramIndex(
+            model_name="projectcard",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"], name="project_cards_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
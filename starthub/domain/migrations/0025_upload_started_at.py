@@ -0,0 +1,31 @@
+# Generated by Django 5.2.1 on 2026-10-18 22:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def start_pending_plan_uploads(apps, schema_editor) -> None:
+    """Plans already pending are expired counting from the migration."""
+    Project = apps.get_model("domain", "Project")
+    Project.objects.filter(plan_upload_status="pending").update(plan_upload_started_at=django.utils.timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0024_project_name_trigram"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="plan_upload_started_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="projectimage",
+            name="upload_started_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(start_pending_plan_uploads, migrations.RunPython.noop),
+    ]
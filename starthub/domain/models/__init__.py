@@ -4,8 +4,10 @@ User = import_module("domain.models.user").User
 UserFavorite = import_module("domain.models.user_favorite").UserFavorite
 Role = import_module("domain.models.role").Role
 Permission = import_module("domain.models.permission").Permission
+RevokedToken = import_module("domain.models.revoked_token").RevokedToken
 
 Project = import_module("domain.models.project").Project
+ProjectCard = import_module("domain.models.project_card").ProjectCard
 Company = import_module("domain.models.company").Company
 TeamMember = import_module("domain.models.project").TeamMember
 ProjectPhone = import_module("domain.models.project").ProjectPhone
@@ -21,7 +23,9 @@ __all__ = [
     "UserFavorite",
     "Role",
     "Permission",
+    "RevokedToken",
     "Project",
+    "ProjectCard",
     "Company",
     "TeamMember",
     "ProjectPhone",
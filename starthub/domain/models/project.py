@@ -1,16 +1,28 @@
 from autoslug import AutoSlugField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.utils import timezone
 from domain.constants import (
     CHAR_FIELD_MAX_LENGTH,
     CHAR_FIELD_MEDIUM_LENGTH,
     CHAR_FIELD_SHORT_LENGTH,
     FUNDING_GOAL_MAX_DIGITS,
+    SEARCH_CONFIG,
 )
+from domain.enums.image_variant import ImageVariantEnum
 from domain.enums.project_stage import ProjectStageEnum
 from domain.enums.project_status import ProjectStatusEnum
+from domain.enums.upload_status import UploadStatusEnum
 from domain.models.base import BaseModel
 
 
+class ProjectManager(models.Manager["Project"]):
+    def get_queryset(self) -> models.QuerySet["Project"]:
+        # Only searches read the search vector, the database uses it without loading it.
+        return super().get_queryset().defer("search_vector")
+
+
 class Project(BaseModel):
 
     name = models.CharField(max_length=CHAR_FIELD_MAX_LENGTH)
@@ -29,13 +41,46 @@ class Project(BaseModel):
     current_sum = models.DecimalField(max_digits=FUNDING_GOAL_MAX_DIGITS, decimal_places=2, default=0)
     deadline = models.DateField()
     plan = models.CharField(max_length=CHAR_FIELD_MAX_LENGTH, blank=True, null=True)
+    plan_upload_status = models.CharField(
+        max_length=16, choices=[(i.value, i.name) for i in UploadStatusEnum], default=UploadStatusEnum.UPLOADED
+    )
+    # Set when the plan upload is enqueued, uploads lost with their worker stay pending after it.
+    plan_upload_started_at = models.DateTimeField(null=True, blank=True)
     is_active = models.BooleanField(default=True)
+    # Kept up to date by the database, names weigh more than descriptions when results are ranked.
+    search_vector = models.GeneratedField(
+        expression=SearchVector("name", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="B", config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = ProjectManager()
+
+    # Populated only by the listing queries of the project read repository.
+    first_images: list["ProjectImage"]
+    # Populated only by searches sorted by relevance.
+    relevance: float
 
     def __str__(self) -> str:
         return self.name
 
     class Meta:
         db_table = "projects"
+        indexes = [
+            # Keyset pages of every sort, the id breaks ties. Descending sorts scan them backwards.
+            models.Index(fields=["deadline", "id"], name="projects_deadline_id_idx"),
+            models.Index(fields=["goal_sum", "id"], name="projects_goal_sum_id_idx"),
+            models.Index(fields=["current_sum", "id"], name="projects_current_sum_id_idx"),
+            # Filtered listings of the newest projects, equality columns first so pages come ordered by the index.
+            models.Index(fields=["status", "-id"], name="projects_status_id_idx"),
+            models.Index(fields=["stage", "-id"], name="projects_stage_id_idx"),
+            models.Index(fields=["category", "status", "-id"], name="projects_category_status_idx"),
+            models.Index(fields=["funding_model", "status", "-id"], name="projects_funding_status_idx"),
+            GinIndex(fields=["search_vector"], name="projects_search_vector_idx"),
+            # Searches with a typo fall back to the similarity of the name, it needs pg_trgm.
+            GinIndex(fields=["name"], opclasses=["gin_trgm_ops"], name="projects_name_trgm_idx"),
+        ]
 
     @classmethod
     def get_permission_key(cls) -> str:
@@ -96,6 +141,13 @@ class ProjectImage(BaseModel):
     project = models.ForeignKey("domain.Project", on_delete=models.CASCADE, related_name="images")
     file_path = models.CharField(max_length=CHAR_FIELD_MAX_LENGTH)
     order = models.SmallIntegerField()
+    upload_status = models.CharField(
+        max_length=16, choices=[(i.value, i.name) for i in UploadStatusEnum], default=UploadStatusEnum.UPLOADED
+    )
+    upload_started_at = models.DateTimeField(default=timezone.now)
+    # Resized variants of the image, `file_path` holds the full one.
+    thumbnail_path = models.CharField(max_length=CHAR_FIELD_MAX_LENGTH, null=True, blank=True)
+    card_path = models.CharField(max_length=CHAR_FIELD_MAX_LENGTH, null=True, blank=True)
 
     class Meta:
         db_table = "project_images"
@@ -103,6 +155,19 @@ class ProjectImage(BaseModel):
     def __str__(self) -> str:
         return self.file_path
 
+    def get_path(self, variant: ImageVariantEnum) -> str:
+        """Images uploaded before variants were generated fall back to the original file."""
+        variant_paths: dict[ImageVariantEnum, str | None] = {
+            ImageVariantEnum.THUMBNAIL: self.thumbnail_path,
+            ImageVariantEnum.CARD: self.card_path,
+        }
+        return variant_paths.get(variant) or self.file_path
+
+    @property
+    def paths(self) -> list[str]:
+        """Every stored file of the image."""
+        return [i for i in (self.file_path, self.card_path, self.thumbnail_path) if i]
+
     @classmethod
     def get_permission_key(cls) -> str:
         return "project_image"
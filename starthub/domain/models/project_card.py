@@ -0,0 +1,86 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+from domain.constants import (
+    CHAR_FIELD_MAX_LENGTH,
+    CHAR_FIELD_SHORT_LENGTH,
+    FUNDING_GOAL_MAX_DIGITS,
+    PROJECT_CARD_SUMMARY_LENGTH,
+)
+from domain.enums.project_stage import ProjectStageEnum
+from domain.enums.project_status import ProjectStatusEnum
+from domain.models.base import BaseModel
+from domain.models.country import Country
+from domain.models.funding_model import FundingModel
+from domain.models.project_category import ProjectCategory
+
+
+class ProjectCardManager(models.Manager["ProjectCard"]):
+    def get_queryset(self) -> models.QuerySet["ProjectCard"]:
+        # Only searches read the search vector, the database uses it without loading it.
+        return super().get_queryset().defer("search_vector")
+
+
+class ProjectCard(BaseModel):
+    """
+    The listing fields of a project in a single row, with the path of its cover image.
+    Written from the project, its company and its images whenever they change, never by the listing itself.
+    """
+
+    # The id of the project.
+    id = models.BigIntegerField(primary_key=True)
+    name = models.CharField(max_length=CHAR_FIELD_MAX_LENGTH)
+    slug = models.CharField(max_length=CHAR_FIELD_MAX_LENGTH)
+    # The beginning of the description.
+    summary = models.CharField(max_length=PROJECT_CARD_SUMMARY_LENGTH)
+    # Only the composite indexes below lead with the foreign keys.
+    category = models.ForeignKey("domain.ProjectCategory", on_delete=models.PROTECT, db_index=False, related_name="+")
+    funding_model = models.ForeignKey("domain.FundingModel", on_delete=models.PROTECT, db_index=False, related_name="+")
+    creator_id = models.BigIntegerField()
+    # Empty until the company of the project is created.
+    company_name = models.CharField(max_length=CHAR_FIELD_MAX_LENGTH, null=True, blank=True)
+    country = models.ForeignKey(
+        "domain.Country", on_delete=models.PROTECT, null=True, blank=True, db_index=False, related_name="+"
+    )
+    stage = models.CharField(max_length=16, choices=[(i.value, i.name) for i in ProjectStageEnum])
+    status = models.CharField(
+        max_length=CHAR_FIELD_SHORT_LENGTH, choices=[(i.value, i.name) for i in ProjectStatusEnum]
+    )
+    goal_sum = models.DecimalField(max_digits=FUNDING_GOAL_MAX_DIGITS, decimal_places=2)
+    current_sum = models.DecimalField(max_digits=FUNDING_GOAL_MAX_DIGITS, decimal_places=2)
+    deadline = models.DateField()
+    # The card variant of the first uploaded image, empty when the project has none.
+    cover_path = models.CharField(max_length=CHAR_FIELD_MAX_LENGTH, null=True, blank=True)
+    # Copied from the project.
+    search_vector = SearchVectorField(null=True)
+
+    objects = ProjectCardManager()
+
+    # Set from the reference data cache by the card read repository.
+    category: ProjectCategory
+    funding_model: FundingModel
+    country: Country | None
+    # Populated only by searches sorted by relevance.
+    relevance: float
+
+    def __str__(self) -> str:
+        return self.name
+
+    class Meta:
+        db_table = "project_cards"
+        # The indexes of the project listing, see the projects table.
+        indexes = [
+            models.Index(fields=["deadline", "id"], name="project_cards_deadline_id_idx"),
+            models.Index(fields=["goal_sum", "id"], name="project_cards_goal_sum_id_idx"),
+            models.Index(fields=["current_sum", "id"], name="project_cards_current_sum_idx"),
+            models.Index(fields=["status", "-id"], name="project_cards_status_id_idx"),
+            models.Index(fields=["stage", "-id"], name="project_cards_stage_id_idx"),
+            models.Index(fields=["category", "status", "-id"], name="project_cards_category_idx"),
+            models.Index(fields=["funding_model", "status", "-id"], name="project_cards_funding_idx"),
+            GinIndex(fields=["search_vector"], name="project_cards_search_idx"),
+            GinIndex(fields=["name"], opclasses=["gin_trgm_ops"], name="project_cards_name_trgm_idx"),
+        ]
+
+    @classmethod
+    def get_permission_key(cls) -> str:
+        return "project_card"
@@ -0,0 +1,22 @@
+from django.db import models
+from domain.models.base import BaseModel
+
+
+class RevokedToken(BaseModel):
+    """A revoked refresh token, or every refresh token of a user when `jti` is empty."""
+
+    jti = models.CharField(max_length=32, unique=True, null=True, blank=True)
+    user_id = models.PositiveIntegerField(db_index=True)
+    revoked_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # A row is needed until the tokens it revokes expire, then it is pruned.
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = "revoked_tokens"
+
+    def __str__(self) -> str:
+        return f"(user_id={self.user_id}, jti={self.jti})"
+
+    @classmethod
+    def get_permission_key(cls) -> str:
+        return "revoked_token"
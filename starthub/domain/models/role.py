@@ -1,4 +1,7 @@
-from django.db import models
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import models, transaction
 from domain.constants import CHAR_FIELD_SHORT_LENGTH
 from domain.enums.role import RoleEnum
 from domain.models.base import BaseModel
@@ -22,3 +25,48 @@ class Role(BaseModel):
 def get_default_role() -> Role:
     role, _ = Role.objects.get_or_create(name=RoleEnum.get_default())
     return role
+
+
+_default_role_version_key = "roles:default:version"
+# The id with the version of the shared cache it was read at.
+_default_role_id: tuple[str, int] | None = None
+
+
+def _get_default_role_version() -> str:
+    version: str | None = cache.get(_default_role_version_key)
+    if version is None:
+        # Another process may create the version at the same time, the first one wins.
+        cache.add(_default_role_version_key, uuid4().hex, timeout=None)
+        version = cache.get(_default_role_version_key)
+    return version
+
+
+def get_default_role_id() -> int:
+    """
+    The id is kept by the process, so signups do not look the role up. It is kept while the version in the shared
+    cache stays the same, every process drops it once `forget_default_role_id` replaces the version.
+    A role created by an open transaction is kept only once it is committed.
+    """
+    # The version is read before loading, an id loaded while the role is deleted is kept as stale.
+    version: str = _get_default_role_version()
+    if _default_role_id is not None and _default_role_id[0] == version:
+        return _default_role_id[1]
+
+    role, created = Role.objects.get_or_create(name=RoleEnum.get_default())
+
+    def remember() -> None:
+        global _default_role_id
+        _default_role_id = (version, role.id)
+
+    if created:
+        transaction.on_commit(remember)
+    else:
+        remember()
+    return role.id
+
+
+def forget_default_role_id() -> None:
+    """Called when a role is deleted or the tables are flushed, the default role may be gone for every process."""
+    global _default_role_id
+    _default_role_id = None
+    cache.set(_default_role_version_key, uuid4().hex, timeout=None)
@@ -2,7 +2,7 @@ from typing import Any
 
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.core.validators import EmailValidator, MaxLengthValidator, MinLengthValidator, RegexValidator
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from domain.constants import (
     CHAR_FIELD_MAX_LENGTH,
@@ -14,7 +14,7 @@ from domain.constants import (
     PASSWORD_PATTERN,
 )
 from domain.models.base import BaseModel
-from domain.models.role import get_default_role
+from domain.models.role import get_default_role_id
 
 
 class UserManager(BaseUserManager["User"]):
@@ -25,6 +25,39 @@ class UserManager(BaseUserManager["User"]):
         last_name: str | None = None,
         password: str | None = None,
         **extra_fields: dict[str, Any],
+    ) -> "User":
+        """
+        Inserts the user and links the default role in one transaction, with two statements.
+
+        :raises ValueError:
+        :raises IntegrityError: If the email is already taken.
+        """
+        user: User = self.build_user(
+            email=email, first_name=first_name, last_name=last_name, password=password, **extra_fields
+        )
+        with transaction.atomic(using=self._db):
+            user.save(using=self._db)
+            self._assign_default_role([user])
+        return user
+
+    def bulk_create_users(self, users: list["User"], batch_size: int | None = None) -> list["User"]:
+        """
+        Inserts users built by `build_user` and links the default role, two statements per batch.
+
+        :raises IntegrityError: If an email is already taken.
+        """
+        with transaction.atomic(using=self._db):
+            created_users: list[User] = self.bulk_create(users, batch_size=batch_size)
+            self._assign_default_role(created_users, batch_size=batch_size)
+        return created_users
+
+    def build_user(
+        self,
+        email: str | None,
+        first_name: str | None = None,
+        last_name: str | None = None,
+        password: str | None = None,
+        **extra_fields: Any,
     ) -> "User":
         """:raises ValueError:"""
         if not email:
@@ -43,13 +76,15 @@ class UserManager(BaseUserManager["User"]):
                 **extra_fields,
             )
         user.set_password(password)
-        user.save(using=self._db)
-        self._assign_default_role(user)
         return user
 
-    def _assign_default_role(self, user: "User") -> None:
-        default_role = get_default_role()
-        user.roles.add(default_role)
+    def _assign_default_role(self, users: list["User"], batch_size: int | None = None) -> None:
+        """The links are inserted directly, new users have no permissions cached to invalidate."""
+        role_id: int = get_default_role_id()
+        through = self.model.roles.through
+        through.objects.using(self._db).bulk_create(
+            [through(user_id=user.pk, role_id=role_id) for user in users], batch_size=batch_size
+        )
 
     def create_superuser(
         self,
@@ -90,7 +125,7 @@ class User(AbstractBaseUser, BaseModel, PermissionsMixin):
         ],
     )
     description = models.CharField(max_length=DESCRIPTION_MAX_LENGTH, default="", blank=True)
-    roles = models.ManyToManyField("domain.Role", default=get_default_role, related_name="users")
+    roles = models.ManyToManyField("domain.Role", related_name="users")
 
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
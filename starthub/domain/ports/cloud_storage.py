@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 
 from domain.value_objects.cloud_storage import (
     CloudStorageCreateUrlPayload,
+    CloudStorageCreateUrlsPayload,
     CloudStorageDeletePayload,
     CloudStorageUploadPayload,
 )
@@ -22,3 +23,8 @@ class AbstractCloudStorage(ABC):
     def create_url(self, payload: CloudStorageCreateUrlPayload) -> str:
         """:return: A url that can be used to access the file."""
         pass
+
+    @abstractmethod
+    def create_urls(self, payload: CloudStorageCreateUrlsPayload) -> dict[str, str]:
+        """:return: A mapping of every distinct file path to a url that can be used to access the file."""
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from domain.enums.image_variant import ImageVariantEnum
+from domain.utils.file_stream import FileStream
+
+
+class AbstractImageProcessor(ABC):
+    @abstractmethod
+    def create_variants(
+        self, images: list[FileStream], variants: tuple[ImageVariantEnum, ...]
+    ) -> list[dict[ImageVariantEnum, bytes]]:
+        """:return: The jpeg variants of every image, in the order of the images."""
+        pass
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from domain.value_objects.common import Id
+
+
+class AbstractPermissionCache(ABC):
+    @abstractmethod
+    def get_or_set(self, user_id: Id, load: Callable[[], frozenset[str]]) -> frozenset[str]:
+        """:return: The permission names of the user, `load` is called only if they are not cached."""
+        pass
+
+    @abstractmethod
+    def invalidate_user(self, user_id: Id) -> None:
+        """Drops the permissions of the user, e.g. after their roles changed."""
+        pass
+
+    @abstractmethod
+    def invalidate_all(self) -> None:
+        """Drops the permissions of every user, e.g. after the permissions of a role changed."""
+        pass
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+
+from domain.value_objects.common import Id
+from domain.value_objects.token import RefreshPayload
+
+
+class AbstractRevocationIndex(ABC):
+    @abstractmethod
+    def is_revoked(self, payload: RefreshPayload) -> bool:
+        """:return: Whether the token or every token of its owner was revoked."""
+        pass
+
+    @abstractmethod
+    def revoke(self, payload: RefreshPayload) -> bool:
+        """:return: False if the token was already revoked, e.g. a rotated token used a second time."""
+        pass
+
+    @abstractmethod
+    def revoke_user(self, user_id: Id) -> None:
+        """Revokes every token of the user, e.g. after they were deleted."""
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from domain.value_objects.token import AccessPayload, AccessTokenVo
+
+
+class AbstractAccessTokenVerifier(ABC):
+    @abstractmethod
+    def verify(self, token: AccessTokenVo) -> AccessPayload:
+        """
+        :raises TokenExpiredException:
+        :raises InvalidTokenException: If token verification fails.
+        """
+        pass
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from domain.utils.file_stream import FileStream
+from domain.value_objects.cloud_storage import CloudStorageUploadPayload
+
+
+class AbstractUploadQueue(ABC):
+    @abstractmethod
+    def enqueue(
+        self,
+        payload: CloudStorageUploadPayload,
+        on_success: Callable[[], None],
+        on_failure: Callable[[], None],
+    ) -> None:
+        """
+        Uploads the file once the current database transaction is committed.
+        Exactly one of the callbacks is called after the upload has finished or all attempts have failed.
+        The file is read before the method returns, so the caller may close it afterwards.
+        """
+        pass
+
+    @abstractmethod
+    def enqueue_many(
+        self,
+        payloads: list[CloudStorageUploadPayload],
+        on_success: Callable[[], None],
+        on_failure: Callable[[], None],
+    ) -> None:
+        """
+        Uploads the files in parallel once the current database transaction is committed.
+        If any of them can not be uploaded, the already uploaded ones are deleted and on_failure is called.
+        """
+        pass
+
+    @abstractmethod
+    def enqueue_processing(
+        self,
+        files: list[FileStream],
+        prepare: Callable[[list[FileStream]], list[CloudStorageUploadPayload]],
+        on_success: Callable[[], None],
+        on_failure: Callable[[], None],
+    ) -> None:
+        """
+        Once the current database transaction is committed, creates the uploads from the files with prepare
+        in the background and uploads them as one batch of enqueue_many. on_failure is also called if prepare fails.
+        """
+        pass
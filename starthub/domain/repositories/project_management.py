@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 
+from domain.enums.upload_status import UploadStatusEnum
 from domain.models.funding_model import FundingModel
 from domain.models.project import Project, ProjectImage, ProjectPhone, ProjectSocialLink, TeamMember
+from domain.models.project_card import ProjectCard
 from domain.models.project_category import ProjectCategory
 from domain.ports.repository import AbstractReadRepository, AbstractWriteRepository
 from domain.value_objects.common import Id, Pagination, Slug
@@ -21,6 +24,7 @@ from domain.value_objects.project_management import (
     ProjectImageCreatePayload,
     ProjectImageDeletePayload,
     ProjectImageUpdatePayload,
+    ProjectPagination,
     ProjectPhoneCreatePayload,
     ProjectPhoneUpdatePayload,
     ProjectSocialLinkCreatePayload,
@@ -150,7 +154,23 @@ class ProjectReadRepository(AbstractReadRepository[Project, ProjectFilter], ABC)
         pass
 
     @abstractmethod
-    def get_all(self, filter_: ProjectFilter, pagination: Pagination | None = None) -> list[Project]:
+    def get_all(
+        self, filter_: ProjectFilter, pagination: Pagination | None = None, listing: bool = False
+    ) -> list[Project]:
+        """listing=True loads everything project_to_dto needs and sets `first_images` on each project."""
+        pass
+
+    @abstractmethod
+    def get_page(self, filter_: ProjectFilter, pagination: ProjectPagination) -> list[Project]:
+        """
+        Loads the projects after the cursor like get_all with listing=True.
+        The cost of a page does not depend on how deep it is.
+        """
+        pass
+
+    @abstractmethod
+    def estimate_count(self, filter_: ProjectFilter) -> int:
+        """:return: The amount of the projects, it may be approximate or a few seconds old."""
         pass
 
     @abstractmethod
@@ -159,6 +179,38 @@ class ProjectReadRepository(AbstractReadRepository[Project, ProjectFilter], ABC)
         pass
 
 
+class ProjectCardReadRepository(ABC):
+    @abstractmethod
+    def get_page(
+        self, filter_: ProjectFilter, pagination: ProjectPagination, columns: frozenset[str] | None = None
+    ) -> list[ProjectCard]:
+        """
+        Loads the cards after the cursor with their category, funding model and country.
+        Filters and sorts like ProjectReadRepository.get_page.
+        :param columns: The only columns to load, the id and the sort key are always loaded. None loads every column.
+        """
+        pass
+
+
+class ProjectCardWriteRepository(ABC):
+    @abstractmethod
+    def refresh(self, project_ids: list[Id]) -> None:
+        """Writes the cards of the projects from their current rows, projects that do not exist are skipped."""
+        pass
+
+    @abstractmethod
+    def delete(self, project_id: Id) -> None:
+        pass
+
+    @abstractmethod
+    def rebuild(self, batch_size: int) -> int:
+        """
+        Replaces every card in one transaction, readers see the old cards until it commits.
+        :return: The amount of the cards.
+        """
+        pass
+
+
 class ProjectWriteRepository(AbstractWriteRepository[Project, ProjectCreatePayload, ProjectUpdatePayload], ABC):
     @abstractmethod
     def create(self, data: ProjectCreatePayload) -> Project:
@@ -169,6 +221,15 @@ class ProjectWriteRepository(AbstractWriteRepository[Project, ProjectCreatePaylo
         """:raises ProjectNotFoundException:"""
         pass
 
+    @abstractmethod
+    def update_plan_upload_status(self, project_id: Id, upload_status: UploadStatusEnum) -> None:
+        pass
+
+    @abstractmethod
+    def expire_pending_plan_uploads(self, started_before: datetime) -> int:
+        """:return: The amount of plans marked as failed."""
+        pass
+
     @abstractmethod
     def delete_by_id(self, id_: Id) -> None:
         """:raises ProjectNotFoundException:"""
@@ -213,6 +274,18 @@ class ProjectImageWriteRepository(
     def update(self, data: ProjectImageUpdatePayload) -> ProjectImage:
         pass
 
+    @abstractmethod
+    def create_many(self, data: list[ProjectImageCreatePayload]) -> list[ProjectImage]:
+        pass
+
+    @abstractmethod
+    def update_upload_status(self, image_ids: list[Id], upload_status: UploadStatusEnum) -> None:
+        pass
+
+    @abstractmethod
+    def delete_many(self, image_ids: list[Id]) -> None:
+        pass
+
     @abstractmethod
     def delete_by_id(self, id_: Id) -> None:
         pass
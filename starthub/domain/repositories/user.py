@@ -32,6 +32,7 @@ class UserReadRepository(AbstractReadRepository[User, UserFilter]):
 class UserWriteRepository(AbstractWriteRepository[User, UserCreatePayload, UserUpdatePayload], ABC):
     @abstractmethod
     def create(self, data: UserCreatePayload) -> User:
+        """:raises EmailAlreadyExistsException:"""
         pass
 
     @abstractmethod
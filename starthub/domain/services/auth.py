@@ -1,5 +1,7 @@
+import hashlib
 from dataclasses import asdict
 from datetime import UTC, datetime
+from uuid import uuid4
 
 import jwt
 from domain.constants import (
@@ -7,16 +9,18 @@ from domain.constants import (
     ACCESS_TOKEN_LIFETIME,
     JWT_ALGORITHM,
     REFRESH_DECODE_OPTIONS,
+    REFRESH_IDENTITY_CLAIMS,
     REFRESH_TOKEN_LIFETIME,
+    REFRESH_TOKEN_ROTATION_AGE,
 )
 from domain.exceptions.auth import InvalidCredentialsException, InvalidTokenException, TokenExpiredException
 from domain.exceptions.user import EmailAlreadyExistsException, UserNotFoundException
 from domain.models.user import User
+from domain.ports.revocation_index import AbstractRevocationIndex
 from domain.ports.service import AbstractDomainService
 from domain.repositories.user import UserReadRepository, UserWriteRepository
 from domain.value_objects.auth import LoginCredentials
 from domain.value_objects.common import Id
-from domain.value_objects.filter import UserFilter
 from domain.value_objects.token import AccessPayload, AccessTokenVo, RefreshPayload, RefreshTokenVo, TokenPairVo
 from domain.value_objects.user import Email, UserCreatePayload
 from loguru import logger
@@ -47,7 +51,7 @@ class TokenService(AbstractDomainService):
         issued_at = int(datetime.now(UTC).timestamp())
         expires_at = issued_at + self.refresh_token_lifetime
 
-        payload = RefreshPayload(sub=str(user.id), iat=issued_at, exp=expires_at)
+        payload = RefreshPayload(sub=str(user.id), email=user.email, jti=uuid4().hex, iat=issued_at, exp=expires_at)
         token: str = jwt.encode(asdict(payload), key=self.__secret_key, algorithm=JWT_ALGORITHM)
         return RefreshTokenVo(value=token)
 
@@ -90,9 +94,19 @@ class TokenService(AbstractDomainService):
             algorithms=[JWT_ALGORITHM],
             options=REFRESH_DECODE_OPTIONS,
         )
+        if any(claim in payload for claim in REFRESH_IDENTITY_CLAIMS):
+            for claim in REFRESH_IDENTITY_CLAIMS:
+                if claim not in payload:
+                    raise jwt.MissingRequiredClaimError(claim)
+            email, jti = payload["email"], payload["jti"]
+        else:
+            # Issued before the claims were added, the token itself identifies it to the revocation index.
+            email, jti = None, hashlib.blake2b(token.value.encode(), digest_size=16).hexdigest()
 
         return RefreshPayload(
             sub=payload["sub"],
+            email=email,
+            jti=jti,
             iat=payload["iat"],
             exp=payload["exp"],
             type=payload["type"],
@@ -107,8 +121,9 @@ class TokenService(AbstractDomainService):
         """
         try:
             return self._verify_access(token=token)
-        except jwt.ExpiredSignatureError as e:
-            logger.exception(e)
+        except jwt.ExpiredSignatureError:
+            # Expected once the token outlives its lifetime, every request of an idle browser presents one.
+            logger.debug("Access token has expired.")
             raise TokenExpiredException("Access token has expired.")
         except (jwt.PyJWTError, ValueError):
             raise InvalidTokenException("Invalid access token.")
@@ -121,8 +136,9 @@ class TokenService(AbstractDomainService):
         """
         try:
             return self._verify_refresh(token=token)
-        except jwt.ExpiredSignatureError as e:
-            logger.exception(e)
+        except jwt.ExpiredSignatureError:
+            # Expected for sessions left idle for longer than the token lifetime.
+            logger.debug("Refresh token has expired.")
             raise TokenExpiredException("Refresh token has expired.")
         except (jwt.PyJWTError, ValueError):
             raise InvalidTokenException("Invalid refresh token.")
@@ -134,21 +150,26 @@ class AuthService(AbstractDomainService):
         token_service: TokenService,
         user_read_repository: UserReadRepository,
         user_write_repository: UserWriteRepository,
+        revocation_index: AbstractRevocationIndex,
+        refresh_token_rotation_age: int = REFRESH_TOKEN_ROTATION_AGE,
     ):
+        """:param refresh_token_rotation_age: Seconds after which a used refresh token is replaced by a new one."""
         self._token_service = token_service
         self._user_read_repository = user_read_repository
         self._user_write_repository = user_write_repository
+        self._revocation_index = revocation_index
+        self._refresh_token_rotation_age = refresh_token_rotation_age
 
-    def check_user_existence(self, email: Email) -> None:
+    def get_user_by_email(self, email: Email) -> User:
         """:raises UserNotFoundException:"""
+        return self._user_read_repository.get_by_email(email=email)
 
-        self._user_read_repository.get_by_email(email=email)
-
-    def login(self, credentials: LoginCredentials) -> TokenPairVo:
+    def login(self, credentials: LoginCredentials, user: User | None = None) -> TokenPairVo:
         """
+        :param user: The owner of the credentials if the caller has already fetched them, saves a lookup.
         :raises InvalidCredentialsException:
         """
-        user: User = self._authenticate_user(credentials=credentials)
+        user = self._authenticate_user(credentials=credentials, user=user)
         logger.info(f"User '{credentials.email}' is successfully authenticated.")
         self._user_write_repository.update_last_login(user)
         logger.debug("last_login updated")
@@ -158,43 +179,91 @@ class AuthService(AbstractDomainService):
             refresh=self._token_service.generate_refresh(user=user),
         )
 
-    def reissue_access(self, refresh_token: RefreshTokenVo) -> AccessTokenVo:
+    def reissue(self, refresh_token: RefreshTokenVo) -> TokenPairVo:
         """
+        Issues a new access token, the refresh token is rotated once it is older than the rotation age.
+        The user is not looked up, deleted users have their tokens revoked. Legacy tokens are the exception,
+        they are rotated at once, so their owner is looked up only once.
+
         :raises TokenExpiredException:
-        :raises InvalidTokenException: If token verification fails
+        :raises InvalidTokenException: If token verification fails or the token is revoked.
         """
-        payload: RefreshPayload = self._token_service.verify_refresh(token=refresh_token)
-        try:
-            user: User = self._user_read_repository.get_by_id(Id(value=int(payload.sub)))
-        except UserNotFoundException:
-            logger.error(f"Failed to find a user with id: {payload.sub}.")
-            raise InvalidTokenException("Invalid access token.")
+        payload: RefreshPayload = self._verify_refresh(refresh_token)
+        owner: User = self._get_owner(payload)
+        if payload.is_legacy or int(datetime.now(UTC).timestamp()) - payload.iat >= self._refresh_token_rotation_age:
+            refresh_token = self._rotate_refresh(payload, owner)
+        return TokenPairVo(access=self._token_service.generate_access(user=owner), refresh=refresh_token)
 
-        return self._token_service.generate_access(user=user)
+    def reissue_access(self, refresh_token: RefreshTokenVo) -> AccessTokenVo:
+        """
+        :raises TokenExpiredException:
+        :raises InvalidTokenException: If token verification fails or the token is revoked.
+        """
+        payload: RefreshPayload = self._verify_refresh(refresh_token)
+        return self._token_service.generate_access(user=self._get_owner(payload))
 
     def reissue_refresh(self, refresh_token: RefreshTokenVo) -> RefreshTokenVo:
         """
+        Replaces the refresh token, the used one is revoked.
+
         :raises TokenExpiredException:
-        :raises InvalidTokenException: If token verification fails
+        :raises InvalidTokenException: If token verification fails or the token is revoked.
+        """
+        payload: RefreshPayload = self._verify_refresh(refresh_token)
+        return self._rotate_refresh(payload, self._get_owner(payload))
+
+    def logout(self, refresh_token: RefreshTokenVo) -> None:
+        """Revokes the refresh token, an invalid or expired one can not be used anyway."""
+        try:
+            payload: RefreshPayload = self._token_service.verify_refresh(token=refresh_token)
+        except (InvalidTokenException, TokenExpiredException):
+            return
+        self._revocation_index.revoke(payload)
+        logger.info(f"Refresh token of the user {payload.sub} is revoked.")
+
+    def _verify_refresh(self, refresh_token: RefreshTokenVo) -> RefreshPayload:
+        """
+        :raises TokenExpiredException:
+        :raises InvalidTokenException: If token verification fails or the token is revoked.
         """
         payload: RefreshPayload = self._token_service.verify_refresh(token=refresh_token)
+        if self._revocation_index.is_revoked(payload):
+            logger.error(f"Revoked refresh token of the user {payload.sub} is used.")
+            raise InvalidTokenException("Invalid refresh token.")
+        return payload
+
+    def _rotate_refresh(self, payload: RefreshPayload, owner: User) -> RefreshTokenVo:
+        """:raises InvalidTokenException: If the token was rotated or revoked at the same time."""
+        if not self._revocation_index.revoke(payload):
+            logger.error(f"Refresh token of the user {payload.sub} is used again after it was revoked.")
+            raise InvalidTokenException("Invalid refresh token.")
+        return self._token_service.generate_refresh(user=owner)
+
+    def _get_owner(self, payload: RefreshPayload) -> User:
+        """
+        The owner is built from the token, it carries everything the new tokens need.
+        Legacy tokens carry only the id, their owner is looked up.
+
+        :raises InvalidTokenException: If the owner of a legacy token is not found.
+        """
+        if not payload.is_legacy:
+            return User(id=int(payload.sub), email=payload.email)
         try:
-            user: User = self._user_read_repository.get_by_id(Id(value=int(payload.sub)))
+            return self._user_read_repository.get_by_id(Id(value=int(payload.sub)))
         except UserNotFoundException:
             logger.error(f"Failed to find a user with id: {payload.sub}.")
             raise InvalidTokenException("Invalid refresh token.")
 
-        return self._token_service.generate_refresh(user=user)
-
-    def _authenticate_user(self, credentials: LoginCredentials) -> User:
+    def _authenticate_user(self, credentials: LoginCredentials, user: User | None = None) -> User:
         """
         :raises InvalidCredentialsException:
         """
-        try:
-            user: User = self._user_read_repository.get_by_email(credentials.email)
-        except UserNotFoundException:
-            logger.error(f"Failed to find a user with email '{credentials.email}'.")
-            raise InvalidCredentialsException("Invalid email or password.")
+        if user is None or user.email != credentials.email.value:
+            try:
+                user = self._user_read_repository.get_by_email(credentials.email)
+            except UserNotFoundException:
+                logger.error(f"Failed to find a user with email '{credentials.email}'.")
+                raise InvalidCredentialsException("Invalid email or password.")
 
         if not user.check_password(credentials.password.value):
             logger.error(f"Incorrect password for the user {user.email}")
@@ -217,17 +286,11 @@ class RegistrationService(AbstractDomainService):
         :raises EmailAlreadyExistsException:
         """
         logger.warning(f"Starting to register a user '{data.email.value}'.")
-        self._check_email_already_exists(data.email)
-
-        user: User = self.write_repository.create(data)
+        try:
+            user: User = self.write_repository.create(data)
+        except EmailAlreadyExistsException:
+            logger.error(f"The email '{data.email.value}' already in use.")
+            raise
         logger.info(f"User {user.email} is registered successfully.")
 
         return user
-
-    def _check_email_already_exists(self, email: Email) -> None:
-        """:raises EmailAlreadyExistsException:"""
-        result: list[User] = self.read_repository.get_all(UserFilter(email=email))
-        if result:
-            logger.error(f"The email '{email.value}' already in use.")
-            raise EmailAlreadyExistsException(email.value)
-        logger.debug(f"The email '{email.value}' is free to use.")
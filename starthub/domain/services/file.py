@@ -3,16 +3,20 @@ from io import BytesIO
 from typing import BinaryIO
 
 import filetype
+from domain.constants import IMAGE_VARIANTS
+from domain.enums.image_variant import ImageVariantEnum
 from domain.exceptions.file import NotPdfFileException, NotSupportedImageFormatException
 from domain.ports.service import AbstractDomainService
+from domain.utils.file_stream import FileStream
 from loguru import logger
+from wand.color import Color
 from wand.image import Image
 
 
 class ImageService(AbstractDomainService):
     IMAGE_FORMATS = ("image/jpeg", "image/png", "image/gif", "image/webp", "image/avif")
 
-    def check_image_format(self, file_obj: BinaryIO) -> None:
+    def check_image_format(self, file_obj: BinaryIO | FileStream) -> None:
         """
         :raises  NotSupportedImageFormatException:
         """
@@ -29,7 +33,7 @@ class ImageService(AbstractDomainService):
                 f"Supported image formats: {', '.join(self.IMAGE_FORMATS)}"
             )
 
-    def convert_to_jpg(self, file_obj: BinaryIO) -> BytesIO:
+    def convert_to_jpg(self, file_obj: BinaryIO | FileStream) -> BytesIO:
         """
         :raises NotSupportedImageFormatException:
         """
@@ -41,6 +45,29 @@ class ImageService(AbstractDomainService):
                 converted.save(file=result)
         return result
 
+    def create_variants(
+        self, file_obj: BinaryIO | FileStream, variants: tuple[ImageVariantEnum, ...]
+    ) -> dict[ImageVariantEnum, bytes]:
+        """
+        Creates jpeg variants of the first frame, downscaled to the limits of IMAGE_VARIANTS.
+        The image is rotated by its orientation tag, then the metadata is stripped and transparency is flattened.
+        """
+        result: dict[ImageVariantEnum, bytes] = dict()
+        with Image(file=file_obj) as image, Image(image=image.sequence[0]) as frame:
+            frame.auto_orient()
+            frame.strip()
+            frame.background_color = Color("white")
+            frame.alpha_channel = "remove"
+            for variant in variants:
+                max_side, quality = IMAGE_VARIANTS[variant]
+                with frame.clone() as resized:
+                    ratio: float = max_side / max(resized.width, resized.height)
+                    if ratio < 1:
+                        resized.resize(max(1, round(resized.width * ratio)), max(1, round(resized.height * ratio)))
+                    resized.compression_quality = quality
+                    result[variant] = resized.make_blob("jpeg")
+        return result
+
 
 class PdfService(AbstractDomainService):
     def check_is_pdf(self, file_obj: BinaryIO) -> None:
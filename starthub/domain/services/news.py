@@ -1,10 +1,10 @@
-from io import BytesIO
-
+from domain.enums.image_variant import ImageVariantEnum
 from domain.models.news import News
 from domain.ports.cloud_storage import AbstractCloudStorage
+from domain.ports.image_processor import AbstractImageProcessor
 from domain.ports.service import AbstractDomainService
 from domain.repositories.news import NewsReadRepository, NewsWriteRepository
-from domain.services.file import ImageService
+from domain.utils.file_stream import FileStream
 from domain.utils.path_provider import PathProvider
 from domain.value_objects.cloud_storage import CloudStorageUploadPayload
 from domain.value_objects.common import Id, Pagination
@@ -25,12 +25,12 @@ class NewsService(AbstractDomainService):
         news_read_repository: NewsReadRepository,
         news_write_repository: NewsWriteRepository,
         cloud_storage: AbstractCloudStorage,
-        image_service: ImageService,
+        image_processor: AbstractImageProcessor,
     ):
         self._news_read_repository = news_read_repository
         self._news_write_repository = news_write_repository
         self._cloud_storage = cloud_storage
-        self._image_service = image_service
+        self._image_processor = image_processor
 
     def get_one(self, id_: Id) -> News:
         return self._news_read_repository.get_by_id(id_=id_)
@@ -55,14 +55,16 @@ class NewsService(AbstractDomainService):
         return news
 
     def upload_news_image(self, command: NewsImageUploadCommand) -> str:
-        convert_image_to_jpg: BytesIO = self._image_service.convert_to_jpg(BytesIO(command.image.value))
+        variants: dict[ImageVariantEnum, bytes] = self._image_processor.create_variants(
+            [command.image.value], (ImageVariantEnum.FULL,)
+        )[0]
         logger.info("The image converted to jpg successfully.")
 
         file_path: str = PathProvider.get_news_image_path()
         logger.debug(f"file_path: {file_path}")
 
         uploaded_path: str = self._cloud_storage.upload_file(
-            CloudStorageUploadPayload(file_data=convert_image_to_jpg.getvalue(), file_path=file_path)
+            CloudStorageUploadPayload(file=FileStream.from_bytes(variants[ImageVariantEnum.FULL]), file_path=file_path)
         )
         logger.debug(f"File uploaded into the {uploaded_path}.")
         return uploaded_path
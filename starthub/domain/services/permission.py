@@ -1,6 +1,7 @@
 from domain.enums.permission import ActionEnum, ScopeEnum
 from domain.models.base import BaseModel
 from domain.models.permission import Permission
+from domain.ports.permission_cache import AbstractPermissionCache
 from domain.ports.service import AbstractDomainService
 from domain.repositories.permission import PermissionReadRepository
 from domain.repositories.user import UserReadRepository
@@ -15,19 +16,41 @@ class PermissionService(AbstractDomainService):
         self,
         user_read_repository: UserReadRepository,
         permission_read_repository: PermissionReadRepository,
+        permission_cache: AbstractPermissionCache,
     ):
         self._user_read_repository = user_read_repository
         self._permission_read_repository = permission_read_repository
+        self._permission_cache = permission_cache
 
     def has_permission(self, user_id: Id, permission_vo: PermissionVo) -> bool:
+        """
+        :raises UserNotFoundException:
+        """
+        return permission_vo.value in self.get_permission_names(user_id)
+
+    def has_permissions(self, user_id: Id, permission_vos: list[PermissionVo]) -> dict[str, bool]:
+        """
+        :return: Whether the user has each of the permissions, keyed by the permission name.
+        :raises UserNotFoundException:
+        """
+        permission_names: frozenset[str] = self.get_permission_names(user_id)
+        return {vo.value: vo.value in permission_names for vo in permission_vos}
+
+    def get_permission_names(self, user_id: Id) -> frozenset[str]:
+        """
+        :raises UserNotFoundException:
+        """
+        return self._permission_cache.get_or_set(user_id, lambda: self._load_permission_names(user_id))
+
+    def _load_permission_names(self, user_id: Id) -> frozenset[str]:
         """
         :raises UserNotFoundException:
         """
         self._user_read_repository.get_by_id(id_=user_id)  # check
         permissions: list[Permission] = self._permission_read_repository.get_all(PermissionFilter(user_id=user_id))
-        permission_names = {p.name for p in permissions}
+        permission_names = frozenset(p.name for p in permissions)
         logger.debug(f"user_id: {user_id.value}, permissions: {permission_names}")
-        return permission_vo.value in permission_names
+        return permission_names
 
     @classmethod
     def create_permission_vo(
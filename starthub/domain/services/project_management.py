@@ -1,19 +1,32 @@
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+
 from domain.constants import PROJECT_IMAGES_MAX_AMOUNT
+from domain.enums.image_variant import ImageVariantEnum
+from domain.enums.project_sort import ProjectSortEnum
 from domain.enums.project_status import ProjectStatusEnum
+from domain.enums.upload_status import UploadStatusEnum
 from domain.exceptions import BusinessRuleException
 from domain.exceptions.cloud_storage import FileNotFoundCloudStorageException
 from domain.exceptions.permissions import DeleteDeniedPermissionException, UpdateDeniedPermissionException
 from domain.exceptions.project_management import (
     ProjectImageMaxAmountException,
     ProjectPhoneAlreadyExistsException,
+    ProjectPlanNotFoundException,
+    ProjectPlanNotReadyException,
     ProjectSocialLinkAlreadyExistsException,
 )
 from domain.models.project import Project, ProjectImage, ProjectPhone, ProjectSocialLink, TeamMember
+from domain.models.project_card import ProjectCard
 from domain.ports.cloud_storage import AbstractCloudStorage
+from domain.ports.image_processor import AbstractImageProcessor
 from domain.ports.service import AbstractDomainService
+from domain.ports.upload_queue import AbstractUploadQueue
 from domain.repositories.company import CompanyReadRepository, CompanyWriteRepository
 from domain.repositories.project_management import (
     FundingModelReadRepository,
+    ProjectCardReadRepository,
     ProjectCategoryReadRepository,
     ProjectImageReadRepository,
     ProjectImageWriteRepository,
@@ -28,23 +41,29 @@ from domain.repositories.project_management import (
 )
 from domain.repositories.user import UserReadRepository
 from domain.services.file import PdfService
+from domain.utils.file_stream import FileStream
 from domain.utils.path_provider import PathProvider
 from domain.value_objects.cloud_storage import (
     CloudStorageCreateUrlPayload,
+    CloudStorageCreateUrlsPayload,
     CloudStorageDeletePayload,
     CloudStorageUploadPayload,
 )
-from domain.value_objects.common import Id, Order, Pagination
+from domain.value_objects.common import Id, Order
+from domain.value_objects.file import PdfFile
 from domain.value_objects.filter import ProjectFilter, ProjectImageFilter, ProjectPhoneFilter, ProjectSocialLinkFilter
 from domain.value_objects.project_management import (
     ProjectCreateCommand,
     ProjectCreatePayload,
+    ProjectCursor,
     ProjectImageCreateCommand,
     ProjectImageCreatePayload,
     ProjectImageDeleteCommand,
     ProjectImageDeletePayload,
+    ProjectImagesCreateCommand,
     ProjectImageUpdateCommand,
     ProjectImageUpdatePayload,
+    ProjectPagination,
     ProjectPhoneCreatePayload,
     ProjectSocialLinkCreatePayload,
     ProjectStatus,
@@ -117,35 +136,78 @@ class ProjectService(AbstractDomainService):
         self,
         project_read_repository: ProjectReadRepository,
         project_write_repository: ProjectWriteRepository,
+        project_card_read_repository: ProjectCardReadRepository,
         project_category_read_repository: ProjectCategoryReadRepository,
         user_read_repository: UserReadRepository,
         funding_model_read_repository: FundingModelReadRepository,
         company_read_repository: CompanyReadRepository,
         company_write_repository: CompanyWriteRepository,
         cloud_storage: AbstractCloudStorage,
+        upload_queue: AbstractUploadQueue,
         pdf_service: PdfService,
     ):
         # TODO: cloud service and pdf_service violates domain & application logic. It is need to move these services to application layer
         self._project_read_repository = project_read_repository
         self._project_write_repository = project_write_repository
+        self._project_card_read_repository = project_card_read_repository
         self._project_category_read_repository = project_category_read_repository
         self._user_read_repository = user_read_repository
         self._funding_model_read_repository = funding_model_read_repository
         self._company_read_repository = company_read_repository
         self._company_write_repository = company_write_repository
         self._cloud_storage = cloud_storage
+        self._upload_queue = upload_queue
         self._pdf_service = pdf_service
 
     def get_by_id(self, id_: Id) -> Project:
         """:raises ProjectNotFoundException:"""
         return self._project_read_repository.get_by_id(id_=id_)
 
-    def get(self, filter_: ProjectFilter, pagination: Pagination) -> list[Project]:
-        return self._project_read_repository.get_all(filter_=filter_, pagination=pagination)
+    def get(self, filter_: ProjectFilter, pagination: ProjectPagination) -> tuple[list[Project], ProjectCursor | None]:
+        """:return: A page of projects and the cursor of the next one, None if the page is the last."""
+        projects: list[Project] = self._project_read_repository.get_page(filter_=filter_, pagination=pagination)
+        return projects, self._get_next_cursor(projects, pagination)
+
+    def get_cards(
+        self, filter_: ProjectFilter, pagination: ProjectPagination, columns: frozenset[str] | None = None
+    ) -> tuple[list[ProjectCard], ProjectCursor | None]:
+        """
+        :param columns: The only columns of the cards to load, None loads every column.
+        :return: A page of project cards and the cursor of the next one, None if the page is the last.
+        """
+        cards: list[ProjectCard] = self._project_card_read_repository.get_page(
+            filter_=filter_, pagination=pagination, columns=columns
+        )
+        return cards, self._get_next_cursor(cards, pagination)
+
+    @staticmethod
+    def _get_next_cursor(
+        page: list[Project] | list[ProjectCard], pagination: ProjectPagination
+    ) -> ProjectCursor | None:
+        if len(page) < pagination.limit or not page:
+            return None
+
+        last: Project | ProjectCard = page[-1]
+        key: date | Decimal | float | None = (
+            None if pagination.sort == ProjectSortEnum.NEWEST else getattr(last, pagination.sort)
+        )
+        return ProjectCursor(sort=pagination.sort, key=key, last_id=last.id)
+
+    def estimate_count(self, filter_: ProjectFilter) -> int:
+        return self._project_read_repository.estimate_count(filter_=filter_)
 
     def get_plan_url(self, project_id: Id) -> str:
-        plan_path = PathProvider.get_project_plan_path(project_id)
-        return self._cloud_storage.create_url(payload=CloudStorageCreateUrlPayload(file_path=plan_path))
+        """
+        :raises ProjectNotFoundException:
+        :raises ProjectPlanNotReadyException: The plan is still being uploaded.
+        :raises ProjectPlanNotFoundException: The project has no plan or its upload failed.
+        """
+        project: Project = self._project_read_repository.get_by_id(project_id)
+        if project.plan_upload_status == UploadStatusEnum.PENDING:
+            raise ProjectPlanNotReadyException(f"The plan of the project with id = {project_id.value} is uploading.")
+        if not project.plan or project.plan_upload_status != UploadStatusEnum.UPLOADED:
+            raise ProjectPlanNotFoundException(f"The project with id = {project_id.value} has no plan.")
+        return self._cloud_storage.create_url(payload=CloudStorageCreateUrlPayload(file_path=project.plan))
 
     def create(self, command: ProjectCreateCommand) -> Project:
         """
@@ -177,19 +239,33 @@ class ProjectService(AbstractDomainService):
         logger.info("Project created successfully.")
         project_plan_path: str = PathProvider.get_project_plan_path(Id(value=project.id))
 
-        uploaded_path: str = self._cloud_storage.upload_file(
-            CloudStorageUploadPayload(file_data=payload.plan_file.value, file_path=project_plan_path)
-        )
-        logger.debug("Project pdf uploaded.")
-
-        assert project_plan_path == uploaded_path
         self._project_write_repository.update(
             ProjectUpdatePayload(id_=Id(value=project.id), plan_path=project_plan_path)
         )
-        logger.debug("Project.plan field was updated.")
+        self._enqueue_plan_upload(Id(value=project.id), plan_file=payload.plan_file, plan_path=project_plan_path)
+        logger.debug("Project pdf upload enqueued.")
 
         return project
 
+    def _enqueue_plan_upload(self, project_id: Id, plan_file: PdfFile, plan_path: str) -> None:
+        self._project_write_repository.update_plan_upload_status(project_id, UploadStatusEnum.PENDING)
+        self._upload_queue.enqueue(
+            CloudStorageUploadPayload(file=plan_file.value, file_path=plan_path),
+            on_success=lambda: self._project_write_repository.update_plan_upload_status(
+                project_id, UploadStatusEnum.UPLOADED
+            ),
+            on_failure=lambda: self._project_write_repository.update_plan_upload_status(
+                project_id, UploadStatusEnum.FAILED
+            ),
+        )
+
+    def expire_pending_plan_uploads(self, started_before: datetime) -> int:
+        """Marks plans still pending since before the time as failed, their upload was lost with its worker."""
+        amount: int = self._project_write_repository.expire_pending_plan_uploads(started_before)
+        if amount:
+            logger.warning(f"{amount} project plans marked as failed, their upload never finished.")
+        return amount
+
     def update(self, update_command: ProjectUpdateCommand) -> Project:
         """
         :raises ProjectNotFoundException:
@@ -212,10 +288,10 @@ class ProjectService(AbstractDomainService):
         if update_command.plan_file:
             logger.info("Updating project_plan file.")
             project_plan_path: str = PathProvider.get_project_plan_path(Id(value=project.id))
-            uploaded_path: str = self._cloud_storage.upload_file(
-                CloudStorageUploadPayload(file_data=update_command.plan_file.value, file_path=project_plan_path)
+            self._enqueue_plan_upload(
+                Id(value=project.id), plan_file=update_command.plan_file, plan_path=project_plan_path
             )
-            logger.debug(f"File uploaded, uploaded_path = {uploaded_path}.")
+            logger.debug(f"File upload enqueued, project_plan_path = {project_plan_path}.")
 
         if update_command.company:
             logger.info("Updating company fields.")
@@ -253,12 +329,16 @@ class ProjectImageService(AbstractDomainService):
         project_image_write_repository: ProjectImageWriteRepository,
         project_read_repository: ProjectReadRepository,
         cloud_storage: AbstractCloudStorage,
+        upload_queue: AbstractUploadQueue,
+        image_processor: AbstractImageProcessor,
     ):
         # TODO: move cloud_storage to application layer
         self._project_image_read_repository = project_image_read_repository
         self._project_image_write_repository = project_image_write_repository
         self._project_read_repository = project_read_repository
         self._cloud_storage = cloud_storage
+        self._upload_queue = upload_queue
+        self._image_processor = image_processor
 
     def create(self, command: ProjectImageCreateCommand) -> ProjectImage:
         """
@@ -267,6 +347,22 @@ class ProjectImageService(AbstractDomainService):
         :raises ProjectImageMaxAmountException:
         :raises BusinessRuleException:
         """
+        project_images: list[ProjectImage] = self.create_many(
+            ProjectImagesCreateCommand(
+                user_id=command.user_id, project_id=command.project_id, image_files=[command.image_file]
+            )
+        )
+        return project_images[0]
+
+    def create_many(self, command: ProjectImagesCreateCommand) -> list[ProjectImage]:
+        """
+        :raises ProjectNotFoundException:
+        :raises UpdateDeniedPermissionException:
+        :raises ProjectImageMaxAmountException:
+        :raises BusinessRuleException:
+        """
+        if not command.image_files:
+            return list()
 
         project: Project = self._project_read_repository.get_by_id(command.project_id)
         if project.creator_id != command.user_id.value:
@@ -274,31 +370,85 @@ class ProjectImageService(AbstractDomainService):
             raise UpdateDeniedPermissionException("You don't have permission to add images to this project")
 
         image_count = self._project_image_read_repository.get_images_count_for_project(command.project_id)
-        if image_count == PROJECT_IMAGES_MAX_AMOUNT:
-            logger.exception("Images max amount reached.")
-            raise ProjectImageMaxAmountException(f"Project images max limit is {PROJECT_IMAGES_MAX_AMOUNT}")
-
         if image_count > PROJECT_IMAGES_MAX_AMOUNT:
             logger.critical("Project images amount exceeds allowed max limit!")
             raise BusinessRuleException(f"Project images max limit is {PROJECT_IMAGES_MAX_AMOUNT}")
 
-        img_path: str = PathProvider.get_project_image_path(command.project_id)
-        uploaded_path: str = self._cloud_storage.upload_file(
-            CloudStorageUploadPayload(file_data=command.image_file.value, file_path=img_path)
-        )
-        assert img_path == uploaded_path, "Expected and actual paths don't match."
+        if image_count + len(command.image_files) > PROJECT_IMAGES_MAX_AMOUNT:
+            logger.exception("Images max amount reached.")
+            raise ProjectImageMaxAmountException(f"Project images max limit is {PROJECT_IMAGES_MAX_AMOUNT}")
 
-        logger.debug("Project image uploaded.")
-        project_image: ProjectImage = self._project_image_write_repository.create(
-            ProjectImageCreatePayload(project_id=command.project_id, file_path=img_path, order=image_count + 1)
+        image_payloads: list[ProjectImageCreatePayload] = list()
+        variant_paths: list[dict[ImageVariantEnum, str]] = list()
+        for i in range(1, len(command.image_files) + 1):
+            file_path: str = PathProvider.get_project_image_path(command.project_id)
+            paths: dict[ImageVariantEnum, str] = {
+                variant: PathProvider.get_image_variant_path(file_path, variant) for variant in ImageVariantEnum
+            }
+            variant_paths.append(paths)
+            image_payloads.append(
+                ProjectImageCreatePayload(
+                    project_id=command.project_id,
+                    file_path=paths[ImageVariantEnum.FULL],
+                    thumbnail_path=paths[ImageVariantEnum.THUMBNAIL],
+                    card_path=paths[ImageVariantEnum.CARD],
+                    order=image_count + i,
+                    upload_status=UploadStatusEnum.PENDING,
+                )
+            )
+        project_images: list[ProjectImage] = self._project_image_write_repository.create_many(image_payloads)
+        logger.debug(f"{len(project_images)} project_images created successfully.")
+
+        image_ids: list[Id] = [Id(value=i.id) for i in project_images]
+        self._upload_queue.enqueue_processing(
+            [image_file.value for image_file in command.image_files],
+            prepare=lambda files: self._create_variant_uploads(files, variant_paths),
+            on_success=lambda: self._project_image_write_repository.update_upload_status(
+                image_ids, UploadStatusEnum.UPLOADED
+            ),
+            on_failure=lambda: self._delete_failed_images(command.project_id, image_ids),
         )
-        logger.debug("project_image created successfully.")
+        logger.debug("Project images upload enqueued.")
+
+        return project_images
 
-        return project_image
+    def _create_variant_uploads(
+        self, files: list[FileStream], variant_paths: list[dict[ImageVariantEnum, str]]
+    ) -> list[CloudStorageUploadPayload]:
+        """Runs in the upload queue once the images are committed, resizing does not hold the request."""
+        image_variants: list[dict[ImageVariantEnum, bytes]] = self._image_processor.create_variants(
+            files, tuple(ImageVariantEnum)
+        )
+        return [
+            CloudStorageUploadPayload(file=FileStream.from_bytes(image_data), file_path=paths[variant])
+            for paths, variants in zip(variant_paths, image_variants)
+            for variant, image_data in variants.items()
+        ]
+
+    def _delete_failed_images(self, project_id: Id, image_ids: list[Id]) -> None:
+        """Images added while the batch was uploading take the places of the deleted ones."""
+        self._project_image_write_repository.delete_many(image_ids)
+        self.reorder_images(project_id)
+        logger.warning(f"{len(image_ids)} project images deleted, their upload failed.")
+
+    def expire_pending_uploads(self, started_before: datetime) -> int:
+        """
+        Deletes images still pending since before the time, their upload was lost with its worker.
+        Their places are freed the same way as the ones of failed uploads.
+        """
+        project_images: list[ProjectImage] = self._project_image_read_repository.get_all(
+            ProjectImageFilter(upload_status=UploadStatusEnum.PENDING, upload_started_before=started_before)
+        )
+        image_ids: dict[int, list[Id]] = defaultdict(list)
+        for project_image in project_images:
+            image_ids[project_image.project_id].append(Id(value=project_image.id))
+        for project_id, ids in image_ids.items():
+            self._delete_failed_images(Id(value=project_id), ids)
+        return len(project_images)
 
     def get_paths(self, project_id: Id) -> list[str]:
         project_images: list[ProjectImage] = self._project_image_read_repository.get_all(
-            ProjectImageFilter(project_id=project_id)
+            ProjectImageFilter(project_id=project_id, upload_status=UploadStatusEnum.UPLOADED)
         )
         return [i.file_path for i in project_images]
 
@@ -307,13 +457,13 @@ class ProjectImageService(AbstractDomainService):
         self._project_read_repository.get_by_id(project_id)
 
         project_images: list[ProjectImage] = self._project_image_read_repository.get_all(
-            ProjectImageFilter(project_id=project_id)
+            ProjectImageFilter(project_id=project_id, upload_status=UploadStatusEnum.UPLOADED)
         )
         project_images.sort(key=lambda x: x.order)
-        image_urls: list[str] = list()
-        for i in project_images:
-            image_url: str = self._cloud_storage.create_url(CloudStorageCreateUrlPayload(file_path=i.file_path))
-            image_urls.append(image_url)
+        urls: dict[str, str] = self._cloud_storage.create_urls(
+            CloudStorageCreateUrlsPayload(file_paths=[i.file_path for i in project_images])
+        )
+        image_urls: list[str] = [urls[i.file_path] for i in project_images]
         logger.debug(f"Found {len(image_urls)} urls")
         return image_urls
 
@@ -336,18 +486,19 @@ class ProjectImageService(AbstractDomainService):
             self.reorder_images(project_id=command.project_id)
             logger.debug("Image record deleted from the database")
 
-            try:
-                image_path = project_image.file_path
-                logger.debug(f"Deleting file {image_path}")
-                self._cloud_storage.delete_file(payload=CloudStorageDeletePayload(file_path=image_path))
-                logger.debug("Image file deleted from the cloud storage")
-            except FileNotFoundCloudStorageException:
-                logger.info("File not found in cloud storage. Ignoring this exception.")
+            for image_path in project_image.paths:
+                try:
+                    logger.debug(f"Deleting file {image_path}")
+                    self._cloud_storage.delete_file(payload=CloudStorageDeletePayload(file_path=image_path))
+                    logger.debug("Image file deleted from the cloud storage")
+                except FileNotFoundCloudStorageException:
+                    logger.info("File not found in cloud storage. Ignoring this exception.")
 
     def reorder_images(self, project_id: Id) -> None:
         images: list[ProjectImage] = self._project_image_read_repository.get_all(
             ProjectImageFilter(project_id=project_id)
         )
+        images.sort(key=lambda x: x.order)
         for i, image in enumerate(images, start=1):
             if i != image.order:
                 logger.debug(
@@ -1,10 +1,12 @@
 from io import BytesIO
 
+from domain.enums.image_variant import ImageVariantEnum
 from domain.exceptions.user import ProfilePictureNotFoundException, UserPhoneAlreadyExistException
 from domain.exceptions.user_favorite import UserFavoriteAlreadyExistsException
 from domain.models.user import User, UserPhone
 from domain.models.user_favorite import UserFavorite
 from domain.ports.cloud_storage import AbstractCloudStorage
+from domain.ports.image_processor import AbstractImageProcessor
 from domain.ports.service import AbstractDomainService
 from domain.repositories.project_management import ProjectReadRepository
 from domain.repositories.user import (
@@ -15,6 +17,7 @@ from domain.repositories.user import (
 )
 from domain.repositories.user_favorite import UserFavoriteReadRepository, UserFavoriteWriteRepository
 from domain.services.file import ImageService
+from domain.utils.file_stream import FileStream
 from domain.utils.path_provider import PathProvider
 from domain.value_objects.cloud_storage import CloudStorageCreateUrlPayload, CloudStorageUploadPayload
 from domain.value_objects.common import Description, FirstName, Id, LastName, PhoneNumber
@@ -40,6 +43,7 @@ class UserService(AbstractDomainService):
         user_phone_write_repository: UserPhoneWriteRepository,
         user_phone_read_repository: UserPhoneReadRepository,
         image_service: ImageService,
+        image_processor: AbstractImageProcessor,
     ):
         self._cloud_storage = cloud_storage
         self._user_read_repository = user_read_repository
@@ -47,6 +51,7 @@ class UserService(AbstractDomainService):
         self._user_phone_write_repository = user_phone_write_repository
         self._user_phone_read_repository = user_phone_read_repository
         self._image_service = image_service
+        self._image_processor = image_processor
 
     def update_user(self, command: UserUpdateCommand) -> None:
         """
@@ -92,7 +97,10 @@ class UserService(AbstractDomainService):
         :raises UserNotFoundException:
         :raises NotSupportedImageFormatException: If image format is not in ("image/jpeg", "image/png", "image/gif", "image/webp", "image/avif").
         """
-        converted_image_file: BytesIO = self._image_service.convert_to_jpg(BytesIO(command.file_data))
+        self._image_service.check_image_format(BytesIO(command.file_data))
+        variants: dict[ImageVariantEnum, bytes] = self._image_processor.create_variants(
+            [FileStream.from_bytes(command.file_data)], (ImageVariantEnum.FULL,)
+        )[0]
         logger.info("The image converted to jpg successfully.")
 
         self._user_read_repository.get_by_id(command.user_id)
@@ -101,7 +109,7 @@ class UserService(AbstractDomainService):
         logger.debug(f"file_path: {file_path}")
 
         uploaded_path: str = self._cloud_storage.upload_file(
-            CloudStorageUploadPayload(file_data=converted_image_file.getvalue(), file_path=file_path)
+            CloudStorageUploadPayload(file=FileStream.from_bytes(variants[ImageVariantEnum.FULL]), file_path=file_path)
         )
         logger.debug(f"File uploaded into the {uploaded_path}.")
         self._user_write_repository.update(UserUpdatePayload(id_=command.user_id, picture=uploaded_path))
@@ -128,14 +136,15 @@ class UserService(AbstractDomainService):
 
         phones: list[UserPhone] = self._user_phone_read_repository.get_all(UserPhoneFilter(user_id=user_id))
         logger.debug(f"phones = {phones}")
+        # Parsing the email and the phones is most of the profile, their columns were validated when saved.
         return UserProfile(
             id_=Id(value=user.id),
             first_name=FirstName(value=user.first_name),
             last_name=LastName(value=user.last_name),
             description=Description(value=user.description),
-            email=Email(value=user.email),
+            email=Email.from_trusted(value=user.email),
             picture=picture_url,
-            phone_numbers=[PhoneNumber(value=i.number) for i in phones],
+            phone_numbers=[PhoneNumber.from_trusted(value=i.number) for i in phones],
         )
 
 
@@ -0,0 +1,55 @@
+import os
+from io import BytesIO
+from typing import IO, Iterator
+
+from domain.constants import FILE_CHUNK_SIZE, FILE_SIGNATURE_SIZE
+
+
+class FileStream:
+    """A binary file that is read in chunks instead of being loaded into memory, e.g. a Django UploadedFile."""
+
+    def __init__(self, file: IO[bytes], size: int | None = None) -> None:
+        """:param size: Size of the file in bytes, it is measured by seeking to the end when not given."""
+        self._file = file
+        self._size = size
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "FileStream":
+        return cls(BytesIO(data), size=len(data))
+
+    @property
+    def size(self) -> int:
+        if self._size is None:
+            position: int = self._file.tell()
+            self._size = self._file.seek(0, os.SEEK_END)
+            self._file.seek(position)
+        return self._size
+
+    def header(self, length: int = FILE_SIGNATURE_SIZE) -> bytes:
+        """Reads the first bytes of the file without moving the position."""
+        position: int = self._file.tell()
+        self._file.seek(0)
+        data: bytes = self._file.read(length)
+        self._file.seek(position)
+        return data
+
+    def chunks(self, chunk_size: int = FILE_CHUNK_SIZE) -> Iterator[bytes]:
+        """Reads the whole file from the start."""
+        self._file.seek(0)
+        while chunk := self._file.read(chunk_size):
+            yield chunk
+
+    def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __repr__(self) -> str:
+        return f"FileStream(size={self.size})"
@@ -1,6 +1,7 @@
 from uuid import uuid4
 
 from domain.constants import StorageLocations
+from domain.enums.image_variant import ImageVariantEnum
 from domain.ports.service import AbstractDomainService
 from domain.value_objects.common import Id
 
@@ -18,6 +19,13 @@ class PathProvider(AbstractDomainService):
     def get_project_image_path(project_id: Id) -> str:
         return f"{StorageLocations.PROJECT_PHOTO_PATH}/{project_id.value}/{str(uuid4())}.jpg"
 
+    @staticmethod
+    def get_image_variant_path(file_path: str, variant: ImageVariantEnum) -> str:
+        """The full variant is stored under the path of the image itself, smaller ones next to it."""
+        if variant == ImageVariantEnum.FULL:
+            return file_path
+        return f"{file_path.removesuffix('.jpg')}_{variant}.jpg"
+
     @staticmethod
     def get_news_image_path() -> str:
         return f"{StorageLocations.NEWS_IMAGE_PATH}/{str(uuid4())}.jpg"
@@ -1,6 +1,17 @@
+from typing import Any, Self
+
 from pydantic import BaseModel
 
 
 class BaseVo(BaseModel):
     def __str__(self) -> str:
         return repr(self)
+
+    @classmethod
+    def from_trusted(cls, **values: Any) -> Self:
+        """
+        Builds the value object without validation, for values that were validated before they were stored,
+        such as the columns of a row read from the database. Nested value objects are passed built.
+        It pays off for expensive validators only, pydantic validates plain fields faster than this builds them.
+        """
+        return cls.model_construct(**values)
@@ -1,9 +1,13 @@
 from domain.ports.payload import AbstractCreatePayload, AbstractDeletePayload, AbstractUpdatePayload
+from domain.utils.file_stream import FileStream
 from domain.value_objects import BaseVo
+from pydantic import ConfigDict
 
 
 class CloudStorageUploadPayload(AbstractCreatePayload, BaseVo):
-    file_data: bytes
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    file: FileStream
     file_path: str
 
 
@@ -17,3 +21,7 @@ class CloudStorageDeletePayload(AbstractDeletePayload, BaseVo):
 
 class CloudStorageCreateUrlPayload(AbstractCreatePayload, BaseVo):
     file_path: str
+
+
+class CloudStorageCreateUrlsPayload(AbstractCreatePayload, BaseVo):
+    file_paths: list[str]
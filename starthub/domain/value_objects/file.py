@@ -3,53 +3,58 @@ from io import BytesIO
 from domain.constants import IMAGE_MAX_SIZE_IN_BYTES, MEGABYTE, PDF_MAX_SIZE_IN_BYTES
 from domain.exceptions.file import ImageFileTooLargeException, PdfFileTooLargeException
 from domain.services.file import ImageService, PdfService
+from domain.utils.file_stream import FileStream
 from domain.value_objects import BaseVo
-from pydantic import field_validator
+from pydantic import ConfigDict, field_validator
 
 
 class ImageFile(BaseVo):
-    value: bytes
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    value: FileStream
 
     # noinspection PyNestedDecorators
     @field_validator("value", mode="after")
     @classmethod
-    def is_valid_image(cls, value: bytes) -> bytes:
+    def is_valid_image(cls, value: FileStream) -> FileStream:
         """
         :raises ImageFileTooLargeException:
         :raises NotSupportedImageFormatException:
         """
-        if len(value) > IMAGE_MAX_SIZE_IN_BYTES:
+        if value.size > IMAGE_MAX_SIZE_IN_BYTES:
             raise ImageFileTooLargeException(
-                f"image size {round(len(value) / MEGABYTE, 1)} MB exceeds max allowed {IMAGE_MAX_SIZE_IN_BYTES // MEGABYTE} MB."
+                f"image size {round(value.size / MEGABYTE, 1)} MB exceeds max allowed {IMAGE_MAX_SIZE_IN_BYTES // MEGABYTE} MB."
             )
-        ImageService().check_image_format(BytesIO(value))
+        ImageService().check_image_format(BytesIO(value.header()))
         return value
 
     def __str__(self) -> str:
-        return f"ImageFile {len(self.value)} bytes"
+        return f"ImageFile {self.value.size} bytes"
 
     def __repr__(self) -> str:
-        return f"ImageFile(bytes_len={len(self.value)})"
+        return f"ImageFile(bytes_len={self.value.size})"
 
 
 class PdfFile(BaseVo):
-    value: bytes
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    value: FileStream
 
     # noinspection PyNestedDecorators
     @field_validator("value", mode="after")
     @classmethod
-    def is_valid_pdf(cls, value: bytes) -> bytes:
+    def is_valid_pdf(cls, value: FileStream) -> FileStream:
         """:raises NotPdfFileException:"""
-        if len(value) > PDF_MAX_SIZE_IN_BYTES:
+        if value.size > PDF_MAX_SIZE_IN_BYTES:
             raise PdfFileTooLargeException(
-                f"pdf size {round(len(value) / MEGABYTE, 1)} MB exceeds max allowed {PDF_MAX_SIZE_IN_BYTES // MEGABYTE} MB."
+                f"pdf size {round(value.size / MEGABYTE, 1)} MB exceeds max allowed {PDF_MAX_SIZE_IN_BYTES // MEGABYTE} MB."
             )
 
-        PdfService().check_is_pdf(BytesIO(value))
+        PdfService().check_is_pdf(BytesIO(value.header()))
         return value
 
     def __str__(self) -> str:
-        return f"PdfFile {len(self.value)} bytes"
+        return f"PdfFile {self.value.size} bytes"
 
     def __repr__(self) -> str:
-        return f"PdfFile(bytes_len={len(self.value)})"
+        return f"PdfFile(bytes_len={self.value.size})"
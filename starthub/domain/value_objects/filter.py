@@ -1,9 +1,12 @@
+from datetime import datetime
+
+from domain.enums.upload_status import UploadStatusEnum
 from domain.ports.filter import AbstractFilter
 from domain.value_objects import BaseVo
 from domain.value_objects.common import FirstName, Id, LastName, PhoneNumber, Slug, SocialLink
 from domain.value_objects.company import BusinessNumber
 from domain.value_objects.country import CountryCode
-from domain.value_objects.project_management import ProjectStage, ProjectStatus
+from domain.value_objects.project_management import ProjectSearch, ProjectStage, ProjectStatus
 from domain.value_objects.user import Email
 
 
@@ -20,6 +23,7 @@ class ProjectFilter(AbstractFilter, BaseVo):
     funding_model_slug: Slug | None = None
     status: ProjectStatus | None = None
     stage: ProjectStage | None = None
+    search: ProjectSearch | None = None
 
 
 class ProjectCategoryFilter(AbstractFilter, BaseVo):
@@ -64,6 +68,8 @@ class UserFavoriteFilter(AbstractFilter, BaseVo):
 class ProjectImageFilter(AbstractFilter, BaseVo):
     project_id: Id | None = None
     image_order: int | None = None
+    upload_status: UploadStatusEnum | None = None
+    upload_started_before: datetime | None = None
 
 
 class PermissionFilter(AbstractFilter, BaseVo):
@@ -1,11 +1,18 @@
 from datetime import date
+from decimal import Decimal
 
-from domain.constants import CHAR_FIELD_MAX_LENGTH
+from domain.constants import CHAR_FIELD_MAX_LENGTH, SEARCH_WORD_PATTERN
+from domain.enums.project_sort import ProjectSortEnum
 from domain.enums.project_stage import ProjectStageEnum
 from domain.enums.project_status import ProjectStatusEnum
+from domain.enums.project_view import ProjectViewEnum
+from domain.enums.upload_status import UploadStatusEnum
 from domain.exceptions.project_management import (
+    InvalidProjectSearchException,
+    InvalidProjectSortException,
     InvalidProjectStageException,
     InvalidProjectStatusException,
+    InvalidProjectViewException,
     NegativeProjectGoalSumException,
     ProjectNameIsTooLongException,
 )
@@ -111,6 +118,68 @@ class ProjectStatus(BaseVo):
         return value.lower()
 
 
+class ProjectSort(BaseVo):
+    value: str
+
+    @field_validator("value", mode="after")
+    @classmethod
+    def is_valid_sort(cls, value: str) -> str:
+        """:raises InvalidProjectSortException:"""
+        if value.lower() not in ProjectSortEnum:
+            raise InvalidProjectSortException(
+                f"Invalid project sort: {value}. Allowed sorts: {', '.join([sort for sort in ProjectSortEnum])}"
+            )
+        return value.lower()
+
+
+class ProjectView(BaseVo):
+    value: str
+
+    @field_validator("value", mode="after")
+    @classmethod
+    def is_valid_view(cls, value: str) -> str:
+        """:raises InvalidProjectViewException:"""
+        if value.lower() not in ProjectViewEnum:
+            raise InvalidProjectViewException(
+                f"Invalid project view: {value}. Allowed views: {', '.join([view for view in ProjectViewEnum])}"
+            )
+        return value.lower()
+
+
+class ProjectSearch(BaseVo):
+    value: str
+
+    @field_validator("value", mode="after")
+    @classmethod
+    def is_valid_search(cls, value: str) -> str:
+        """:raises InvalidProjectSearchException:"""
+        if not SEARCH_WORD_PATTERN.search(value):
+            raise InvalidProjectSearchException("Project search must contain a word.")
+        if len(value) > CHAR_FIELD_MAX_LENGTH:
+            raise InvalidProjectSearchException(
+                f"Project search must be at most {CHAR_FIELD_MAX_LENGTH} characters long."
+            )
+        return value
+
+    @property
+    def words(self) -> list[str]:
+        return SEARCH_WORD_PATTERN.findall(self.value)
+
+
+class ProjectCursor(BaseVo):
+    """The position after the last project of a page: its sort key and id, the id breaks ties."""
+
+    sort: ProjectSortEnum
+    key: date | Decimal | float | None = None
+    last_id: int
+
+
+class ProjectPagination(BaseVo):
+    limit: int
+    sort: ProjectSortEnum = ProjectSortEnum.NEWEST
+    cursor: ProjectCursor | None = None
+
+
 class ProjectName(BaseVo):
     value: str
 
@@ -207,6 +276,9 @@ class ProjectImageCreatePayload(AbstractCreatePayload, BaseVo):
     project_id: Id
     file_path: str
     order: int
+    upload_status: UploadStatusEnum = UploadStatusEnum.PENDING
+    thumbnail_path: str | None = None
+    card_path: str | None = None
 
 
 class ProjectImageUpdatePayload(AbstractUpdatePayload, BaseVo):
@@ -220,6 +292,12 @@ class ProjectImageCreateCommand(BaseCommand):
     image_file: ImageFile
 
 
+class ProjectImagesCreateCommand(BaseCommand):
+    user_id: Id
+    project_id: Id
+    image_files: list[ImageFile]
+
+
 class ProjectImageUpdateCommand(BaseCommand):
     project_id: Id
     user_id: Id
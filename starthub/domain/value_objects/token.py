@@ -36,6 +36,9 @@ class AccessPayload:
 @dataclass(frozen=True)
 class RefreshPayload:
     sub: str
+    # Tokens issued before they carried the email have none, their jti is derived from the token.
+    email: str | None
+    jti: str
     iat: int
     exp: int
     type: str = TokenTypeEnum.REFRESH
@@ -44,3 +47,7 @@ class RefreshPayload:
         """:raises ValueError:"""
         if self.type != TokenTypeEnum.REFRESH:
             raise ValueError("Token type must be refresh.")
+
+    @property
+    def is_legacy(self) -> bool:
+        return self.email is None
@@ -0,0 +1,168 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+
+from config import settings
+from django.core.cache import caches
+from domain.constants import SIGNED_URL_LIFETIME
+from domain.ports.cloud_storage import AbstractCloudStorage
+from domain.value_objects.cloud_storage import (
+    CloudStorageCreateUrlPayload,
+    CloudStorageCreateUrlsPayload,
+    CloudStorageDeletePayload,
+    CloudStorageUploadPayload,
+)
+
+
+class AbstractSignedUrlCache(ABC):
+    def __init__(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._counters_lock = Lock()
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get(self, file_path: str) -> str | None:
+        url = self._get(file_path)
+        with self._counters_lock:
+            if url is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return url
+
+    @abstractmethod
+    def _get(self, file_path: str) -> str | None:
+        pass
+
+    @abstractmethod
+    def set(self, file_path: str, url: str, timeout: int) -> None:
+        """:param timeout: Amount of seconds the url may be served from the cache."""
+        pass
+
+    @abstractmethod
+    def delete(self, file_path: str) -> None:
+        pass
+
+
+class InProcessSignedUrlCache(AbstractSignedUrlCache):
+    """Bounded LRU cache living in the memory of the current process."""
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__()
+        self._max_size = max_size
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = Lock()
+
+    def _get(self, file_path: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is None:
+                return None
+            url, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[file_path]
+                return None
+            self._entries.move_to_end(file_path)
+            return url
+
+    def set(self, file_path: str, url: str, timeout: int) -> None:
+        with self._lock:
+            self._entries[file_path] = (url, time.monotonic() + timeout)
+            self._entries.move_to_end(file_path)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, file_path: str) -> None:
+        with self._lock:
+            self._entries.pop(file_path, None)
+
+
+class DjangoSignedUrlCache(AbstractSignedUrlCache):
+    """Shares signed urls between processes. Size and eviction are handled by the configured cache backend."""
+
+    def __init__(self, alias: str = "default", key_prefix: str = "signed_url") -> None:
+        super().__init__()
+        self._alias = alias
+        self._key_prefix = key_prefix
+
+    def _key(self, file_path: str) -> str:
+        return f"{self._key_prefix}:{file_path}"
+
+    def _get(self, file_path: str) -> str | None:
+        url: str | None = caches[self._alias].get(self._key(file_path))
+        return url
+
+    def set(self, file_path: str, url: str, timeout: int) -> None:
+        caches[self._alias].set(self._key(file_path), url, timeout=timeout)
+
+    def delete(self, file_path: str) -> None:
+        caches[self._alias].delete(self._key(file_path))
+
+
+class CachedCloudStorage(AbstractCloudStorage):
+    """Reuses signed urls of the wrapped storage until `safety_margin` seconds before they expire."""
+
+    def __init__(
+        self,
+        storage: AbstractCloudStorage,
+        cache: AbstractSignedUrlCache,
+        url_lifetime: int = SIGNED_URL_LIFETIME,
+        safety_margin: int = settings.SIGNED_URL_CACHE_SAFETY_MARGIN,
+    ) -> None:
+        if safety_margin >= url_lifetime:
+            raise ValueError("The safety margin must be shorter than the url lifetime.")
+        self._storage = storage
+        self._cache = cache
+        self._timeout = url_lifetime - safety_margin
+
+    @property
+    def cache(self) -> AbstractSignedUrlCache:
+        return self._cache
+
+    def upload_file(self, payload: CloudStorageUploadPayload) -> str:
+        return self._storage.upload_file(payload)
+
+    def delete_file(self, payload: CloudStorageDeletePayload) -> None:
+        """:raises FileNotFoundCloudStorageException:"""
+        self._cache.delete(payload.file_path)
+        self._storage.delete_file(payload)
+
+    def create_url(self, payload: CloudStorageCreateUrlPayload) -> str:
+        url = self._cache.get(payload.file_path)
+        if url is None:
+            url = self._storage.create_url(payload)
+            self._cache.set(payload.file_path, url, timeout=self._timeout)
+        return url
+
+    def create_urls(self, payload: CloudStorageCreateUrlsPayload) -> dict[str, str]:
+        urls: dict[str, str] = dict()
+        missing_paths: list[str] = list()
+        for file_path in dict.fromkeys(payload.file_paths):
+            url = self._cache.get(file_path)
+            if url is None:
+                missing_paths.append(file_path)
+            else:
+                urls[file_path] = url
+
+        if missing_paths:
+            signed_urls = self._storage.create_urls(CloudStorageCreateUrlsPayload(file_paths=missing_paths))
+            for file_path, url in signed_urls.items():
+                self._cache.set(file_path, url, timeout=self._timeout)
+            urls.update(signed_urls)
+        return urls
+
+
+def create_signed_url_cache(backend: str = settings.SIGNED_URL_CACHE_BACKEND) -> AbstractSignedUrlCache:
+    if backend == "memory":
+        return InProcessSignedUrlCache(max_size=settings.SIGNED_URL_CACHE_MAX_SIZE)
+    if backend == "django":
+        return DjangoSignedUrlCache()
+    raise ValueError(f"Unknown signed url cache backend: {backend}.")
@@ -0,0 +1,27 @@
+from config import settings
+from domain.ports.cloud_storage import AbstractCloudStorage
+from infrastructure.cloud_storages.cached import CachedCloudStorage, create_signed_url_cache
+from infrastructure.cloud_storages.google import GoogleCloudStorage
+from infrastructure.cloud_storages.local import InMemoryCloudStorage, LocalFileSystemCloudStorage
+
+
+def create_cloud_storage(backend: str = settings.CLOUD_STORAGE_BACKEND) -> AbstractCloudStorage:
+    if backend == "google":
+        return GoogleCloudStorage(
+            bucket_name=settings.GOOGLE_CLOUD_BUCKET_NAME,
+            signing_workers=settings.GOOGLE_CLOUD_SIGNING_WORKERS,
+            credentials_file=settings.google_cloud_credentials_path,
+        )
+    if backend == "local":
+        return LocalFileSystemCloudStorage(
+            root=settings.LOCAL_CLOUD_STORAGE_ROOT,
+            base_url=settings.LOCAL_CLOUD_STORAGE_URL,
+            secret_key=settings.SECRET_KEY,
+        )
+    if backend == "memory":
+        return InMemoryCloudStorage(base_url=settings.LOCAL_CLOUD_STORAGE_URL, secret_key=settings.SECRET_KEY)
+    raise ValueError(f"Unknown cloud storage backend: {backend}.")
+
+
+storage = create_cloud_storage()
+cloud_storage = CachedCloudStorage(storage=storage, cache=create_signed_url_cache())
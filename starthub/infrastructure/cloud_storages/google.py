@@ -1,31 +1,77 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from io import BytesIO
+from pathlib import Path
 from typing import cast
 
-from config import settings
+import google.auth
+from domain.constants import SIGNED_URL_LIFETIME
 from domain.exceptions.cloud_storage import FileNotFoundCloudStorageException
 from domain.ports.cloud_storage import AbstractCloudStorage
 from domain.value_objects.cloud_storage import (
     CloudStorageCreateUrlPayload,
+    CloudStorageCreateUrlsPayload,
     CloudStorageDeletePayload,
     CloudStorageUploadPayload,
 )
+from google.auth.credentials import Credentials
 from google.cloud.exceptions import GoogleCloudError, NotFound
 from google.cloud.storage import Bucket, Client
 from google.cloud.storage.blob import Blob
+from google.oauth2 import service_account
 from loguru import logger
 
+UPLOAD_CHUNK_SIZE_MULTIPLE = 256 * 1024  # required by resumable uploads
+UPLOAD_CHUNK_SIZE = 8 * UPLOAD_CHUNK_SIZE_MULTIPLE  # 2 MiB
+
 
 class GoogleCloudStorage(AbstractCloudStorage):
-    def __init__(self, bucket_name: str):
+    def __init__(
+        self,
+        bucket_name: str,
+        client: Client | None = None,
+        signing_workers: int = 0,
+        credentials_file: Path | None = None,
+        upload_chunk_size: int = UPLOAD_CHUNK_SIZE,
+        credentials: Credentials | None = None,
+    ):
+        """
+        :param signing_workers: Amount of threads used by create_urls(), 0 signs in the calling thread.
+        :param credentials_file: Service account key. When it exists the client is built from it, so urls are
+            signed locally, otherwise the default credentials are used.
+        :param credentials: Used instead of loading them, e.g. together with a given client.
+        :param upload_chunk_size: Files larger than it are sent by a resumable upload in chunks of this size, smaller
+            ones in a single request. Must be a multiple of 256 KiB.
+        """
+        if upload_chunk_size % UPLOAD_CHUNK_SIZE_MULTIPLE:
+            raise ValueError("The upload chunk size must be a multiple of 256 KiB.")
         self._bucket_name = bucket_name
-        self._client: Client | None = None
+        self._upload_chunk_size = upload_chunk_size
+        self._client: Client | None = client
+        self._credentials_file = credentials_file
+        self._credentials: Credentials | None = credentials
+        self._project: str | None = None
         self._bucket: Bucket | None = None
+        self._signing_bucket: Bucket | None = None
+        self._signing_workers = signing_workers
+        self._signing_executor: ThreadPoolExecutor | None = None
+
+    @property
+    def credentials(self) -> Credentials:
+        """Loaded once, the client and the signing of the urls use the same credentials."""
+        if self._credentials is None:
+            if self._credentials_file is not None and self._credentials_file.is_file():
+                self._credentials = service_account.Credentials.from_service_account_file(str(self._credentials_file))
+                self._project = self._credentials.project_id
+            else:
+                self._credentials, self._project = google.auth.default()
+            logger.info("Google cloud credentials loaded.")
+        return self._credentials
 
     @property
     def client(self) -> Client:
         if self._client is None:
-            self._client = Client()
+            credentials: Credentials = self.credentials
+            self._client = Client(project=self._project, credentials=credentials)
             logger.info("Google cloud storage client initialized.")
         return self._client
 
@@ -41,19 +87,49 @@ class GoogleCloudStorage(AbstractCloudStorage):
                 raise err
         return self._bucket
 
+    @property
+    def signing_bucket(self) -> Bucket:
+        """A bucket reference built without requesting the bucket metadata, it is enough for signing urls."""
+        if self._signing_bucket is None:
+            self._signing_bucket = self.client.bucket(self._bucket_name)
+        return self._signing_bucket
+
+    def _sign(self, file_path: str) -> str:
+        blob: Blob = self.signing_bucket.blob(blob_name=file_path)
+        return cast(
+            str,
+            blob.generate_signed_url(
+                version="v4",
+                expiration=timedelta(seconds=SIGNED_URL_LIFETIME),
+                credentials=self.credentials,
+            ),
+        )
+
+    @property
+    def signing_executor(self) -> ThreadPoolExecutor:
+        if self._signing_executor is None:
+            self._signing_executor = ThreadPoolExecutor(
+                max_workers=self._signing_workers, thread_name_prefix="url-signing"
+            )
+        return self._signing_executor
+
     def upload_file(self, payload: CloudStorageUploadPayload) -> str:
         """Upload a file to Google Cloud Storage bucket.
 
-        :param payload: Upload payload containing file data and destination path
+        The file is read in chunks, so at most `upload_chunk_size` bytes of it are held in memory.
+
+        :param payload: Upload payload containing file stream and destination path
         :return: Full path to the uploaded file in GCS
         :raises GoogleCloudError: If upload operation fails
         """
         logger.warning("Started uploading a file into the bucket.")
 
-        blob: Blob = self.bucket.blob(blob_name=payload.file_path)
+        size: int = payload.file.size
+        chunk_size: int | None = self._upload_chunk_size if size > self._upload_chunk_size else None
+        blob: Blob = self.bucket.blob(blob_name=payload.file_path, chunk_size=chunk_size)
         logger.debug(f"Blob: {blob}")
         try:
-            blob.upload_from_file(file_obj=BytesIO(payload.file_data), rewind=True)
+            blob.upload_from_file(file_obj=payload.file, rewind=True, size=size)
             logger.info("File uploaded into the bucket.")
             return cast(str, blob.name)
         except GoogleCloudError as e:
@@ -87,12 +163,31 @@ class GoogleCloudStorage(AbstractCloudStorage):
         :return: Signed URL for temporary access to the file
         :raises GoogleCloudError: If URL generation fails
         """
-        blob: Blob = self.bucket.blob(blob_name=payload.file_path)
         try:
-            return cast(str, blob.generate_signed_url(version="v4", expiration=timedelta(minutes=15)))
+            return self._sign(payload.file_path)
         except GoogleCloudError as e:
             logger.error(f"Google Cloud error during generating url for {payload.file_path}: {e}")
             raise e
 
+    def create_urls(self, payload: CloudStorageCreateUrlsPayload) -> dict[str, str]:
+        """Generate signed URLs for several files at once.
+
+        Duplicated paths are signed once. All urls are signed with the same credentials and bucket reference.
+
+        :param payload: URLs creation payload containing file paths
+        :return: Mapping of file path to its signed URL
+        :raises GoogleCloudError: If URL generation fails
+        """
+        file_paths: list[str] = list(dict.fromkeys(payload.file_paths))
+        if not file_paths:
+            return dict()
 
-google_cloud_storage = GoogleCloudStorage(bucket_name=settings.GOOGLE_CLOUD_BUCKET_NAME)
+        try:
+            if self._signing_workers > 0 and len(file_paths) > 1:
+                urls: list[str] = list(self.signing_executor.map(self._sign, file_paths))
+            else:
+                urls = [self._sign(file_path) for file_path in file_paths]
+        except GoogleCloudError as e:
+            logger.error(f"Google Cloud error during generating urls for {len(file_paths)} files: {e}")
+            raise e
+        return dict(zip(file_paths, urls))
@@ -0,0 +1,140 @@
+import os
+import time
+from abc import ABC, abstractmethod
+from io import BytesIO
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import BinaryIO
+from urllib.parse import quote, urlencode
+
+from django.utils.crypto import constant_time_compare, salted_hmac
+from domain.constants import SIGNED_URL_LIFETIME
+from domain.exceptions.cloud_storage import FileNotFoundCloudStorageException, InvalidSignatureCloudStorageException
+from domain.ports.cloud_storage import AbstractCloudStorage
+from domain.value_objects.cloud_storage import (
+    CloudStorageCreateUrlPayload,
+    CloudStorageCreateUrlsPayload,
+    CloudStorageDeletePayload,
+    CloudStorageUploadPayload,
+)
+from loguru import logger
+
+
+class LocalCloudStorage(AbstractCloudStorage, ABC):
+    """A cloud storage without a cloud, its files are served by the application under expiring HMAC-signed urls."""
+
+    _key_salt = "infrastructure.cloud_storages.local"
+
+    def __init__(self, base_url: str, secret_key: str, url_lifetime: int = SIGNED_URL_LIFETIME):
+        """
+        :param base_url: Url of the view serving the files, a file path is appended to it.
+        :param url_lifetime: Seconds the created urls are valid for.
+        """
+        self._base_url = base_url
+        self._secret_key = secret_key
+        self._url_lifetime = url_lifetime
+
+    @abstractmethod
+    def open_file(self, file_path: str) -> BinaryIO:
+        """:raises FileNotFoundCloudStorageException:"""
+        pass
+
+    def open_signed_file(self, file_path: str, expires: str, signature: str) -> BinaryIO:
+        """
+        :raises InvalidSignatureCloudStorageException:
+        :raises FileNotFoundCloudStorageException:
+        """
+        try:
+            expires_at = int(expires)
+        except ValueError:
+            raise InvalidSignatureCloudStorageException("The url expiration time is not valid.")
+        if expires_at < time.time():
+            raise InvalidSignatureCloudStorageException("The url has expired.")
+        if not constant_time_compare(signature, self._sign(file_path, expires_at)):
+            raise InvalidSignatureCloudStorageException("The url signature is not valid.")
+        return self.open_file(file_path)
+
+    def _sign(self, file_path: str, expires_at: int) -> str:
+        return salted_hmac(
+            self._key_salt, f"{file_path}\n{expires_at}", secret=self._secret_key, algorithm="sha256"
+        ).hexdigest()
+
+    def create_url(self, payload: CloudStorageCreateUrlPayload) -> str:
+        expires_at = int(time.time()) + self._url_lifetime
+        query: str = urlencode({"expires": expires_at, "signature": self._sign(payload.file_path, expires_at)})
+        return f"{self._base_url}{quote(payload.file_path)}?{query}"
+
+    def create_urls(self, payload: CloudStorageCreateUrlsPayload) -> dict[str, str]:
+        return {
+            file_path: self.create_url(CloudStorageCreateUrlPayload(file_path=file_path))
+            for file_path in dict.fromkeys(payload.file_paths)
+        }
+
+
+class LocalFileSystemCloudStorage(LocalCloudStorage):
+    def __init__(self, root: Path, base_url: str, secret_key: str, url_lifetime: int = SIGNED_URL_LIFETIME):
+        super().__init__(base_url=base_url, secret_key=secret_key, url_lifetime=url_lifetime)
+        self._root = root.resolve()
+
+    def _resolve(self, file_path: str) -> Path:
+        """:raises FileNotFoundCloudStorageException: If the path points outside the storage root."""
+        path = (self._root / file_path).resolve()
+        if self._root not in path.parents:
+            raise FileNotFoundCloudStorageException(f"A file {file_path} not found in cloud storage.")
+        return path
+
+    def upload_file(self, payload: CloudStorageUploadPayload) -> str:
+        """The file is written next to its destination and moved in place, so it is never served half-written."""
+        path: Path = self._resolve(payload.file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as temp_file:
+            try:
+                for chunk in payload.file.chunks():
+                    temp_file.write(chunk)
+            except OSError:
+                os.unlink(temp_file.name)
+                raise
+        os.replace(temp_file.name, path)
+        logger.info(f"File {payload.file_path} saved into {self._root}.")
+        return payload.file_path
+
+    def delete_file(self, payload: CloudStorageDeletePayload) -> None:
+        try:
+            self._resolve(payload.file_path).unlink()
+        except FileNotFoundError:
+            logger.error(f"File {payload.file_path} not found in {self._root}.")
+            raise FileNotFoundCloudStorageException(f"A file {payload.file_path} not found in cloud storage.")
+
+    def open_file(self, file_path: str) -> BinaryIO:
+        try:
+            return self._resolve(file_path).open("rb")
+        except (FileNotFoundError, IsADirectoryError):
+            raise FileNotFoundCloudStorageException(f"A file {file_path} not found in cloud storage.")
+
+
+class InMemoryCloudStorage(LocalCloudStorage):
+    """Keeps files in the worker process, they are lost on restart and not shared between workers."""
+
+    def __init__(self, base_url: str, secret_key: str, url_lifetime: int = SIGNED_URL_LIFETIME):
+        super().__init__(base_url=base_url, secret_key=secret_key, url_lifetime=url_lifetime)
+        self._files: dict[str, bytes] = dict()
+        self._lock = Lock()
+
+    def upload_file(self, payload: CloudStorageUploadPayload) -> str:
+        file_data: bytes = b"".join(payload.file.chunks())
+        with self._lock:
+            self._files[payload.file_path] = file_data
+        return payload.file_path
+
+    def delete_file(self, payload: CloudStorageDeletePayload) -> None:
+        with self._lock:
+            if self._files.pop(payload.file_path, None) is None:
+                raise FileNotFoundCloudStorageException(f"A file {payload.file_path} not found in cloud storage.")
+
+    def open_file(self, file_path: str) -> BinaryIO:
+        with self._lock:
+            file_data: bytes | None = self._files.get(file_path)
+        if file_data is None:
+            raise FileNotFoundCloudStorageException(f"A file {file_path} not found in cloud storage.")
+        return BytesIO(file_data)
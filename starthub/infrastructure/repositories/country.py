@@ -3,20 +3,19 @@ from domain.models.country import Country
 from domain.repositories.country import CountryReadRepository
 from domain.value_objects.common import Id, Pagination
 from domain.value_objects.filter import CountryFilter
+from infrastructure.services.reference_data import countries
 
 
 class DjCountryReadRepository(CountryReadRepository):
     def get_by_id(self, id_: Id) -> Country:
         """:raises CountryNotFoundException:"""
-        country: Country | None = Country.objects.filter(id=id_.value).first()
+        country: Country | None = countries.get(id_.value)
         if country is None:
             raise CountryNotFoundException(f"Country with id = {id_.value} does not exist.")
         return country
 
     def get_all(self, filter_: CountryFilter, pagination: Pagination | None = None) -> list[Country]:
-        queryset = Country.objects.all()
-
         if filter_.code:
-            queryset = queryset.filter(code=filter_.code.value)
-
-        return list(queryset)
+            country: Country | None = countries.get_by_key(filter_.code.value)
+            return [] if country is None else [country]
+        return countries.get_all()
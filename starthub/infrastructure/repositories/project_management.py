@@ -1,4 +1,19 @@
-from django.db.models import Q, QuerySet
+from datetime import datetime
+from functools import lru_cache
+from itertools import batched
+from typing import Any, TypeVar
+
+from config import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import F, FloatField, OuterRef, Prefetch, Q, QuerySet, Subquery, Value
+from django.db.models.functions import Cast, Coalesce, Left, NullIf
+from django.utils import timezone
+from domain.constants import PROJECT_CARD_SUMMARY_LENGTH, SEARCH_CONFIG
+from domain.enums.project_sort import ProjectSortEnum
+from domain.enums.response_scope import ResponseScopeEnum
+from domain.enums.upload_status import UploadStatusEnum
 from domain.exceptions.project_management import (
     FundingModelNotFoundException,
     ProjectCategoryNotFoundException,
@@ -9,11 +24,15 @@ from domain.exceptions.project_management import (
     ProjectSocialLinkNotFoundException,
     TeamMemberNotFoundException,
 )
+from domain.models.company import Company
 from domain.models.funding_model import FundingModel
 from domain.models.project import Project, ProjectImage, ProjectPhone, ProjectSocialLink, TeamMember
+from domain.models.project_card import ProjectCard
 from domain.models.project_category import ProjectCategory
 from domain.repositories.project_management import (
     FundingModelReadRepository,
+    ProjectCardReadRepository,
+    ProjectCardWriteRepository,
     ProjectCategoryReadRepository,
     ProjectImageReadRepository,
     ProjectImageWriteRepository,
@@ -38,21 +57,105 @@ from domain.value_objects.filter import (
 )
 from domain.value_objects.project_management import (
     ProjectCreatePayload,
+    ProjectCursor,
     ProjectImageCreatePayload,
     ProjectImageDeletePayload,
     ProjectImageUpdatePayload,
+    ProjectPagination,
     ProjectPhoneCreatePayload,
     ProjectPhoneUpdatePayload,
+    ProjectSearch,
     ProjectSocialLinkCreatePayload,
     ProjectSocialLinkUpdatePayload,
     ProjectUpdatePayload,
     TeamMemberCreatePayload,
     TeamMemberUpdatePayload,
 )
+from infrastructure.services.reference_data import ReferenceDataCache, countries, funding_models, project_categories
+from infrastructure.services.response_cache import response_cache
 from loguru import logger
 
+ListingT = TypeVar("ListingT", Project, ProjectCard)
+
+
+@lru_cache(maxsize=1)
+def has_trigram_search() -> bool:
+    """The migrations create pg_trgm only where the database server provides it."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+class DjProjectListingMixin:
+    """Filters and pages the projects or their cards, which have the same listing fields and indexes."""
+
+    # The field every sort orders by and whether it is descending, the id breaks ties in the same direction.
+    _sort_fields: dict[ProjectSortEnum, tuple[str, bool]] = {
+        ProjectSortEnum.NEWEST: ("id", True),
+        ProjectSortEnum.DEADLINE: ("deadline", False),
+        ProjectSortEnum.GOAL_SUM: ("goal_sum", True),
+        ProjectSortEnum.CURRENT_SUM: ("current_sum", True),
+        ProjectSortEnum.RELEVANCE: ("relevance", True),
+    }
+
+    @classmethod
+    def _paginate(
+        cls, queryset: QuerySet[ListingT], filter_: ProjectFilter, pagination: ProjectPagination
+    ) -> QuerySet[ListingT]:
+        field, descending = cls._sort_fields[pagination.sort]
+        if pagination.sort == ProjectSortEnum.RELEVANCE and filter_.search:
+            # The rank is a real, as a double precision it reaches the cursor and compares to it without rounding.
+            queryset = queryset.annotate(
+                relevance=Cast(SearchRank(F("search_vector"), cls._search_query(filter_.search)), FloatField())
+            )
+        if descending:
+            queryset = queryset.order_by(f"-{field}", "-id")
+        else:
+            queryset = queryset.order_by(field, "id")
+
+        cursor: ProjectCursor | None = pagination.cursor
+        if cursor is not None and field == "id":
+            queryset = queryset.filter(id__lt=cursor.last_id) if descending else queryset.filter(id__gt=cursor.last_id)
+        elif cursor is not None:
+            # The first condition bounds the index scan, the second one only skips the ties already returned.
+            if descending:
+                queryset = queryset.filter(Q(**{f"{field}__lte": cursor.key}))
+                queryset = queryset.filter(Q(**{f"{field}__lt": cursor.key}) | Q(id__lt=cursor.last_id))
+            else:
+                queryset = queryset.filter(Q(**{f"{field}__gte": cursor.key}))
+                queryset = queryset.filter(Q(**{f"{field}__gt": cursor.key}) | Q(id__gt=cursor.last_id))
+
+        logger.debug(f'SQL statement = {str(queryset.query).replace('"', '')}')
+        return queryset[: pagination.limit]
+
+    @classmethod
+    def _filter(cls, queryset: QuerySet[ListingT], filter_: ProjectFilter) -> QuerySet[ListingT]:
+        # Slugs are resolved to ids, the foreign keys lead the composite indexes and no join is needed.
+        # An unknown slug filters by NULL, which no project has.
+        if filter_.category_slug:
+            queryset = queryset.filter(category_id=project_categories.get_id(filter_.category_slug.value))
+        if filter_.funding_model_slug:
+            queryset = queryset.filter(funding_model_id=funding_models.get_id(filter_.funding_model_slug.value))
+        if filter_.status:
+            queryset = queryset.filter(status=filter_.status.value)
+        if filter_.stage:
+            queryset = queryset.filter(stage=filter_.stage.value)
+        if filter_.search:
+            condition = Q(search_vector=cls._search_query(filter_.search))
+            if has_trigram_search():
+                # A word with a typo starts no word of the project, names similar to the search are found instead.
+                # They have no rank, so they follow the matching projects when sorted by relevance.
+                condition |= Q(name__trigram_similar=filter_.search.value)
+            queryset = queryset.filter(condition)
+        return queryset
 
-class DjProjectReadRepository(ProjectReadRepository):
+    @staticmethod
+    def _search_query(search: ProjectSearch) -> SearchQuery:
+        """Every word of the search has to start a word of the project, so unfinished words are found too."""
+        return SearchQuery(" & ".join(f"{word}:*" for word in search.words), search_type="raw", config=SEARCH_CONFIG)
+
+
+class DjProjectReadRepository(DjProjectListingMixin, ProjectReadRepository):
     def get_by_id(self, id_: Id) -> Project:
         """:raises ProjectNotFoundException:"""
         project: Project | None = Project.objects.filter(id=id_.value).first()
@@ -61,27 +164,72 @@ class DjProjectReadRepository(ProjectReadRepository):
             raise ProjectNotFoundException(f"Project with id = {id_.value} not found.")
         return project
 
-    def get_all(self, filter_: ProjectFilter, pagination: Pagination | None = None) -> list[Project]:
-        queryset = Project.objects.all().order_by("-id")
-
-        if filter_.category_slug:
-            queryset = queryset.filter(category__slug=filter_.category_slug.value)
-        if filter_.funding_model_slug:
-            queryset = queryset.filter(funding_model__slug=filter_.funding_model_slug.value)
-        if filter_.status:
-            queryset = queryset.filter(status=filter_.status.value)
-        if filter_.stage:
-            queryset = queryset.filter(stage=filter_.stage.value)
+    def get_all(
+        self, filter_: ProjectFilter, pagination: Pagination | None = None, listing: bool = False
+    ) -> list[Project]:
+        queryset = self._filter(Project.objects.all().order_by("-id"), filter_)
+        if listing:
+            queryset = self._select_listing(queryset)
 
         if pagination and pagination.last_id is not None:
             queryset = queryset.filter(id__lt=pagination.last_id)
 
         logger.debug(f'SQL statement = {str(queryset.query).replace('"', '')}')
-        if pagination and pagination.limit is not None:
-            result = list(queryset.distinct()[: pagination.limit])
-        else:
-            result = list(queryset.distinct())
-        return result
+        projects: list[Project] = list(queryset[: pagination.limit] if pagination and pagination.limit else queryset)
+        if listing:
+            self._attach_reference_data(projects)
+        return projects
+
+    def get_page(self, filter_: ProjectFilter, pagination: ProjectPagination) -> list[Project]:
+        queryset = self._select_listing(self._filter(Project.objects.all(), filter_))
+        projects: list[Project] = list(self._paginate(queryset, filter_, pagination))
+        self._attach_reference_data(projects)
+        return projects
+
+    def estimate_count(self, filter_: ProjectFilter) -> int:
+        if filter_ == ProjectFilter():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [Project._meta.db_table]
+                )
+                row: tuple[int] | None = cursor.fetchone()
+            # A table that was never analyzed has no estimate.
+            if row is not None and row[0] >= 0:
+                return row[0]
+        cache_key: str = f"projects:count:{filter_.model_dump_json()}"
+        return cache.get_or_set(
+            cache_key,
+            lambda: self._filter(Project.objects.all(), filter_).count(),
+            settings.PROJECT_COUNT_CACHE_TIMEOUT,
+        )
+
+    @staticmethod
+    def _select_listing(queryset: QuerySet[Project]) -> QuerySet[Project]:
+        """Categories, funding models and countries are not joined, `_attach_reference_data` sets them."""
+        return queryset.select_related("company", "company__founder").prefetch_related(
+            Prefetch(
+                "images",
+                queryset=ProjectImage.objects.filter(upload_status=UploadStatusEnum.UPLOADED)
+                .order_by("project_id", "order", "id")
+                .distinct("project_id"),
+                to_attr="first_images",
+            )
+        )
+
+    @staticmethod
+    def _attach_reference_data(projects: list[Project]) -> None:
+        """Sets the cached related rows, a row missing from the cache is loaded lazily as before."""
+        for project in projects:
+            category: ProjectCategory | None = project_categories.get(project.category_id)
+            if category is not None:
+                project.category = category
+            funding_model: FundingModel | None = funding_models.get(project.funding_model_id)
+            if funding_model is not None:
+                project.funding_model = funding_model
+            # Only listings load the company with the project.
+            company: Company | None = Project._meta.get_field("company").get_cached_value(project, default=None)
+            if company is not None and (country := countries.get(company.country_id)) is not None:
+                company.country = country
 
     def get_by_slug(self, slug: Slug) -> Project:
         """:raises ProjectNotFoundException:"""
@@ -89,9 +237,111 @@ class DjProjectReadRepository(ProjectReadRepository):
 
         if project is None:
             raise ProjectNotFoundException
+        self._attach_reference_data([project])
         return project
 
 
+class DjProjectCardReadRepository(DjProjectListingMixin, ProjectCardReadRepository):
+    def get_page(
+        self, filter_: ProjectFilter, pagination: ProjectPagination, columns: frozenset[str] | None = None
+    ) -> list[ProjectCard]:
+        queryset = self._filter(ProjectCard.objects.all(), filter_)
+        if columns is not None:
+            # The next cursor is made of the id and the sort key of the last card.
+            sort_field: str = self._sort_fields[pagination.sort][0]
+            # Relevance is computed, not loaded.
+            loaded: set[str] = {"id", *columns}
+            if pagination.sort != ProjectSortEnum.RELEVANCE:
+                loaded.add(sort_field)
+            queryset = queryset.only(*loaded)
+        cards: list[ProjectCard] = list(self._paginate(queryset, filter_, pagination))
+
+        # The reference data is always cached, a row missing from the cache is loaded lazily.
+        related: dict[str, ReferenceDataCache[Any]] = {
+            "category": project_categories,
+            "funding_model": funding_models,
+            "country": countries,
+        }
+        for field, reference_data in related.items():
+            if columns is not None and f"{field}_id" not in columns:
+                continue
+            for card in cards:
+                row_id: int | None = getattr(card, f"{field}_id")
+                if row_id is not None and (row := reference_data.get(row_id)) is not None:
+                    setattr(card, field, row)
+        return cards
+
+
+class DjProjectCardWriteRepository(ProjectCardWriteRepository):
+    _fields: tuple[str, ...] = (
+        "name",
+        "slug",
+        "summary",
+        "category_id",
+        "funding_model_id",
+        "creator_id",
+        "company_name",
+        "country_id",
+        "stage",
+        "status",
+        "goal_sum",
+        "current_sum",
+        "deadline",
+        "cover_path",
+    )
+
+    def refresh(self, project_ids: list[Id]) -> None:
+        self._write(Project.objects.filter(id__in=[i.value for i in project_ids]))
+
+    def delete(self, project_id: Id) -> None:
+        ProjectCard.objects.filter(id=project_id.value).delete()
+
+    def rebuild(self, batch_size: int) -> int:
+        amount = 0
+        with transaction.atomic():
+            ProjectCard.objects.all().delete()
+            project_ids = Project.objects.order_by("id").values_list("id", flat=True)
+            for batch in batched(project_ids.iterator(chunk_size=batch_size), batch_size):
+                amount += self._write(Project.objects.filter(id__in=batch))
+        return amount
+
+    def _write(self, projects: QuerySet[Project]) -> int:
+        """Inserts or replaces the cards of the projects with two statements, whatever their amount."""
+        cover_path = (
+            ProjectImage.objects.filter(project_id=OuterRef("id"), upload_status=UploadStatusEnum.UPLOADED)
+            .order_by("order", "id")
+            .values(path=Coalesce(NullIf("card_path", Value("")), "file_path"))[:1]
+        )
+        rows = projects.values(
+            "id",
+            "name",
+            "slug",
+            "category_id",
+            "funding_model_id",
+            "creator_id",
+            "stage",
+            "status",
+            "goal_sum",
+            "current_sum",
+            "deadline",
+            summary=Left("description", PROJECT_CARD_SUMMARY_LENGTH),
+            company_name=F("company__name"),
+            country_id=F("company__country_id"),
+            cover_path=Subquery(cover_path),
+        )
+        cards: list[ProjectCard] = ProjectCard.objects.bulk_create(
+            [ProjectCard(**row) for row in rows],
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=self._fields,
+        )
+        # The vector is generated by the database, it is copied without loading it.
+        ProjectCard.objects.filter(id__in=[card.id for card in cards]).update(
+            search_vector=Subquery(Project.objects.filter(id=OuterRef("id")).values("search_vector")[:1])
+        )
+        return len(cards)
+
+
 class DjProjectWriteRepository(ProjectWriteRepository):
     def create(self, data: ProjectCreatePayload) -> Project:
         project = Project.objects.create(
@@ -132,6 +382,17 @@ class DjProjectWriteRepository(ProjectWriteRepository):
         project.save()
         return project
 
+    def update_plan_upload_status(self, project_id: Id, upload_status: UploadStatusEnum) -> None:
+        fields: dict[str, Any] = {"plan_upload_status": upload_status}
+        if upload_status == UploadStatusEnum.PENDING:
+            fields["plan_upload_started_at"] = timezone.now()
+        Project.objects.filter(id=project_id.value).update(**fields)
+
+    def expire_pending_plan_uploads(self, started_before: datetime) -> int:
+        return Project.objects.filter(
+            plan_upload_status=UploadStatusEnum.PENDING, plan_upload_started_at__lt=started_before
+        ).update(plan_upload_status=UploadStatusEnum.FAILED)
+
     def delete_by_id(self, id_: Id) -> None:
         """:raises ProjectNotFoundException:"""
         try:
@@ -154,7 +415,7 @@ class DjProjectWriteRepository(ProjectWriteRepository):
 class DjProjectCategoryReadRepository(ProjectCategoryReadRepository):
     def get_by_id(self, id_: Id) -> ProjectCategory:
         """:raises ProjectCategoryNotFoundException:"""
-        project_category: ProjectCategory | None = ProjectCategory.objects.filter(id=id_.value).first()
+        project_category: ProjectCategory | None = project_categories.get(id_.value)
 
         if project_category is None:
             raise ProjectCategoryNotFoundException(f"Project category with id = {id_.value} does not exist.")
@@ -162,7 +423,7 @@ class DjProjectCategoryReadRepository(ProjectCategoryReadRepository):
         return project_category
 
     def get_all(self, filter_: ProjectCategoryFilter, pagination: Pagination | None = None) -> list[ProjectCategory]:
-        return list(ProjectCategory.objects.all())
+        return project_categories.get_all()
 
 
 class DjProjectPhoneReadRepository(ProjectPhoneReadRepository):
@@ -274,13 +535,13 @@ class DjTeamMemberWriteRepository(TeamMemberWriteRepository):
 class DjFundingModelReadRepository(FundingModelReadRepository):
     def get_by_id(self, id_: Id) -> FundingModel:
         """:raises FundingModelNotFoundException:"""
-        funding_model: FundingModel | None = FundingModel.objects.filter(id=id_.value).first()
+        funding_model: FundingModel | None = funding_models.get(id_.value)
         if funding_model is None:
             raise FundingModelNotFoundException(f"Funding models with id = {id_.value} does not exist.")
         return funding_model
 
     def get_all(self, filter_: FundingModelFilter, pagination: Pagination | None = None) -> list[FundingModel]:
-        return list(FundingModel.objects.all())
+        return funding_models.get_all()
 
 
 class DjProjectImageReadRepository(ProjectImageReadRepository):
@@ -293,16 +554,29 @@ class DjProjectImageReadRepository(ProjectImageReadRepository):
             queryset = queryset.filter(project_id=filter_.project_id.value)
         if filter_.image_order is not None:
             queryset = queryset.filter(order=filter_.image_order)
+        if filter_.upload_status is not None:
+            queryset = queryset.filter(upload_status=filter_.upload_status)
+        if filter_.upload_started_before is not None:
+            queryset = queryset.filter(upload_started_at__lt=filter_.upload_started_before)
 
         return list(queryset.distinct())
 
     def get_images_count_for_project(self, project_id: Id) -> int:
-        return ProjectImage.objects.filter(project_id=project_id.value).count()
+        return ProjectImage.objects.filter(
+            project_id=project_id.value, upload_status__in=[UploadStatusEnum.UPLOADED, UploadStatusEnum.PENDING]
+        ).count()
 
 
 class DjProjectImageWriteRepository(ProjectImageWriteRepository):
     def create(self, data: ProjectImageCreatePayload) -> ProjectImage:
-        return ProjectImage.objects.create(project_id=data.project_id.value, file_path=data.file_path, order=data.order)
+        return ProjectImage.objects.create(
+            project_id=data.project_id.value,
+            file_path=data.file_path,
+            order=data.order,
+            upload_status=data.upload_status,
+            thumbnail_path=data.thumbnail_path,
+            card_path=data.card_path,
+        )
 
     def update(self, data: ProjectImageUpdatePayload) -> ProjectImage:
         project_image: ProjectImage | None = ProjectImage.objects.filter(id=data.image_id.value).first()
@@ -314,6 +588,31 @@ class DjProjectImageWriteRepository(ProjectImageWriteRepository):
         project_image.save()
         return project_image
 
+    def create_many(self, data: list[ProjectImageCreatePayload]) -> list[ProjectImage]:
+        return ProjectImage.objects.bulk_create(
+            [
+                ProjectImage(
+                    project_id=i.project_id.value,
+                    file_path=i.file_path,
+                    order=i.order,
+                    upload_status=i.upload_status,
+                    thumbnail_path=i.thumbnail_path,
+                    card_path=i.card_path,
+                )
+                for i in data
+            ]
+        )
+
+    def update_upload_status(self, image_ids: list[Id], upload_status: UploadStatusEnum) -> None:
+        images = ProjectImage.objects.filter(id__in=[i.value for i in image_ids])
+        images.update(upload_status=upload_status)
+        # Uploaded images appear in the projects and their covers, the update sends no signal to refresh them.
+        DjProjectCardWriteRepository().refresh([Id(value=i) for i in set(images.values_list("project_id", flat=True))])
+        response_cache.invalidate(ResponseScopeEnum.PROJECTS)
+
+    def delete_many(self, image_ids: list[Id]) -> None:
+        ProjectImage.objects.filter(id__in=[i.value for i in image_ids]).delete()
+
     def delete_by_id(self, id_: Id) -> None:
         raise NotImplementedError("The method delete() not implemented yet.")
 
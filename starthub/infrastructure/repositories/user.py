@@ -1,6 +1,7 @@
 from datetime import UTC, datetime
 
-from domain.exceptions.user import UserNotFoundException
+from django.db import IntegrityError
+from domain.exceptions.user import EmailAlreadyExistsException, UserNotFoundException
 from domain.models.user import User, UserPhone
 from domain.repositories.user import (
     UserPhoneReadRepository,
@@ -50,10 +51,17 @@ class DjUserReadRepository(UserReadRepository):
 
 class DjUserWriteRepository(UserWriteRepository):
     def create(self, data: UserCreatePayload) -> User:
-        return User.objects.create_user(
-            email=data.email.value,
-            password=data.password.value,
-        )
+        """:raises EmailAlreadyExistsException:"""
+        try:
+            return User.objects.create_user(
+                email=data.email.value,
+                password=data.password.value,
+            )
+        except IntegrityError:
+            # The unique email is checked by the insert, a lookup is needed only to tell it from other failures.
+            if User.objects.filter(email=User.objects.normalize_email(data.email.value)).exists():
+                raise EmailAlreadyExistsException(data.email.value)
+            raise
 
     def update(self, data: UserUpdatePayload) -> User:
         """:raises UserNotFoundException:"""
@@ -84,7 +92,7 @@ class DjUserWriteRepository(UserWriteRepository):
 
     def update_last_login(self, user: User) -> None:
         user.last_login = datetime.now(UTC)
-        user.save()
+        user.save(update_fields=["last_login"])
 
 
 class DjUserPhoneReadRepository(UserPhoneReadRepository):
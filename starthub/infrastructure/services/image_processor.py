@@ -0,0 +1,65 @@
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from tempfile import NamedTemporaryFile
+
+from config import settings
+from domain.enums.image_variant import ImageVariantEnum
+from domain.ports.image_processor import AbstractImageProcessor
+from domain.services.file import ImageService
+from domain.utils.file_stream import FileStream
+from loguru import logger
+
+
+def _create_variants(
+    image_service: ImageService, path: str, variants: tuple[ImageVariantEnum, ...]
+) -> dict[ImageVariantEnum, bytes]:
+    with open(path, "rb") as file_obj:
+        return image_service.create_variants(file_obj, variants)
+
+
+class ProcessPoolImageProcessor(AbstractImageProcessor):
+    """Runs ImageMagick in worker processes, so image processing neither holds the GIL nor blocks other requests."""
+
+    def __init__(self, image_service: ImageService, max_workers: int):
+        self._image_service = image_service
+        self._max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Workers are spawned, forking a process that runs threads may copy held locks.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"Image processing pool with {self._max_workers} workers started.")
+        return self._executor
+
+    def create_variants(
+        self, images: list[FileStream], variants: tuple[ImageVariantEnum, ...]
+    ) -> list[dict[ImageVariantEnum, bytes]]:
+        """The images are passed to the workers as temporary files, they are never read into memory here."""
+        paths: list[str] = list()
+        try:
+            for image in images:
+                with NamedTemporaryFile(prefix="image_", delete=False) as spooled_file:
+                    paths.append(spooled_file.name)
+                    for chunk in image.chunks():
+                        spooled_file.write(chunk)
+            futures: list[Future[dict[ImageVariantEnum, bytes]]] = [
+                self.executor.submit(_create_variants, self._image_service, path, variants) for path in paths
+            ]
+            return [future.result() for future in futures]
+        except BrokenProcessPool:
+            # A worker died, e.g. killed for memory, the next call starts a new pool instead of failing forever.
+            logger.exception("Image processing pool is broken, it will be restarted.")
+            self._executor = None
+            raise
+        finally:
+            for path in paths:
+                os.remove(path)
+
+
+image_processor = ProcessPoolImageProcessor(image_service=ImageService(), max_workers=settings.IMAGE_PROCESSING_WORKERS)
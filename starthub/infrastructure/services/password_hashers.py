@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, PBKDF2PasswordHasher, ScryptPasswordHasher
+
+# The costs are read from django.conf on every use, so benchmarks and tests can override them.
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    @property  # type: ignore[override]
+    def iterations(self) -> int:
+        iterations: int | None = settings.PBKDF2_ITERATIONS
+        return iterations or PBKDF2PasswordHasher.iterations
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    @property  # type: ignore[override]
+    def work_factor(self) -> int:
+        work_factor: int | None = settings.SCRYPT_WORK_FACTOR
+        return work_factor or ScryptPasswordHasher.work_factor
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Needs the argon2-cffi package."""
+
+    @property  # type: ignore[override]
+    def time_cost(self) -> int:
+        time_cost: int | None = settings.ARGON2_TIME_COST
+        return time_cost or Argon2PasswordHasher.time_cost
+
+    @property  # type: ignore[override]
+    def memory_cost(self) -> int:
+        memory_cost: int | None = settings.ARGON2_MEMORY_COST
+        return memory_cost or Argon2PasswordHasher.memory_cost
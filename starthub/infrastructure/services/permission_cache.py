@@ -0,0 +1,94 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable
+from uuid import uuid4
+
+from config import settings
+from django.core.cache import caches
+from domain.ports.permission_cache import AbstractPermissionCache
+from domain.value_objects.common import Id
+
+Stamp = tuple[str, str]
+
+
+class VersionedPermissionCache(AbstractPermissionCache):
+    """
+    Keeps permission names in the process and in the shared cache, each entry with a version stamp.
+    Invalidation replaces a version in the shared cache, so every process drops its entries on the next read.
+    Versions are random, an evicted version is recreated with a new value and never matches an old entry.
+    The shared cache must be shared by the processes, entries of the process also expire after `local_timeout`
+    so an invalidation that did not reach them cannot last.
+    """
+
+    _global_version_key = "permissions:version"
+
+    def __init__(self, max_size: int, timeout: int, local_timeout: int, alias: str = "default"):
+        """
+        :param max_size: Amount of users kept in the process.
+        :param timeout: Seconds the permissions are kept in the shared cache.
+        :param local_timeout: Seconds the permissions are kept in the process.
+        """
+        self._max_size = max_size
+        self._timeout = timeout
+        self._local_timeout = local_timeout
+        self._alias = alias
+        # User id to the stamp, the permissions and the monotonic time they expire at.
+        self._entries: OrderedDict[int, tuple[Stamp, frozenset[str], float]] = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _user_version_key(user_id: int) -> str:
+        return f"permissions:version:user:{user_id}"
+
+    @staticmethod
+    def _entry_key(user_id: int) -> str:
+        return f"permissions:user:{user_id}"
+
+    def _get_stamp(self, user_id: int) -> Stamp:
+        cache = caches[self._alias]
+        keys: list[str] = [self._global_version_key, self._user_version_key(user_id)]
+        versions: dict[str, str] = cache.get_many(keys)
+        for key in keys:
+            if key not in versions:
+                # Another process may create the version at the same time, the first one wins.
+                cache.add(key, uuid4().hex, timeout=None)
+                versions[key] = cache.get(key)
+        return versions[keys[0]], versions[keys[1]]
+
+    def get_or_set(self, user_id: Id, load: Callable[[], frozenset[str]]) -> frozenset[str]:
+        # The stamp is read before loading, so permissions loaded during an invalidation are stored as stale.
+        stamp: Stamp = self._get_stamp(user_id.value)
+        with self._lock:
+            entry = self._entries.get(user_id.value)
+            if entry is not None and entry[0] == stamp and entry[2] > time.monotonic():
+                self._entries.move_to_end(user_id.value)
+                return entry[1]
+
+        cache = caches[self._alias]
+        shared_entry: tuple[Stamp, frozenset[str]] | None = cache.get(self._entry_key(user_id.value))
+        if shared_entry is not None and shared_entry[0] == stamp:
+            permissions: frozenset[str] = shared_entry[1]
+        else:
+            permissions = load()
+            cache.set(self._entry_key(user_id.value), (stamp, permissions), timeout=self._timeout)
+
+        with self._lock:
+            self._entries[user_id.value] = (stamp, permissions, time.monotonic() + self._local_timeout)
+            self._entries.move_to_end(user_id.value)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return permissions
+
+    def invalidate_user(self, user_id: Id) -> None:
+        caches[self._alias].set(self._user_version_key(user_id.value), uuid4().hex, timeout=None)
+
+    def invalidate_all(self) -> None:
+        caches[self._alias].set(self._global_version_key, uuid4().hex, timeout=None)
+
+
+permission_cache = VersionedPermissionCache(
+    max_size=settings.PERMISSION_CACHE_MAX_SIZE,
+    timeout=settings.PERMISSION_CACHE_TIMEOUT,
+    local_timeout=settings.PERMISSION_CACHE_LOCAL_TIMEOUT,
+)
@@ -0,0 +1,114 @@
+from threading import Lock
+from typing import Any, Generic, TypeVar
+from uuid import uuid4
+
+from config import settings
+from django.core.cache import caches
+from django.db import connection, models, transaction
+from domain.models.country import Country
+from domain.models.funding_model import FundingModel
+from domain.models.project_category import ProjectCategory
+
+ModelT = TypeVar("ModelT", bound=models.Model)
+
+
+class _VersionReplacement:
+    """Replaces the version of a cache on commit, until then the open transaction changed rows the cache misses."""
+
+    def __init__(self, cache: "ReferenceDataCache[Any]"):
+        self.cache = cache
+        self.done = False
+
+    def __call__(self) -> None:
+        self.cache._replace_version()
+        self.done = True
+
+
+class ReferenceDataCache(Generic[ModelT]):
+    """
+    Keeps every row of a small, rarely changing table in the process, by id and by its natural key.
+    Invalidation replaces a version in the shared cache on commit, every process then loads the table again on the
+    next read. Versions expire, so a missed invalidation is bounded by their timeout.
+    The rows are shared between requests and must not be changed.
+    """
+
+    def __init__(
+        self,
+        model: type[ModelT],
+        key_field: str,
+        version_timeout: int = settings.REFERENCE_DATA_VERSION_TIMEOUT,
+        alias: str = "default",
+    ):
+        """
+        :param key_field: The unique field the rows are looked up by besides the id, e.g. a slug.
+        :param version_timeout: Seconds after which every process loads the table again.
+        """
+        self._model = model
+        self._key_field = key_field
+        self._version_timeout = version_timeout
+        self._alias = alias
+        self._version_key = f"reference_data:version:{model._meta.db_table}"
+        self._rows: dict[int, ModelT] = dict()
+        self._ids: dict[str, int] = dict()
+        self._version: str | None = None
+        self._lock = Lock()
+
+    def _get_version(self) -> str:
+        cache = caches[self._alias]
+        version: str | None = cache.get(self._version_key)
+        if version is None:
+            # Another process may create the version at the same time, the first one wins.
+            cache.add(self._version_key, uuid4().hex, timeout=self._version_timeout)
+            version = cache.get(self._version_key)
+        return version
+
+    def _replace_version(self) -> None:
+        caches[self._alias].set(self._version_key, uuid4().hex, timeout=self._version_timeout)
+
+    def _has_pending_changes(self) -> bool:
+        """Whether the open transaction changed the table, a rollback drops the replacement waiting for its commit."""
+        return connection.in_atomic_block and any(
+            isinstance(callback, _VersionReplacement) and callback.cache is self and not callback.done
+            for _, callback, _ in connection.run_on_commit
+        )
+
+    def _load(self) -> tuple[dict[int, ModelT], dict[str, int]]:
+        rows: list[ModelT] = list(self._model.objects.order_by("id"))
+        return {row.pk: row for row in rows}, {getattr(row, self._key_field): row.pk for row in rows}
+
+    def _sync(self) -> tuple[dict[int, ModelT], dict[str, int]]:
+        if self._has_pending_changes():
+            # The rows of the open transaction may be rolled back, they are read without being kept.
+            return self._load()
+        # The version is read before loading, rows changed during the load are loaded again on the next read.
+        version: str = self._get_version()
+        with self._lock:
+            if version != self._version:
+                self._rows, self._ids = self._load()
+                self._version = version
+            return self._rows, self._ids
+
+    def get(self, id_: int) -> ModelT | None:
+        return self._sync()[0].get(id_)
+
+    def get_id(self, key: str) -> int | None:
+        """:return: The id of the row with the key, None if there is no such row."""
+        return self._sync()[1].get(key)
+
+    def get_by_key(self, key: str) -> ModelT | None:
+        rows, ids = self._sync()
+        id_: int | None = ids.get(key)
+        return None if id_ is None else rows[id_]
+
+    def get_all(self) -> list[ModelT]:
+        """:return: The rows ordered by id."""
+        return list(self._sync()[0].values())
+
+    def invalidate(self) -> None:
+        """Invalidates on commit, until then the transaction that changed the table reads it without the cache."""
+        transaction.on_commit(_VersionReplacement(self))
+
+
+project_categories = ReferenceDataCache(ProjectCategory, key_field="slug")
+funding_models = ReferenceDataCache(FundingModel, key_field="slug")
+countries = ReferenceDataCache(Country, key_field="code")
@@ -0,0 +1,78 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Iterable
+from uuid import uuid4
+
+from config import settings
+from django.core.cache import caches
+from django.db import connection, transaction
+from domain.enums.response_scope import ResponseScopeEnum
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    etag: str
+    data: Any
+    headers: dict[str, str]
+
+
+class VersionedResponseCache:
+    """
+    Keeps the data of public responses in the shared cache, each entry stamped with the versions of its scopes.
+    Invalidating a scope replaces its version, the entries of the old version are never read again and expire.
+    The cache is shared by the worker processes, an entry whose invalidation is missed anyway, e.g. after a queryset
+    update that sends no signal, is served until its timeout at most.
+    Responses contain signed urls, so they expire before the urls reused by the cloud storage do.
+    """
+
+    def __init__(
+        self, timeout: int, url_safety_margin: int = settings.SIGNED_URL_CACHE_SAFETY_MARGIN, alias: str = "default"
+    ):
+        """:param timeout: Seconds a response is kept, 0 keeps none."""
+        if timeout >= url_safety_margin:
+            raise ValueError("Responses must expire before the signed urls in them.")
+        self._timeout = timeout
+        self._alias = alias
+
+    @staticmethod
+    def _version_key(scope: ResponseScopeEnum) -> str:
+        return f"responses:version:{scope}"
+
+    @staticmethod
+    def _entry_key(key: str, stamp: str) -> str:
+        return f"responses:{hashlib.sha256(f'{stamp}:{key}'.encode()).hexdigest()}"
+
+    def get_stamp(self, scopes: Iterable[ResponseScopeEnum]) -> str:
+        """Must be read before the response is built, so a response built during an invalidation is stored as stale."""
+        cache = caches[self._alias]
+        keys: list[str] = [self._version_key(scope) for scope in scopes]
+        versions: dict[str, str] = cache.get_many(keys)
+        for key in keys:
+            if key not in versions:
+                # Another process may create the version at the same time, the first one wins.
+                cache.add(key, uuid4().hex, timeout=None)
+                versions[key] = cache.get(key)
+        return ":".join(versions[key] for key in keys)
+
+    def get(self, key: str, stamp: str) -> CachedResponse | None:
+        if not self._timeout:
+            return None
+        response: CachedResponse | None = caches[self._alias].get(self._entry_key(key, stamp))
+        return response
+
+    def set(self, key: str, stamp: str, response: CachedResponse) -> None:
+        if self._timeout:
+            caches[self._alias].set(self._entry_key(key, stamp), response, timeout=self._timeout)
+
+    def invalidate(self, scope: ResponseScopeEnum) -> None:
+        """Invalidates now for the current transaction and again on commit, after other requests could cache it."""
+
+        def replace_version() -> None:
+            caches[self._alias].set(self._version_key(scope), uuid4().hex, timeout=None)
+
+        replace_version()
+        if connection.in_atomic_block:
+            transaction.on_commit(replace_version)
+
+
+response_cache = VersionedResponseCache(timeout=settings.RESPONSE_CACHE_TIMEOUT)
@@ -0,0 +1,164 @@
+import hashlib
+import math
+import time
+from datetime import UTC, datetime, timedelta
+from threading import Lock
+from uuid import uuid4
+
+from config import settings
+from django.core.cache import caches
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from domain.constants import REFRESH_TOKEN_LIFETIME
+from domain.models.revoked_token import RevokedToken
+from domain.ports.revocation_index import AbstractRevocationIndex
+from domain.value_objects.common import Id
+from domain.value_objects.token import RefreshPayload
+
+
+class BloomFilter:
+    """A set answering "maybe" or "no" in a fixed amount of memory, a wrong "maybe" happens at `error_rate`."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self._size: int = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hash_count: int = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray(math.ceil(self._size / 8))
+
+    def _positions(self, key: str) -> list[int]:
+        # Double hashing, every position is derived from the two halves of a single digest.
+        digest: bytes = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self._size for i in range(self._hash_count)]
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class BloomRevocationIndex(AbstractRevocationIndex):
+    """
+    Keeps a bloom filter of the revoked tokens in the process, so a token that is not revoked is accepted without
+    a query. A match is confirmed by the table, the filter only has false positives.
+    Revoking marks the token in the shared cache, which is checked before the filter, so every process rejects it
+    at once. It also replaces a version there, every process then loads the recent rows into its filter.
+    """
+
+    _version_key = "revoked_tokens:version"
+    # Rows become visible on commit but are stamped on insert, recent rows are loaded again to catch slow commits.
+    _load_margin = timedelta(minutes=5)
+
+    def __init__(self, capacity: int, rebuild_interval: int, alias: str = "default"):
+        """
+        :param capacity: Revoked tokens the filter is sized for, it grows with the table when it is rebuilt.
+        :param rebuild_interval: Seconds after which the filter is rebuilt without the expired tokens.
+        """
+        self._capacity = capacity
+        self._rebuild_interval = rebuild_interval
+        self._alias = alias
+        self._filter = BloomFilter(capacity)
+        self._version: str | None = None
+        self._loaded_at: datetime | None = None
+        self._built_at: float | None = None
+        self._lock = Lock()
+
+    @staticmethod
+    def _token_key(jti: str) -> str:
+        return f"jti:{jti}"
+
+    @staticmethod
+    def _user_key(user_id: int) -> str:
+        return f"user:{user_id}"
+
+    @staticmethod
+    def _mark_key(key: str) -> str:
+        return f"revoked_tokens:{key}"
+
+    def _get_version(self) -> str:
+        cache = caches[self._alias]
+        version: str | None = cache.get(self._version_key)
+        if version is None:
+            # Another process may create the version at the same time, the first one wins.
+            cache.add(self._version_key, uuid4().hex, timeout=None)
+            version = cache.get(self._version_key)
+        return version
+
+    def _publish(self, key: str, timeout: int) -> None:
+        """
+        Marks the revoked key until the tokens it revokes expire and makes other processes load the new rows.
+        Inside a transaction the mark waits for the commit, a revocation that is rolled back must not be seen.
+        """
+        cache = caches[self._alias]
+
+        def mark() -> None:
+            cache.set(self._mark_key(key), True, timeout=max(1, timeout))
+            cache.set(self._version_key, uuid4().hex, timeout=None)
+
+        cache.set(self._version_key, uuid4().hex, timeout=None)
+        transaction.on_commit(mark)
+
+    def _sync(self) -> BloomFilter:
+        # The version is read before loading, rows revoked during the load are loaded again on the next check.
+        version: str = self._get_version()
+        with self._lock:
+            if self._built_at is None or time.monotonic() - self._built_at >= self._rebuild_interval:
+                self._rebuild()
+            elif version != self._version:
+                self._load_recent()
+            self._version = version
+            return self._filter
+
+    def _rebuild(self) -> None:
+        loaded_at = datetime.now(UTC)
+        rows: list[tuple[str | None, int]] = list(
+            RevokedToken.objects.filter(expires_at__gt=loaded_at).values_list("jti", "user_id")
+        )
+        bloom_filter = BloomFilter(max(self._capacity, 2 * len(rows)))
+        for jti, user_id in rows:
+            bloom_filter.add(self._token_key(jti) if jti else self._user_key(user_id))
+        self._filter, self._loaded_at, self._built_at = bloom_filter, loaded_at, time.monotonic()
+
+    def _load_recent(self) -> None:
+        loaded_at = datetime.now(UTC)
+        rows = RevokedToken.objects.filter(revoked_at__gte=self._loaded_at - self._load_margin)
+        for jti, user_id in rows.values_list("jti", "user_id"):
+            self._filter.add(self._token_key(jti) if jti else self._user_key(user_id))
+        self._loaded_at = loaded_at
+
+    def is_revoked(self, payload: RefreshPayload) -> bool:
+        token_key, user_key = self._token_key(payload.jti), self._user_key(int(payload.sub))
+        # Revocations of other processes may not have reached the filter yet, their marks are shared at once.
+        if caches[self._alias].get_many([self._mark_key(token_key), self._mark_key(user_key)]):
+            return True
+        bloom_filter: BloomFilter = self._sync()
+        if token_key not in bloom_filter and user_key not in bloom_filter:
+            return False
+        return RevokedToken.objects.filter(Q(jti=payload.jti) | Q(user_id=int(payload.sub), jti__isnull=True)).exists()
+
+    def revoke(self, payload: RefreshPayload) -> bool:
+        try:
+            with transaction.atomic():
+                RevokedToken.objects.create(
+                    jti=payload.jti, user_id=int(payload.sub), expires_at=datetime.fromtimestamp(payload.exp, UTC)
+                )
+        except IntegrityError:
+            return False
+        with self._lock:
+            self._filter.add(self._token_key(payload.jti))
+        self._publish(self._token_key(payload.jti), timeout=math.ceil(payload.exp - time.time()))
+        return True
+
+    def revoke_user(self, user_id: Id) -> None:
+        RevokedToken.objects.create(
+            user_id=user_id.value, expires_at=datetime.now(UTC) + timedelta(seconds=REFRESH_TOKEN_LIFETIME)
+        )
+        with self._lock:
+            self._filter.add(self._user_key(user_id.value))
+        self._publish(self._user_key(user_id.value), timeout=REFRESH_TOKEN_LIFETIME)
+
+
+revocation_index = BloomRevocationIndex(
+    capacity=settings.REVOKED_TOKENS_CAPACITY, rebuild_interval=settings.REVOKED_TOKENS_REBUILD_INTERVAL
+)
@@ -0,0 +1,61 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from config import settings
+from domain.ports.token_verifier import AbstractAccessTokenVerifier
+from domain.services.auth import TokenService
+from domain.value_objects.token import AccessPayload, AccessTokenVo
+
+
+class CachedAccessTokenVerifier(AbstractAccessTokenVerifier):
+    """Decodes a token once, its payload is then served from a bounded LRU cache until the token expires."""
+
+    def __init__(self, token_service: TokenService, max_size: int):
+        self._token_service = token_service
+        self._max_size = max_size
+        # Keyed by the signature, the whole token is kept to make sure a hit is the very same token.
+        self._entries: OrderedDict[str, tuple[str, AccessPayload]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def verify(self, token: AccessTokenVo) -> AccessPayload:
+        """
+        :raises TokenExpiredException:
+        :raises InvalidTokenException: If token verification fails.
+        """
+        signature: str = token.value.rpartition(".")[2]
+        with self._lock:
+            entry = self._entries.get(signature)
+            if entry is not None:
+                cached_token, payload = entry
+                # PyJWT rejects a token from the second of its `exp` on.
+                if cached_token == token.value and payload.exp > time.time():
+                    self._entries.move_to_end(signature)
+                    self._hits += 1
+                    return payload
+                del self._entries[signature]
+            self._misses += 1
+
+        # Invalid and expired tokens raise here and are never cached.
+        payload = self._token_service.verify_access(token)
+        with self._lock:
+            self._entries[signature] = (token.value, payload)
+            self._entries.move_to_end(signature)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return payload
+
+
+access_token_verifier = CachedAccessTokenVerifier(
+    token_service=TokenService(secret_key=settings.SECRET_KEY), max_size=settings.ACCESS_TOKEN_CACHE_MAX_SIZE
+)
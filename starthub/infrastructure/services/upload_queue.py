@@ -0,0 +1,194 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from tempfile import SpooledTemporaryFile
+from threading import Lock
+from typing import IO, Callable, cast
+
+from config import settings
+from django.db import connections, transaction
+from domain.constants import MEGABYTE
+from domain.ports.cloud_storage import AbstractCloudStorage
+from domain.ports.upload_queue import AbstractUploadQueue
+from domain.utils.file_stream import FileStream
+from domain.value_objects.cloud_storage import CloudStorageDeletePayload, CloudStorageUploadPayload
+from infrastructure.cloud_storages.factory import cloud_storage
+from loguru import logger
+
+
+@dataclass
+class _UploadBatch:
+    on_success: Callable[[], None]
+    on_failure: Callable[[], None]
+    remaining: int
+    uploaded_paths: list[str] = field(default_factory=list)
+    failed: bool = False
+    lock: Lock = field(default_factory=Lock)
+
+
+class ThreadPoolUploadQueue(AbstractUploadQueue):
+    def __init__(
+        self,
+        cloud_storage: AbstractCloudStorage,
+        max_workers: int,
+        max_attempts: int = 3,
+        retry_delay: float = 1.0,
+        spool_size: int = MEGABYTE,
+    ):
+        """
+        :param retry_delay: Delay in seconds before the second attempt, it doubles after every failed attempt.
+        :param spool_size: Staged files larger than it are kept on disk instead of memory.
+        """
+        self._cloud_storage = cloud_storage
+        self._spool_size = spool_size
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="upload")
+        self._futures: set[Future[None]] = set()
+        self._futures_lock = Lock()
+
+    def enqueue(
+        self,
+        payload: CloudStorageUploadPayload,
+        on_success: Callable[[], None],
+        on_failure: Callable[[], None],
+    ) -> None:
+        self.enqueue_many([payload], on_success=on_success, on_failure=on_failure)
+
+    def enqueue_many(
+        self,
+        payloads: list[CloudStorageUploadPayload],
+        on_success: Callable[[], None],
+        on_failure: Callable[[], None],
+    ) -> None:
+        if not payloads:
+            return
+        staged_payloads: list[CloudStorageUploadPayload] = [
+            CloudStorageUploadPayload(file=self._stage(payload.file), file_path=payload.file_path)
+            for payload in payloads
+        ]
+        transaction.on_commit(lambda: self._submit(staged_payloads, on_success, on_failure))
+
+    def enqueue_processing(
+        self,
+        files: list[FileStream],
+        prepare: Callable[[list[FileStream]], list[CloudStorageUploadPayload]],
+        on_success: Callable[[], None],
+        on_failure: Callable[[], None],
+    ) -> None:
+        staged_files: list[FileStream] = [self._stage(file) for file in files]
+        transaction.on_commit(
+            lambda: self._track(self._executor.submit(self._process, staged_files, prepare, on_success, on_failure))
+        )
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Blocks until every submitted upload is finished, including the ones submitted meanwhile."""
+        deadline: float | None = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._futures_lock:
+                futures = list(self._futures)
+            if not futures or (deadline is not None and time.monotonic() >= deadline):
+                return
+            wait(futures, timeout=None if deadline is None else deadline - time.monotonic())
+
+    def _stage(self, file: FileStream) -> FileStream:
+        """Copies the file in chunks, files uploaded with a request are closed once the response is sent."""
+        staged_file = SpooledTemporaryFile(max_size=self._spool_size)
+        for chunk in file.chunks():
+            staged_file.write(chunk)
+        return FileStream(cast(IO[bytes], staged_file), size=file.size)
+
+    def _process(
+        self,
+        files: list[FileStream],
+        prepare: Callable[[list[FileStream]], list[CloudStorageUploadPayload]],
+        on_success: Callable[[], None],
+        on_failure: Callable[[], None],
+    ) -> None:
+        try:
+            payloads: list[CloudStorageUploadPayload] = prepare(files)
+        except Exception as e:
+            logger.exception(f"Failed to prepare the uploads: {e}")
+            try:
+                on_failure()
+            except Exception as e:
+                logger.exception(f"Error in upload callback: {e}")
+        else:
+            self._submit(payloads, on_success, on_failure)
+        finally:
+            for file in files:
+                file.close()
+            connections.close_all()
+
+    def _submit(
+        self,
+        payloads: list[CloudStorageUploadPayload],
+        on_success: Callable[[], None],
+        on_failure: Callable[[], None],
+    ) -> None:
+        batch = _UploadBatch(on_success=on_success, on_failure=on_failure, remaining=len(payloads))
+        for payload in payloads:
+            self._track(self._executor.submit(self._upload, batch, payload))
+
+    def _track(self, future: Future[None]) -> None:
+        with self._futures_lock:
+            self._futures.add(future)
+        future.add_done_callback(self._discard)
+
+    def _discard(self, future: Future[None]) -> None:
+        with self._futures_lock:
+            self._futures.discard(future)
+
+    def _upload(self, batch: _UploadBatch, payload: CloudStorageUploadPayload) -> None:
+        try:
+            uploaded: bool = self._upload_with_retry(payload)
+            with batch.lock:
+                if uploaded:
+                    batch.uploaded_paths.append(payload.file_path)
+                else:
+                    batch.failed = True
+                batch.remaining -= 1
+                is_last: bool = batch.remaining == 0
+            if is_last:
+                self._finish(batch)
+        except Exception as e:
+            logger.exception(f"Error in upload callback for {payload.file_path}: {e}")
+        finally:
+            payload.file.close()
+            # Callbacks write to the database from this worker thread.
+            connections.close_all()
+
+    def _upload_with_retry(self, payload: CloudStorageUploadPayload) -> bool:
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                self._cloud_storage.upload_file(payload)
+            except Exception as e:
+                logger.warning(f"Upload of {payload.file_path} failed, attempt {attempt}/{self._max_attempts}: {e}")
+                if attempt < self._max_attempts:
+                    time.sleep(self._retry_delay * 2 ** (attempt - 1))
+            else:
+                logger.info(f"File {payload.file_path} uploaded.")
+                return True
+
+        logger.error(f"Upload of {payload.file_path} failed after {self._max_attempts} attempts.")
+        return False
+
+    def _finish(self, batch: _UploadBatch) -> None:
+        if not batch.failed:
+            batch.on_success()
+            return
+
+        for file_path in batch.uploaded_paths:
+            try:
+                self._cloud_storage.delete_file(CloudStorageDeletePayload(file_path=file_path))
+                logger.info(f"Uploaded file {file_path} of the failed batch deleted.")
+            except Exception as e:
+                logger.error(f"Failed to delete {file_path} of the failed batch: {e}")
+        batch.on_failure()
+
+
+upload_queue = ThreadPoolUploadQueue(
+    cloud_storage=cloud_storage,
+    max_workers=settings.UPLOAD_QUEUE_WORKERS,
+    max_attempts=settings.UPLOAD_QUEUE_MAX_ATTEMPTS,
+)
@@ -0,0 +1,48 @@
+from application.dto.auth import AccessPayloadDto
+from application.services.gateway import gateway
+from domain.enums.token import TokenNameEnum
+from domain.exceptions.auth import InvalidTokenException
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.request import Request
+
+
+class AccessTokenUser:
+    """The owner of an access token, built from the token alone without querying the database."""
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, payload: AccessPayloadDto):
+        self.id = int(payload.sub)
+        self.email = payload.email
+
+    def __repr__(self) -> str:
+        return f"AccessTokenUser(id={self.id})"
+
+
+class AccessTokenAuthentication(BaseAuthentication):
+    """
+    Authenticates a request by its access token cookie, `request.auth` is then the token payload.
+    A missing or invalid token leaves the request anonymous, so public views and token reissue keep working.
+    """
+
+    def authenticate(self, request: Request) -> tuple[AccessTokenUser, AccessPayloadDto] | None:
+        if not request.COOKIES.get(TokenNameEnum.ACCESS_TOKEN):
+            return None
+        try:
+            access_payload_dto: AccessPayloadDto = gateway.auth_app_service.verify_access(request.COOKIES)
+        except InvalidTokenException:
+            return None
+        return AccessTokenUser(access_payload_dto), access_payload_dto
+
+
+def get_access_payload_dto(request: Request) -> AccessPayloadDto:
+    """
+    :raises MissingAccessTokenException:
+    :raises InvalidTokenException:
+    :raises TokenExpiredException:
+    """
+    if isinstance(request.auth, AccessPayloadDto):
+        return request.auth
+    # Verifies the token again to raise the reason it was rejected by the authentication.
+    return gateway.auth_app_service.verify_access(request.COOKIES)
@@ -59,3 +59,5 @@ APPLICATION_ERROR_CODES: dict[type, tuple[str, int]] = {
     MissingRequiredFieldException: ("MISSING_REQUIRED_FIELD", 400),
 }
 SUCCESS = "SUCCESS"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
@@ -0,0 +1,30 @@
+import dataclasses
+from datetime import date
+from typing import Any
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class DtoJSONEncoder(JSONEncoder):
+    """
+    Encodes the dataclasses of `application.dto` as objects of their fields without `asdict`, which deep-copies
+    every value before it is encoded. Nested dataclasses reach the encoder the same way.
+    """
+
+    def default(self, obj: Any) -> Any:
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            # The instance dict holds exactly the fields, slotted dataclasses have none.
+            if hasattr(obj, "__dict__"):
+                return obj.__dict__
+            return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+        # Dates are the most common value besides the json types, they skip the checks of the base encoder.
+        if type(obj) is date:
+            return obj.isoformat()
+        return super().default(obj)
+
+
+class DtoJSONRenderer(JSONRenderer):
+    """The JSON renderer of the views, they respond with the dto as it is."""
+
+    encoder_class = DtoJSONEncoder
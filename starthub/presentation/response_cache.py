@@ -0,0 +1,72 @@
+import hashlib
+import json
+from collections.abc import Iterator
+from functools import wraps
+from typing import Any, Callable
+from urllib.parse import urlencode
+
+from django.utils.http import parse_etags
+from domain.enums.response_scope import ResponseScopeEnum
+from infrastructure.services.response_cache import CachedResponse, response_cache
+from presentation.renderers import DtoJSONEncoder
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+ViewMethod = Callable[..., Response]
+
+
+def _request_key(request: Request) -> str:
+    """The path with the sorted query params and the media type, which decides how the response is rendered."""
+    query: str = urlencode(sorted(request.query_params.lists()), doseq=True)
+    return f"{request.path}?{query}|{request.accepted_media_type}"
+
+
+def _create_etag(data: Any, media_type: str) -> str:
+    """A strong ETag, equal data rendered as the same media type gives the same bytes."""
+    body: str = json.dumps(data, cls=DtoJSONEncoder, sort_keys=True, separators=(",", ":"))
+    return f'"{hashlib.sha256(f"{media_type}|{body}".encode()).hexdigest()[:32]}"'
+
+
+def _is_not_modified(request: Request, etag: str) -> bool:
+    # If-None-Match compares weakly, a weak tag of the same value matches too.
+    etags: list[str] = parse_etags(request.headers.get("If-None-Match", ""))
+    return "*" in etags or etag in (tag.removeprefix("W/") for tag in etags)
+
+
+def cache_response(*scopes: ResponseScopeEnum) -> Callable[[ViewMethod], ViewMethod]:
+    """
+    Caches the successful responses of a public GET method until a scope they are built from changes,
+    answers with a 304 when the client already has the response.
+    """
+
+    def decorator(method: ViewMethod) -> ViewMethod:
+        @wraps(method)
+        def wrapper(view: APIView, request: Request, *args: Any, **kwargs: Any) -> Response:
+            # Some views read GET parameters from the body, such requests are not cached.
+            if int(request.META.get("CONTENT_LENGTH") or 0):
+                return method(view, request, *args, **kwargs)
+
+            key: str = _request_key(request)
+            stamp: str = response_cache.get_stamp(scopes)
+            cached: CachedResponse | None = response_cache.get(key, stamp)
+            if cached is None:
+                response: Response = method(view, request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+                # Views may return iterators, they are read once.
+                data: Any = list(response.data) if isinstance(response.data, Iterator) else response.data
+                cached = CachedResponse(
+                    etag=_create_etag(data, request.accepted_media_type), data=data, headers=dict(response.items())
+                )
+                response_cache.set(key, stamp, cached)
+
+            headers: dict[str, str] = {**cached.headers, "ETag": cached.etag}
+            if _is_not_modified(request, cached.etag):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+            return Response(cached.data, status=status.HTTP_200_OK, headers=headers)
+
+        return wrapper
+
+    return decorator
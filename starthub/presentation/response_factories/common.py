@@ -3,6 +3,7 @@ from typing import cast
 
 import pydantic
 from domain.exceptions.auth import InvalidCredentialsException, PasswordValidationException
+from domain.exceptions.cloud_storage import FileNotFoundCloudStorageException, InvalidSignatureCloudStorageException
 from domain.exceptions.company import BusinessNumberAlreadyExistsException, CompanyNameIsTooLongException
 from domain.exceptions.file import (
     ImageFileTooLargeException,
@@ -13,10 +14,17 @@ from domain.exceptions.file import (
 from domain.exceptions.news import NewsContentIsTooLongException, NewsNotFoundException, NewsTitleIsTooLongException
 from domain.exceptions.permissions import AddDeniedPermissionException, UpdateDeniedPermissionException
 from domain.exceptions.project_management import (
+    InvalidProjectCursorException,
+    InvalidProjectFieldsException,
+    InvalidProjectSearchException,
+    InvalidProjectSortException,
     InvalidProjectStageException,
     InvalidProjectStatusException,
+    InvalidProjectViewException,
     ProjectImageMaxAmountException,
     ProjectNotFoundException,
+    ProjectPlanNotFoundException,
+    ProjectPlanNotReadyException,
 )
 from domain.exceptions.user import EmailAlreadyExistsException, UserPhoneAlreadyExistException
 from domain.exceptions.user_favorite import UserFavoriteAlreadyExistsException
@@ -63,11 +71,18 @@ class ProjectErrorResponseFactory(CommonErrorResponseFactory):
         CompanyNameIsTooLongException: ("COMPANY_NAME_TOO_LONG", 422),
         DateInFutureException: ("DATE_IN_FUTURE_NOT_ALLOWED", 422),
         ProjectNotFoundException: ("PROJECT_NOT_FOUND", 404),
+        ProjectPlanNotFoundException: ("PROJECT_PLAN_NOT_FOUND", 404),
+        ProjectPlanNotReadyException: ("PROJECT_PLAN_NOT_READY", 409),
         PdfFileTooLargeException: ("PDF_FILE_TOO_LARGE", 412),
         ProjectImageMaxAmountException: ("PROJECT_IMAGES_LIMIT_REACHED", 409),
         UpdateDeniedPermissionException: ("UPDATE_PERMISSION_DENIED", 403),
         InvalidProjectStatusException: ("INVALID_STATUS", 422),
         InvalidProjectStageException: ("INVALID_STAGE", 422),
+        InvalidProjectSortException: ("INVALID_SORT", 422),
+        InvalidProjectCursorException: ("INVALID_CURSOR", 400),
+        InvalidProjectSearchException: ("INVALID_SEARCH", 422),
+        InvalidProjectViewException: ("INVALID_VIEW", 422),
+        InvalidProjectFieldsException: ("INVALID_FIELDS", 422),
     }
 
 
@@ -122,3 +137,10 @@ class NewsErrorResponseFactory(CommonErrorResponseFactory):
         pydantic.ValidationError: ("INVALID_DATA_TYPE", 400),
         NewsNotFoundException: ("NEWS_NOT_FOUND", 404),
     }
+
+
+class CloudStorageErrorResponseFactory(CommonErrorResponseFactory):
+    error_codes = CommonErrorResponseFactory.error_codes | {
+        InvalidSignatureCloudStorageException: ("INVALID_SIGNATURE", 403),
+        FileNotFoundCloudStorageException: ("FILE_NOT_FOUND", 404),
+    }
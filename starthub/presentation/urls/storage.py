@@ -0,0 +1,4 @@
+from django.urls import path
+from presentation.views.storage import LocalStorageFileView
+
+urlpatterns = [path("<path:file_path>", LocalStorageFileView.as_view())]
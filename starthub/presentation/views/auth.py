@@ -1,10 +1,11 @@
-from dataclasses import asdict
 from typing import cast
 
-from application.dto.auth import AccessPayloadDto, AccessTokenDto, TokenPairDto
+from application.dto.auth import AccessPayloadDto, TokenPairDto
 from application.ports.cookie_service import CookiesResponseProtocol
 from application.services.gateway import gateway
+from domain.enums.token import TokenNameEnum
 from loguru import logger
+from presentation.authentication import get_access_payload_dto
 from presentation.constants import SUCCESS
 from presentation.response_factories.common import (
     CommonErrorResponseFactory,
@@ -65,14 +66,18 @@ class ReissueAccessTokenView(APIView):
     def post(self, request: Request) -> Response:
         logger.debug("POST /auth/reissue-access/")
         try:
-            access_token_dto: AccessTokenDto = gateway.auth_app_service.reissue_access(request.COOKIES)
+            token_pair_dto: TokenPairDto = gateway.auth_app_service.reissue(request.COOKIES)
         except self.error_classes as e:
             return CommonErrorResponseFactory.create_response(e)
 
         response = Response(data={"detail": "success", "code": SUCCESS}, status=200)
         gateway.cookie_service.set_access_token_to_cookies(
-            cast(CookiesResponseProtocol, response), access_token_dto.access_token
+            cast(CookiesResponseProtocol, response), token_pair_dto.access_token
         )
+        if token_pair_dto.refresh_token != request.COOKIES.get(TokenNameEnum.REFRESH_TOKEN):
+            gateway.cookie_service.set_refresh_token_to_cookies(
+                cast(CookiesResponseProtocol, response), token_pair_dto.refresh_token
+            )
         logger.debug("Access token has set to cookies")
         return response
 
@@ -83,11 +88,11 @@ class AccessVerifyView(APIView):
     def post(self, request: Request) -> Response:
         logger.debug("POST /auth/verify-access/")
         try:
-            access_payload_dto: AccessPayloadDto = gateway.auth_app_service.verify_access(request.COOKIES)
+            access_payload_dto: AccessPayloadDto = get_access_payload_dto(request)
         except self.error_classes as e:
             return CommonErrorResponseFactory.create_response(e)
 
-        return Response(asdict(access_payload_dto), status=status.HTTP_200_OK)
+        return Response(access_payload_dto, status=status.HTTP_200_OK)
 
 
 class LogoutView(APIView):
@@ -96,6 +101,7 @@ class LogoutView(APIView):
     def post(self, request: Request) -> Response:
         logger.info("POST /auth/logout/")
         try:
+            gateway.auth_app_service.logout(request.COOKIES)
             response = Response({"detail": SUCCESS}, status.HTTP_200_OK)
             gateway.cookie_service.remove_access_token_from_cookies(response=cast(CookiesResponseProtocol, response))
             gateway.cookie_service.remove_refresh_token_from_cookies(response=cast(CookiesResponseProtocol, response))
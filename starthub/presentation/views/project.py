@@ -1,17 +1,21 @@
-from dataclasses import asdict
-
 from application.dto.auth import AccessPayloadDto
-from application.dto.project import ProjectDto
+from application.dto.project import ProjectDto, ProjectPageDto
 from application.service_factories.app_service.project import ProjectAppServiceFactory
 from application.services.gateway import gateway
 from application.services.project import ProjectAppService
-from application.utils.get_access_payload_dto import get_access_payload_dto
+from domain.enums.response_scope import ResponseScopeEnum
 from domain.exceptions.auth import InvalidTokenException
-from domain.exceptions.project_management import ProjectNotFoundException
+from domain.exceptions.project_management import (
+    ProjectNotFoundException,
+    ProjectPlanNotFoundException,
+    ProjectPlanNotReadyException,
+)
 from domain.exceptions.validation import ValidationException
 from domain.models.project import Project
 from loguru import logger
-from presentation.constants import SUCCESS
+from presentation.authentication import get_access_payload_dto
+from presentation.constants import NEXT_CURSOR_HEADER, SUCCESS, TOTAL_COUNT_HEADER
+from presentation.response_cache import cache_response
 from presentation.response_factories.common import ProjectErrorResponseFactory
 from rest_framework import status
 from rest_framework.parsers import MultiPartParser
@@ -24,26 +28,33 @@ class ProjectView(APIView):
     parser_classes = [MultiPartParser]
     error_classes: tuple[type[Exception], ...] = tuple(ProjectErrorResponseFactory.error_codes.keys())
 
+    @cache_response(ResponseScopeEnum.PROJECTS)
     def get(self, request: Request, project_id: int | None = None) -> Response:
         logger.info("GET project request", project_id=project_id, query_params=request.query_params)
 
         try:
             if project_id:
                 project: ProjectDto = gateway.project_app_service.get_by_id(project_id=project_id)
-                return Response(asdict(project), status=status.HTTP_200_OK)
+                return Response(project, status=status.HTTP_200_OK)
 
-            projects: list[ProjectDto] = gateway.project_app_service.get(request.query_params)
+            project_page: ProjectPageDto = gateway.project_app_service.get(request.query_params)
         except self.error_classes as e:
             logger.error(f"Exception: {e}")
             return ProjectErrorResponseFactory.create_response(e)
 
-        return Response(map(asdict, projects), status=status.HTTP_200_OK)
+        # The body stays a list for the clients written before cursors, the page position goes into headers.
+        headers: dict[str, str] = dict()
+        if project_page.next_cursor is not None:
+            headers[NEXT_CURSOR_HEADER] = project_page.next_cursor
+        if project_page.total is not None:
+            headers[TOTAL_COUNT_HEADER] = str(project_page.total)
+        return Response(project_page.results, status=status.HTTP_200_OK, headers=headers)
 
     def post(self, request: Request) -> Response:
         logger.info(f"request_data = {request.data} \n\t {type(request.data)=}")
         logger.info(f"request files = {request.FILES} \n\t {type(request.FILES)=}")
         try:
-            access_dto = get_access_payload_dto(request.COOKIES)
+            access_dto = get_access_payload_dto(request)
             project: Project = gateway.project_app_service.create(
                 data=request.data, files=request.FILES, user_id=int(access_dto.sub)
             )
@@ -56,7 +67,7 @@ class ProjectView(APIView):
     def patch(self, request: Request, project_id: int) -> Response:
         logger.debug(f"request.data = {request.data}")
         try:
-            access_dto: AccessPayloadDto = get_access_payload_dto(request.COOKIES)
+            access_dto: AccessPayloadDto = get_access_payload_dto(request)
             gateway.project_app_service.update(request.data, request.FILES, project_id, user_id=int(access_dto.sub))
             return Response({"detail": "updated successfully.", "code": SUCCESS}, status=status.HTTP_200_OK)
 
@@ -66,7 +77,7 @@ class ProjectView(APIView):
 
     def delete(self, request: Request, project_id: int) -> Response:
         try:
-            access_dto = get_access_payload_dto(request.COOKIES)
+            access_dto = get_access_payload_dto(request)
         except (ValidationException, InvalidTokenException) as e:
             return Response({"detail": str(e), "code": "UNAUTHORIZED"}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -92,6 +103,8 @@ class ProjectPlanView(APIView):
             return Response({"plan_url": plan_url, "code": SUCCESS}, status=status.HTTP_200_OK)
         except ProjectNotFoundException:
             return Response({"detail": f"Project with id = {project_id} not found."}, status=status.HTTP_404_NOT_FOUND)
+        except (ProjectPlanNotFoundException, ProjectPlanNotReadyException) as e:
+            return ProjectErrorResponseFactory.create_response(e)
 
 
 class ProjectImageView(APIView):
@@ -101,7 +114,7 @@ class ProjectImageView(APIView):
         logger.info(f"POST project photo request.\n\t {project_id=}")
 
         try:
-            access_dto: AccessPayloadDto = get_access_payload_dto(request.COOKIES)
+            access_dto: AccessPayloadDto = get_access_payload_dto(request)
             gateway.project_app_service.upload_project_image(
                 files=request.FILES, project_id=project_id, user_id=int(access_dto.sub)
             )
@@ -124,7 +137,7 @@ class ProjectImageView(APIView):
         logger.info(f"GET /projects/images/ \n\t {project_id=}\n\t {image_order=}")
 
         try:
-            access_dto: AccessPayloadDto = get_access_payload_dto(request.COOKIES)
+            access_dto: AccessPayloadDto = get_access_payload_dto(request)
             gateway.project_app_service.delete_image(
                 project_id=project_id,
                 image_order=image_order,
@@ -138,7 +151,7 @@ class ProjectImageView(APIView):
     def patch(self, request: Request, project_id: int) -> Response:
         logger.info(f"PATCH /projects/images/ \n\t {request.data=}")
         try:
-            access_dto: AccessPayloadDto = get_access_payload_dto(request.COOKIES)
+            access_dto: AccessPayloadDto = get_access_payload_dto(request)
             gateway.project_app_service.update_project_images(
                 request.data, project_id=project_id, user_id=int(access_dto.sub)
             )
@@ -0,0 +1,34 @@
+import mimetypes
+
+from application.services.gateway import gateway
+from django.http import FileResponse
+from domain.exceptions.cloud_storage import FileNotFoundCloudStorageException
+from loguru import logger
+from presentation.response_factories.common import CloudStorageErrorResponseFactory
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class LocalStorageFileView(APIView):
+    """Serves files of the local cloud storage backends by the urls they sign."""
+
+    error_classes: tuple[type[Exception], ...] = tuple(CloudStorageErrorResponseFactory.error_codes.keys())
+
+    def get(self, request: Request, file_path: str) -> FileResponse | Response:
+        logger.debug(f"GET /storage/<file_path> \t file_path = {file_path}")
+        try:
+            local_cloud_storage = gateway.local_cloud_storage
+            if local_cloud_storage is None:
+                raise FileNotFoundCloudStorageException(f"A file {file_path} not found in cloud storage.")
+            file = local_cloud_storage.open_signed_file(
+                file_path,
+                expires=request.query_params.get("expires", ""),
+                signature=request.query_params.get("signature", ""),
+            )
+        except self.error_classes as e:
+            logger.error(f"Exception: {repr(e)}")
+            return CloudStorageErrorResponseFactory.create_response(e)
+
+        content_type, _ = mimetypes.guess_type(file_path)
+        return FileResponse(file, content_type=content_type or "application/octet-stream")
@@ -1,11 +1,11 @@
-from dataclasses import asdict
-
 from application.dto.auth import AccessPayloadDto
 from application.dto.user import UserFavoriteDto, UserProfileDto
 from application.services.gateway import gateway
-from application.utils.get_access_payload_dto import get_access_payload_dto
+from domain.enums.response_scope import ResponseScopeEnum
 from loguru import logger
+from presentation.authentication import get_access_payload_dto
 from presentation.constants import SUCCESS
+from presentation.response_cache import cache_response
 from presentation.response_factories.common import UserErrorResponseFactory, UserFavoriteErrorResponseFactory
 from rest_framework import status
 from rest_framework.parsers import MultiPartParser
@@ -17,9 +17,10 @@ from rest_framework.views import APIView
 class UserView(APIView):
     error_classes: tuple[type[Exception], ...] = tuple(UserErrorResponseFactory.error_codes.keys())
 
+    @cache_response(ResponseScopeEnum.USERS)
     def get(self, request: Request, user_id: int) -> Response:
         try:
-            return Response(asdict(gateway.user_app_service.get_user_profile(user_id)), status=status.HTTP_200_OK)
+            return Response(gateway.user_app_service.get_user_profile(user_id), status=status.HTTP_200_OK)
         except self.error_classes as e:
             logger.exception(f"Exception: {repr(e)}")
             return UserErrorResponseFactory.create_response(e)
@@ -31,7 +32,7 @@ class MeView(APIView):
 
     def patch(self, request: Request) -> Response:
         try:
-            access_dto: AccessPayloadDto = get_access_payload_dto(request.COOKIES)
+            access_dto: AccessPayloadDto = get_access_payload_dto(request)
             gateway.user_app_service.update_user(request.data, request.FILES, int(access_dto.sub))
             return Response({"detail": "success", "code": SUCCESS}, status=status.HTTP_200_OK)
         except self.error_classes as e:
@@ -40,11 +41,11 @@ class MeView(APIView):
 
     def get(self, request: Request) -> Response:
         try:
-            access_dto: AccessPayloadDto = get_access_payload_dto(request.COOKIES)
+            access_dto: AccessPayloadDto = get_access_payload_dto(request)
             user_profile_dto: UserProfileDto = gateway.user_app_service.get_user_own_profile(
                 user_id=int(access_dto.sub)
             )
-            return Response(asdict(user_profile_dto), status=status.HTTP_200_OK)
+            return Response(user_profile_dto, status=status.HTTP_200_OK)
         except self.error_classes as e:
             logger.error(f"Exception: {repr(e)}")
             return UserErrorResponseFactory.create_response(e)
@@ -55,18 +56,18 @@ class MeFavoriteProjectsView(APIView):
 
     def get(self, request: Request) -> Response:
         try:
-            access_dto: AccessPayloadDto = get_access_payload_dto(request.COOKIES)
+            access_dto: AccessPayloadDto = get_access_payload_dto(request)
             user_favorites: list[UserFavoriteDto] = gateway.user_favorite_app_service.get_user_favorites(
                 user_id=int(access_dto.sub)
             )
-            return Response(map(asdict, user_favorites), status=status.HTTP_200_OK)
+            return Response(user_favorites, status=status.HTTP_200_OK)
         except self.error_classes as e:
             logger.error(f"Exception: {repr(e)}")
             return UserErrorResponseFactory.create_response(e)
 
     def post(self, request: Request, project_id: int) -> Response:
         try:
-            access_dto: AccessPayloadDto = get_access_payload_dto(request.COOKIES)
+            access_dto: AccessPayloadDto = get_access_payload_dto(request)
             gateway.user_favorite_app_service.add_favorite(user_id=int(access_dto.sub), project_id=project_id)
             return Response({"detail": "success", "code": SUCCESS}, status=status.HTTP_201_CREATED)
 
@@ -76,7 +77,7 @@ class MeFavoriteProjectsView(APIView):
 
     def delete(self, request: Request, project_id: int) -> Response:
         try:
-            access_dto: AccessPayloadDto = get_access_payload_dto(request.COOKIES)
+            access_dto: AccessPayloadDto = get_access_payload_dto(request)
             gateway.user_favorite_app_service.delete_by_association_ids(int(access_dto.sub), project_id)
             return Response({"detail": "success", "code": SUCCESS}, status=status.HTTP_200_OK)
         except self.error_classes as e:
@@ -87,12 +88,13 @@ class MeFavoriteProjectsView(APIView):
 class UserFavoriteProjectsView(APIView):
     error_classes: tuple[type[Exception], ...] = tuple(UserFavoriteErrorResponseFactory.error_codes.keys())
 
+    @cache_response(ResponseScopeEnum.FAVORITES)
     def get(self, request: Request, user_id: int) -> Response:
         try:
             user_favorites: list[UserFavoriteDto] = gateway.user_favorite_app_service.get_user_favorites(
                 user_id=user_id
             )
-            return Response(map(asdict, user_favorites), status=status.HTTP_200_OK)
+            return Response(user_favorites, status=status.HTTP_200_OK)
         except self.error_classes as e:
             logger.error(f"Exception: {repr(e)}")
             return UserErrorResponseFactory.create_response(e)
@@ -1,26 +1,42 @@
 from typing import Any
 
-from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.core.management.base import BaseCommand, CommandParser
 from django.db.models import QuerySet
-from domain.enums.role import RoleEnum
-from domain.models.role import Role
+from domain.models.role import get_default_role_id
 from domain.models.user import User
+from infrastructure.services.permission_cache import permission_cache
 
 
 class Command(BaseCommand):
     help = 'Assigns "user" role only to users with NO roles at all'
 
-    def handle(self, *args: Any, **options: Any) -> None:
-
-        user_role, _ = Role.objects.get_or_create(name=RoleEnum.get_default())
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument("--dry-run", action="store_true", help="Only counts the users without roles.")
 
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size: int = options["batch_size"]
+        role_id: int = get_default_role_id()
         users_without_any_roles: QuerySet[User] = User.objects.filter(roles__isnull=True)
         count: int = users_without_any_roles.count()
 
         if not count:
             return
+        if options["dry_run"]:
+            self.stdout.write(f"{count} users have no roles.")
+            return
 
-        with transaction.atomic():
-            for user in users_without_any_roles:
-                user.roles.add(user_role)
+        through = User.roles.through
+        assigned, last_user_id = 0, 0
+        # Every batch is a select of ids and a single insert committed on its own, so no long transaction is held.
+        while user_ids := list(
+            users_without_any_roles.filter(id__gt=last_user_id).order_by("id").values_list("id", flat=True)[:batch_size]
+        ):
+            through.objects.bulk_create(
+                [through(user_id=user_id, role_id=role_id) for user_id in user_ids], ignore_conflicts=True
+            )
+            assigned, last_user_id = assigned + len(user_ids), user_ids[-1]
+            self.stdout.write(f"Assigned the default role to {assigned}/{count} users.")
+
+        # The inserts send no m2m_changed, the cached empty permissions are dropped at once.
+        permission_cache.invalidate_all()
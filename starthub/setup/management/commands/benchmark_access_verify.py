@@ -0,0 +1,83 @@
+import json
+import time
+from typing import Any, Callable
+
+from application.service_factories.domain_service.auth import AuthServiceFactory, TokenServiceFactory
+from application.services.auth import AuthAppService
+from config import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.http import HttpRequest, HttpResponse
+from domain.models.user import User
+from domain.ports.token_verifier import AbstractAccessTokenVerifier
+from domain.services.auth import TokenService
+from domain.value_objects.token import AccessPayload, AccessTokenVo
+from presentation.views.auth import AccessVerifyView
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+
+class TokenServiceVerifier(AbstractAccessTokenVerifier):
+    def __init__(self, token_service: TokenService):
+        self._token_service = token_service
+
+    def verify(self, token: AccessTokenVo) -> AccessPayload:
+        return self._token_service.verify_access(token)
+
+
+class PerRequestAccessVerifyView(APIView):
+    """The view as it was: services built for every request, the cookie parsed and the token decoded each time."""
+
+    authentication_classes: list[type] = list()
+
+    def post(self, request: Request) -> Response:
+        token_service: TokenService = TokenServiceFactory.create_service()
+        auth_app_service = AuthAppService(
+            auth_service=AuthServiceFactory.create_service(),
+            token_service=token_service,
+            access_token_verifier=TokenServiceVerifier(token_service),
+        )
+        return Response(auth_app_service.verify_access(request.COOKIES), status=status.HTTP_200_OK)
+
+
+class Command(BaseCommand):
+    help = "Measures requests per second of AccessVerifyView with per-request and cached token verification."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--requests", type=int, default=5000)
+        parser.add_argument("--users", type=int, default=100, help="Distinct tokens the requests are spread over.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        token_service = TokenService(secret_key=settings.SECRET_KEY)
+        tokens: list[str] = [
+            token_service.generate_access(User(id=i, email=f"user{i}@example.com")).value
+            for i in range(1, options["users"] + 1)
+        ]
+        request_factory = APIRequestFactory()
+        views: dict[str, Callable[[HttpRequest], HttpResponse]] = {
+            "per_request": PerRequestAccessVerifyView.as_view(),
+            "cached": AccessVerifyView.as_view(),
+        }
+
+        def create_request(token: str) -> HttpRequest:
+            request: HttpRequest = request_factory.post("/api/v2/auth/verify-access/")
+            request.COOKIES["access_token"] = token
+            return request
+
+        results: dict[str, dict[str, float]] = dict()
+        for name, view in views.items():
+            requests: list[HttpRequest] = [create_request(tokens[i % len(tokens)]) for i in range(options["requests"])]
+            start = time.perf_counter()
+            for request in requests:
+                response: HttpResponse = view(request)
+                if response.status_code != status.HTTP_200_OK:
+                    raise RuntimeError(f"Verification failed with status {response.status_code}.")
+            elapsed = time.perf_counter() - start
+            results[name] = {
+                "requests_per_second": round(options["requests"] / elapsed),
+                "per_request_us": round(elapsed / options["requests"] * 1_000_000, 1),
+            }
+
+        self.stdout.write(json.dumps({"requests": options["requests"], "results": results}, indent=2))
@@ -0,0 +1,83 @@
+import json
+import statistics
+import time
+from dataclasses import asdict
+from datetime import date
+from typing import Any, Callable
+
+from application.dto.project import CategoryDto, CompanyDto, CompanyFounderDto, FundingModelDto, ProjectDto
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from presentation.renderers import DtoJSONRenderer
+from rest_framework.renderers import JSONRenderer
+
+DESCRIPTION = "A long description of the project, its plans, its team and its market. " * 10
+
+
+def percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+class Command(BaseCommand):
+    help = (
+        "Renders a list of full projects as the listing responds with it: copied with asdict and rendered by "
+        "the JSON renderer of DRF, against the dto rendered as it is. Both must give the same bytes."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--projects", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=500)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        projects: list[ProjectDto] = [self._build_project(i) for i in range(options["projects"])]
+        renders: dict[str, Callable[[], bytes]] = {
+            "asdict_json_renderer": lambda: JSONRenderer().render([asdict(project) for project in projects]),
+            "dto_json_renderer": lambda: DtoJSONRenderer().render(projects),
+        }
+        bodies: set[bytes] = {render() for render in renders.values()}
+        if len(bodies) != 1:
+            raise CommandError("The renderers give different bytes.")
+
+        results: dict[str, dict[str, float]] = {
+            name: self._measure(render, options["repeat"]) for name, render in renders.items()
+        }
+        self.stdout.write(
+            json.dumps({"projects": options["projects"], "bytes": len(bodies.pop()), "results": results}, indent=2)
+        )
+
+    @staticmethod
+    def _build_project(i: int) -> ProjectDto:
+        return ProjectDto(
+            id=i,
+            name=f"Benchmark rendering project {i}",
+            slug=f"benchmark-rendering-{i}",
+            description=DESCRIPTION,
+            images=[f"https://storage.example.com/benchmark/{i}/{order}.jpg" for order in range(1, 4)],
+            category=CategoryDto(id=1, name="Benchmark category", slug="benchmark-category"),
+            company=CompanyDto(
+                name=f"Benchmark rendering company {i}",
+                slug=f"benchmark-rendering-company-{i}",
+                founder=CompanyFounderDto(name="name", surname="surname", description=DESCRIPTION),
+                country_code="ZZ",
+                business_id=f"benchmark-{i}",
+                established_date=date(2020, 1, 1),
+            ),
+            creator_id=1,
+            funding_model=FundingModelDto(id=1, name="Benchmark funding model", slug="benchmark-funding-model"),
+            goal_sum=1000.0,
+            current_sum=250.5,
+            deadline=date(2030, 1, 1),
+            stage="idea",
+            status="active",
+        )
+
+    @staticmethod
+    def _measure(render: Callable[[], bytes], repeat: int) -> dict[str, float]:
+        durations_ms: list[float] = list()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            render()
+            durations_ms.append((time.perf_counter() - start) * 1000)
+        return {
+            "p50_ms": round(percentile(durations_ms, 50), 3),
+            "p99_ms": round(percentile(durations_ms, 99), 3),
+        }
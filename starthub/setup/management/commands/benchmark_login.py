@@ -0,0 +1,75 @@
+import json
+import time
+from datetime import UTC, datetime
+from typing import Any, Callable
+
+from application.service_factories.app_service.auth import AuthAppServiceFactory
+from application.services.auth import AuthAppService
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from domain.models.user import User
+from domain.value_objects.user import Email
+
+EMAIL = "benchmark.login@example.com"
+PASSWORD = "BenchmarkPass1234"
+
+
+def login_before(credentials_raw: dict[str, str]) -> None:
+    """The login as it was: the user looked up twice and the whole row saved."""
+    User.objects.filter(email=Email(value=credentials_raw["email"]).value).first()
+    user: User | None = User.objects.filter(email=credentials_raw["email"]).first()
+    if user is None or not user.check_password(credentials_raw["password"]):
+        raise RuntimeError("The benchmark user can not log in.")
+    user.last_login = datetime.now(UTC)
+    user.save()
+
+
+class Command(BaseCommand):
+    help = "Measures logins per second, split into password hashing and database work. Nothing is left in the database."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--logins", type=int, default=50)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        logins: int = options["logins"]
+        credentials_raw: dict[str, str] = {"email": EMAIL, "password": PASSWORD}
+        auth_app_service: AuthAppService = AuthAppServiceFactory.create_service()
+
+        with transaction.atomic():
+            user: User = User.objects.create_user(
+                email=EMAIL, first_name="benchmark", last_name="benchmark", password=PASSWORD
+            )
+
+            def hash_only() -> None:
+                user.check_password(PASSWORD)
+
+            def database_only() -> None:
+                User.objects.filter(email=EMAIL).first()
+                user.last_login = datetime.now(UTC)
+                user.save(update_fields=["last_login"])
+
+            def login_after() -> None:
+                auth_app_service.login(credentials_raw)
+
+            runs: dict[str, Callable[[], None]] = {
+                "hash_only": hash_only,
+                "database_only": database_only,
+                "login_before": lambda: login_before(credentials_raw),
+                "login_after": login_after,
+            }
+            results: dict[str, dict[str, float]] = dict()
+            for name, run in runs.items():
+                with CaptureQueriesContext(connection) as context:
+                    start = time.perf_counter()
+                    for _ in range(logins):
+                        run()
+                    elapsed = time.perf_counter() - start
+                results[name] = {
+                    "logins_per_second": round(logins / elapsed, 1),
+                    "per_login_ms": round(elapsed / logins * 1000, 3),
+                    "queries_per_login": len(context.captured_queries) / logins,
+                }
+            transaction.set_rollback(True)
+
+        self.stdout.write(json.dumps({"hasher": user.password.split("$")[0], "results": results}, indent=2))
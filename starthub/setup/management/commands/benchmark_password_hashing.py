@@ -0,0 +1,84 @@
+import json
+import statistics
+import time
+from typing import Any
+
+from application.service_factories.app_service.auth import AuthAppServiceFactory
+from application.services.auth import AuthAppService
+from config import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.test.utils import override_settings
+from domain.models.user import User
+
+EMAIL = "benchmark.hashing@example.com"
+PASSWORD = "BenchmarkPass1234"
+
+
+def percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures login latency p50/p99 and CPU per login at the current and a proposed password hashing cost. "
+        "CPU per login bounds the logins one gunicorn worker serves per second. Nothing is left in the database."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--logins", type=int, default=50)
+        parser.add_argument(
+            "--hasher", choices=list(settings.PASSWORD_HASHER_CLASSES), default=settings.PASSWORD_HASHER
+        )
+        parser.add_argument("--pbkdf2-iterations", type=int)
+        parser.add_argument("--scrypt-work-factor", type=int)
+        parser.add_argument("--argon2-time-cost", type=int)
+        parser.add_argument("--argon2-memory-cost", type=int)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        hasher_path: str = settings.PASSWORD_HASHER_CLASSES[options["hasher"]]
+        proposed: dict[str, Any] = {
+            "PASSWORD_HASHERS": [hasher_path, *(path for path in settings.PASSWORD_HASHERS if path != hasher_path)],
+            "PBKDF2_ITERATIONS": options["pbkdf2_iterations"] or settings.PBKDF2_ITERATIONS,
+            "SCRYPT_WORK_FACTOR": options["scrypt_work_factor"] or settings.SCRYPT_WORK_FACTOR,
+            "ARGON2_TIME_COST": options["argon2_time_cost"] or settings.ARGON2_TIME_COST,
+            "ARGON2_MEMORY_COST": options["argon2_memory_cost"] or settings.ARGON2_MEMORY_COST,
+        }
+        results: dict[str, dict[str, Any]] = {
+            "current": self._measure(options["logins"]),
+        }
+        with override_settings(**proposed):
+            results["proposed"] = self._measure(options["logins"])
+        self.stdout.write(json.dumps(results, indent=2))
+
+    def _measure(self, logins: int) -> dict[str, Any]:
+        """Registers a user and logs it in under the active settings."""
+        credentials_raw: dict[str, str] = {"email": EMAIL, "password": PASSWORD}
+        auth_app_service: AuthAppService = AuthAppServiceFactory.create_service()
+        wall_ms: list[float] = list()
+        cpu_ms: list[float] = list()
+
+        with transaction.atomic():
+            start = time.perf_counter()
+            user: User = User.objects.create_user(
+                email=EMAIL, first_name="benchmark", last_name="benchmark", password=PASSWORD
+            )
+            register_ms = (time.perf_counter() - start) * 1000
+            for _ in range(logins):
+                wall_start, cpu_start = time.perf_counter(), time.process_time()
+                auth_app_service.login(credentials_raw)
+                cpu_ms.append((time.process_time() - cpu_start) * 1000)
+                wall_ms.append((time.perf_counter() - wall_start) * 1000)
+            user.refresh_from_db(fields=["password"])
+            transaction.set_rollback(True)
+
+        cpu_per_login_ms = statistics.mean(cpu_ms)
+        return {
+            "hasher": user.password.split("$")[0],
+            "cost": user.password.split("$")[1],
+            "register_ms": round(register_ms, 3),
+            "login_p50_ms": round(percentile(wall_ms, 50), 3),
+            "login_p99_ms": round(percentile(wall_ms, 99), 3),
+            "cpu_per_login_ms": round(cpu_per_login_ms, 3),
+            "logins_per_second_per_worker": round(1000 / cpu_per_login_ms, 1),
+        }
@@ -0,0 +1,120 @@
+import json
+import statistics
+import time
+from datetime import date
+from typing import Any
+
+from application.dto.project import ProjectPageDto
+from application.services.gateway import gateway
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.http import QueryDict
+from domain.enums.project_stage import ProjectStageEnum
+from domain.enums.project_status import ProjectStatusEnum
+from domain.models.company import Company, CompanyFounder
+from domain.models.country import Country
+from domain.models.funding_model import FundingModel
+from domain.models.project import Project, ProjectImage
+from domain.models.project_category import ProjectCategory
+from domain.models.user import User
+from infrastructure.repositories.project_management import DjProjectCardWriteRepository
+from presentation.renderers import DtoJSONRenderer
+
+# The query params of every listing mode.
+MODES: dict[str, str] = {
+    "full": "view=full",
+    "card": "",
+    "fields": "fields=id,name,slug,cover_url",
+}
+DESCRIPTION = "A long description of the project, its plans, its team and its market. " * 40
+
+
+def percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds projects with companies and images and measures a page of the listing in every mode: "
+        "full projects, cards and selected card fields, in rendered bytes and milliseconds per response. "
+        "Nothing is left in the database."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--projects", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=50)
+        parser.add_argument("--limit", type=int, default=50)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        results: dict[str, dict[str, float]] = dict()
+        with transaction.atomic():
+            self._seed(options["projects"])
+            for mode, query in MODES.items():
+                results[mode] = self._measure(f"limit={options['limit']}&{query}", options["repeat"])
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            json.dumps({"projects": options["projects"], "limit": options["limit"], "results": results}, indent=2)
+        )
+
+    def _seed(self, amount: int) -> None:
+        creator: User = User.objects.create_user(email="benchmark.listing@example.com", password="BenchmarkPass1234")
+        category: ProjectCategory = ProjectCategory.objects.create(name="Benchmark listing category")
+        funding_model: FundingModel = FundingModel.objects.create(name="Benchmark listing funding model")
+        country, _ = Country.objects.get_or_create(code="ZZ")
+        projects: list[Project] = Project.objects.bulk_create(
+            Project(
+                name=f"Benchmark listing project {i}",
+                slug=f"benchmark-listing-{i}",
+                description=DESCRIPTION,
+                category=category,
+                creator=creator,
+                funding_model=funding_model,
+                stage=ProjectStageEnum.IDEA,
+                status=ProjectStatusEnum.ACTIVE,
+                goal_sum=1000,
+                deadline=date(2030, 1, 1),
+            )
+            for i in range(amount)
+        )
+        companies: list[Company] = Company.objects.bulk_create(
+            Company(
+                name=f"Benchmark listing company {project.id}",
+                slug=f"benchmark-listing-company-{project.id}",
+                project=project,
+                country=country,
+                business_id=f"benchmark-{project.id}",
+                established_date=date(2020, 1, 1),
+            )
+            for project in projects
+        )
+        CompanyFounder.objects.bulk_create(
+            CompanyFounder(name="name", surname="surname", company=company, description=DESCRIPTION)
+            for company in companies
+        )
+        ProjectImage.objects.bulk_create(
+            ProjectImage(project=project, file_path=f"benchmark/{project.id}/{order}.jpg", order=order)
+            for project in projects
+            for order in range(1, 4)
+        )
+        # Bulk inserts send no signals.
+        DjProjectCardWriteRepository().rebuild(batch_size=1000)
+
+    @staticmethod
+    def _render(query: str) -> bytes:
+        """Renders the page as ProjectView does."""
+        project_page: ProjectPageDto = gateway.project_app_service.get(QueryDict(query))
+        return DtoJSONRenderer().render(project_page.results)
+
+    def _measure(self, query: str, repeat: int) -> dict[str, float]:
+        body: bytes = self._render(query)
+        durations_ms: list[float] = list()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            self._render(query)
+            durations_ms.append((time.perf_counter() - start) * 1000)
+        return {
+            "bytes": len(body),
+            "p50_ms": round(percentile(durations_ms, 50), 3),
+            "p99_ms": round(percentile(durations_ms, 99), 3),
+        }
@@ -0,0 +1,120 @@
+import json
+import random
+import statistics
+import time
+from datetime import date
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+from django.db.models import Q
+from domain.enums.project_sort import ProjectSortEnum
+from domain.enums.project_stage import ProjectStageEnum
+from domain.enums.project_status import ProjectStatusEnum
+from domain.models.funding_model import FundingModel
+from domain.models.project import Project
+from domain.models.project_category import ProjectCategory
+from domain.models.user import User
+from domain.value_objects.filter import ProjectFilter
+from domain.value_objects.project_management import ProjectCursor, ProjectPagination, ProjectSearch
+from infrastructure.repositories.project_management import DjProjectReadRepository
+
+WORDS = (
+    "solar energy farm green city platform health care mobile payments education online school water clean "
+    "delivery food local market travel guide robot garden smart home music studio game indie coffee roastery "
+    "bike sharing book club film festival pet clinic craft brewery sport academy fashion design cloud storage"
+).split()
+# Descriptions are mostly words that are searched rarely.
+FILLER_WORDS = [f"filler{i}" for i in range(20_000)]
+SEARCHES = ("solar", "sol", "green energy", "smart home robot", "brewery", "filler123")
+
+
+def percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds projects and measures searches by name and description: a substring scan against the full-text "
+        "search ranked by relevance, first and next page. Nothing is left in the database."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--projects", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--limit", type=int, default=20)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        repeat, limit = options["repeat"], options["limit"]
+        repository = DjProjectReadRepository()
+        results: dict[str, dict[str, dict[str, float]]] = dict()
+
+        with transaction.atomic():
+            self._seed(options["projects"])
+            for search in SEARCHES:
+                filter_ = ProjectFilter(search=ProjectSearch(value=search))
+                first_page = ProjectPagination(limit=limit, sort=ProjectSortEnum.RELEVANCE)
+                last_project: Project = repository.get_page(filter_=filter_, pagination=first_page)[-1]
+                next_page = ProjectPagination(
+                    limit=limit,
+                    sort=ProjectSortEnum.RELEVANCE,
+                    cursor=ProjectCursor(
+                        sort=ProjectSortEnum.RELEVANCE, key=last_project.relevance, last_id=last_project.id
+                    ),
+                )
+                runs: dict[str, Callable[[], Any]] = {
+                    "substring_scan": lambda: self._substring_scan(filter_.search, limit),
+                    "full_text_first_page": lambda: repository.get_page(filter_=filter_, pagination=first_page),
+                    "full_text_next_page": lambda: repository.get_page(filter_=filter_, pagination=next_page),
+                }
+                results[search] = {name: self._measure(run, repeat) for name, run in runs.items()}
+            transaction.set_rollback(True)
+
+        self.stdout.write(json.dumps({"projects": options["projects"], "results": results}, indent=2))
+
+    def _seed(self, amount: int) -> None:
+        rng = random.Random(0)
+        creator: User = User.objects.create_user(email="benchmark.search@example.com", password="BenchmarkPass1234")
+        category: ProjectCategory = ProjectCategory.objects.create(name="Benchmark search category")
+        funding_model: FundingModel = FundingModel.objects.create(name="Benchmark search funding model")
+        Project.objects.bulk_create(
+            (
+                Project(
+                    name=f"{' '.join(rng.sample(WORDS, 3))} {i}",
+                    slug=f"benchmark-search-{i}",
+                    description=" ".join(rng.choices(WORDS, k=4) + rng.choices(FILLER_WORDS, k=36)),
+                    category=category,
+                    creator=creator,
+                    funding_model=funding_model,
+                    stage=ProjectStageEnum.IDEA,
+                    status=ProjectStatusEnum.ACTIVE,
+                    goal_sum=1000,
+                    deadline=date(2030, 1, 1),
+                )
+                for i in range(amount)
+            ),
+            batch_size=5000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Project._meta.db_table}")
+
+    @staticmethod
+    def _substring_scan(search: ProjectSearch, limit: int) -> list[Project]:
+        """Matches every word anywhere in the name or description, as clients did with downloaded pages."""
+        condition = Q()
+        for word in search.words:
+            condition &= Q(name__icontains=word) | Q(description__icontains=word)
+        return list(Project.objects.filter(condition).order_by("-id")[:limit])
+
+    @staticmethod
+    def _measure(run: Callable[[], Any], repeat: int) -> dict[str, float]:
+        run()
+        durations_ms: list[float] = list()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            durations_ms.append((time.perf_counter() - start) * 1000)
+        return {
+            "p50_ms": round(percentile(durations_ms, 50), 3),
+            "p99_ms": round(percentile(durations_ms, 99), 3),
+        }
@@ -0,0 +1,84 @@
+import json
+import time
+from typing import Any, Callable
+
+from application.converters.request_converters.auth import request_cookies_to_refresh_token
+from application.services.gateway import gateway
+from config import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+from django.http import HttpRequest, HttpResponse
+from django.test.utils import CaptureQueriesContext
+from domain.models.user import User
+from domain.services.auth import TokenService
+from domain.value_objects.common import Id
+from domain.value_objects.token import AccessTokenVo, RefreshPayload
+from infrastructure.repositories.user import DjUserReadRepository
+from presentation.views.auth import ReissueAccessTokenView
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+EMAIL = "benchmark.reissue@example.com"
+
+
+class UserLookupReissueView(APIView):
+    """The view as it was: the user row is loaded on every reissue to confirm they still exist."""
+
+    def post(self, request: Request) -> Response:
+        token_service = TokenService(secret_key=settings.SECRET_KEY)
+        payload: RefreshPayload = token_service.verify_refresh(request_cookies_to_refresh_token(request.COOKIES))
+        user: User = DjUserReadRepository().get_by_id(Id(value=int(payload.sub)))
+        access_token: AccessTokenVo = token_service.generate_access(user=user)
+        response = Response(data={"detail": "success"}, status=status.HTTP_200_OK)
+        response.set_cookie("access_token", access_token.value)
+        return response
+
+
+class Command(BaseCommand):
+    help = "Measures requests per second of the reissue endpoint with and without the user lookup. Nothing is kept."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--requests", type=int, default=2000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        request_count: int = options["requests"]
+        request_factory = APIRequestFactory()
+
+        with transaction.atomic():
+            user: User = User.objects.create_user(email=EMAIL, password="BenchmarkPass1234")
+            token_service = TokenService(secret_key=settings.SECRET_KEY)
+            refresh_token: str = token_service.generate_refresh(user=user).value
+            revoked_token: str = token_service.generate_refresh(user=user).value
+            gateway.auth_app_service.logout({"refresh_token": revoked_token})
+
+            runs: dict[str, tuple[Callable[[HttpRequest], HttpResponse], str, int]] = {
+                "user_lookup": (UserLookupReissueView.as_view(), refresh_token, status.HTTP_200_OK),
+                "revocation_index": (ReissueAccessTokenView.as_view(), refresh_token, status.HTTP_200_OK),
+                "revoked_token": (ReissueAccessTokenView.as_view(), revoked_token, status.HTTP_401_UNAUTHORIZED),
+            }
+            results: dict[str, dict[str, float]] = dict()
+            for name, (view, token, expected_status) in runs.items():
+                requests: list[HttpRequest] = list()
+                for _ in range(request_count):
+                    request: HttpRequest = request_factory.post("/api/v2/auth/reissue-access/")
+                    request.COOKIES["refresh_token"] = token
+                    requests.append(request)
+
+                with CaptureQueriesContext(connection) as context:
+                    start = time.perf_counter()
+                    for request in requests:
+                        response: HttpResponse = view(request)
+                        if response.status_code != expected_status:
+                            raise RuntimeError(f"Reissue {name} answered with status {response.status_code}.")
+                    elapsed = time.perf_counter() - start
+                results[name] = {
+                    "requests_per_second": round(request_count / elapsed),
+                    "per_request_us": round(elapsed / request_count * 1_000_000, 1),
+                    "queries_per_request": len(context.captured_queries) / request_count,
+                }
+            transaction.set_rollback(True)
+
+        self.stdout.write(json.dumps({"requests": request_count, "results": results}, indent=2))
@@ -0,0 +1,132 @@
+import base64
+import json
+import re
+import time
+import tracemalloc
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable
+
+import google_crc32c
+import requests
+from application.converters.request_converters.common import uploaded_file_to_stream
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.management.base import BaseCommand, CommandParser
+from domain.constants import MEGABYTE
+from domain.value_objects.cloud_storage import CloudStorageUploadPayload
+from domain.value_objects.file import PdfFile
+from google.auth.credentials import AnonymousCredentials
+from google.cloud.storage import Client
+from infrastructure.cloud_storages.google import GoogleCloudStorage
+from infrastructure.cloud_storages.local import LocalFileSystemCloudStorage
+
+CONTENT_RANGE_PATTERN = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+MULTIPART_CHECKSUM_PATTERN = re.compile(rb'"crc32c": "([^"]+)"')
+
+
+class FakeGoogleCloudSession(requests.Session):
+    """Answers bucket lookups and uploads like Google Cloud Storage, only the checksum of the uploaded data is kept."""
+
+    is_mtls = False
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.requests_amount = 0
+        self._checksum = google_crc32c.Checksum()
+
+    def request(self, method: str | bytes, url: str | bytes, *args: Any, **kwargs: Any) -> requests.Response:
+        self.requests_amount += 1
+        url, body, headers = str(url), kwargs.get("data") or b"", kwargs.get("headers") or dict()
+
+        if method == "GET":
+            return self._response(200, {"name": "benchmark"})
+        if "uploadType=multipart" in url:
+            # The client sends the checksum along with the object metadata.
+            metadata_checksum = MULTIPART_CHECKSUM_PATTERN.search(body)
+            return self._object_response(metadata_checksum.group(1).decode() if metadata_checksum else None)
+        if "uploadType=resumable" in url:
+            self._checksum = google_crc32c.Checksum()
+            return self._response(200, dict(), headers={"location": "https://storage.googleapis.com/upload/session"})
+
+        self._checksum.update(body)
+        match = CONTENT_RANGE_PATTERN.match(headers.get("content-range", ""))
+        if match is None or match.group(3) == "*" or int(match.group(2)) + 1 < int(match.group(3)):
+            return self._response(308, None, headers={"range": f"bytes=0-{match.group(2) if match else 0}"})
+        return self._object_response(base64.b64encode(self._checksum.digest()).decode())
+
+    def _object_response(self, checksum: str | None) -> requests.Response:
+        return self._response(200, {"name": "plan.pdf", "bucket": "benchmark", "crc32c": checksum})
+
+    @staticmethod
+    def _response(status_code: int, body: dict[str, Any] | None, headers: dict[str, str] | None = None) -> Any:
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers or dict())
+        response._content = b"" if body is None else json.dumps(body).encode()
+        return response
+
+
+def create_uploaded_pdf(size: int) -> TemporaryUploadedFile:
+    """A file the way Django keeps uploads larger than FILE_UPLOAD_MAX_MEMORY_SIZE."""
+    uploaded_file = TemporaryUploadedFile("plan.pdf", "application/pdf", size, None)
+    uploaded_file.write(b"%PDF-1.7\n")
+    block = b"0" * MEGABYTE
+    written = len(b"%PDF-1.7\n")
+    while written < size:
+        written += uploaded_file.write(block[: size - written])
+    uploaded_file.seek(0)
+    return uploaded_file
+
+
+class Command(BaseCommand):
+    help = "Measures the peak memory of validating and uploading a project plan, bytes versus streaming."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--size", type=int, default=20, help="Size of the uploaded plan in MB.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        size: int = options["size"] * MEGABYTE
+        session = FakeGoogleCloudSession()
+        client = Client(project="benchmark", credentials=AnonymousCredentials(), _http=session)
+        google_storage = GoogleCloudStorage(bucket_name="benchmark", client=client)
+        temp_dir = TemporaryDirectory()
+        local_storage = LocalFileSystemCloudStorage(root=Path(temp_dir.name), base_url="/", secret_key="benchmark")
+
+        def google_bytes(uploaded_file: TemporaryUploadedFile) -> None:
+            """What the upload cost before streaming: the file read into bytes and wrapped into BytesIO."""
+            file_data: bytes = uploaded_file.read()
+            client.bucket("benchmark").blob("plan.pdf").upload_from_file(BytesIO(file_data), rewind=True)
+
+        def google_stream(uploaded_file: TemporaryUploadedFile) -> None:
+            plan = PdfFile(value=uploaded_file_to_stream(uploaded_file))
+            google_storage.upload_file(CloudStorageUploadPayload(file=plan.value, file_path="plan.pdf"))
+
+        def local_stream(uploaded_file: TemporaryUploadedFile) -> None:
+            plan = PdfFile(value=uploaded_file_to_stream(uploaded_file))
+            local_storage.upload_file(CloudStorageUploadPayload(file=plan.value, file_path="plan.pdf"))
+
+        runs: dict[str, Callable[[TemporaryUploadedFile], None]] = {
+            "google_bytes": google_bytes,
+            "google_stream": google_stream,
+            "local_stream": local_stream,
+        }
+        results: dict[str, dict[str, float]] = dict()
+        for name, run in runs.items():
+            uploaded_file = create_uploaded_pdf(size)
+            session.requests_amount = 0
+            tracemalloc.start()
+            start = time.perf_counter()
+            run(uploaded_file)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            uploaded_file.close()
+            results[name] = {
+                "peak_memory_mb": round(peak / MEGABYTE, 2),
+                "total_ms": round(elapsed * 1000, 1),
+                "http_requests": session.requests_amount,
+            }
+        temp_dir.cleanup()
+
+        self.stdout.write(json.dumps({"file_size_mb": options["size"], "results": results}, indent=2))
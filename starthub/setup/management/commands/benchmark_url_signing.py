@@ -0,0 +1,77 @@
+import json
+import time
+from typing import Any, Callable
+
+import rsa
+from django.core.management.base import BaseCommand, CommandParser
+from domain.value_objects.cloud_storage import CloudStorageCreateUrlPayload, CloudStorageCreateUrlsPayload
+from google.cloud.storage import Client
+from google.oauth2 import service_account
+from infrastructure.cloud_storages.google import GoogleCloudStorage
+
+
+def create_benchmark_credentials(credentials_file: str | None) -> service_account.Credentials:
+    """Loads a service account file or creates a throwaway key, which is enough for signing urls."""
+    if credentials_file is None:
+        _, private_key = rsa.newkeys(2048)
+        return service_account.Credentials.from_service_account_info(
+            {
+                "private_key": private_key.save_pkcs1().decode(),
+                "client_email": "benchmark@benchmark.iam.gserviceaccount.com",
+                "token_uri": "https://oauth2.googleapis.com/token",
+            }
+        )
+    return service_account.Credentials.from_service_account_file(credentials_file)
+
+
+class Command(BaseCommand):
+    help = "Compares per-item and batched signing of project image urls."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--projects", type=int, default=50)
+        parser.add_argument("--images", type=int, default=7, help="Images per project.")
+        parser.add_argument("--workers", type=int, default=4, help="Threads for the threaded batch run.")
+        parser.add_argument("--credentials", type=str, default=None, help="Service account json file.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        credentials = create_benchmark_credentials(options["credentials"])
+        client = Client(project="benchmark", credentials=credentials)
+        paths_per_project: list[list[str]] = [
+            [f"benchmark/projects/photos/{project}-{image}.jpg" for image in range(options["images"])]
+            for project in range(options["projects"])
+        ]
+        all_paths: list[str] = [path for paths in paths_per_project for path in paths]
+
+        storage = GoogleCloudStorage(bucket_name="benchmark", client=client, credentials=credentials)
+        threaded_storage = GoogleCloudStorage(
+            bucket_name="benchmark", client=client, signing_workers=options["workers"], credentials=credentials
+        )
+
+        def per_item() -> None:
+            for path in all_paths:
+                storage.create_url(CloudStorageCreateUrlPayload(file_path=path))
+
+        def batch_per_project() -> None:
+            for paths in paths_per_project:
+                storage.create_urls(CloudStorageCreateUrlsPayload(file_paths=paths))
+
+        def batch_per_page() -> None:
+            storage.create_urls(CloudStorageCreateUrlsPayload(file_paths=all_paths))
+
+        def threaded_batch_per_page() -> None:
+            threaded_storage.create_urls(CloudStorageCreateUrlsPayload(file_paths=all_paths))
+
+        runs: dict[str, Callable[[], None]] = {
+            "per_item": per_item,
+            "batch_per_project": batch_per_project,
+            "batch_per_page": batch_per_page,
+            f"threaded_batch_per_page_{options['workers']}_workers": threaded_batch_per_page,
+        }
+        results: dict[str, dict[str, float]] = dict()
+        for name, run in runs.items():
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            results[name] = {"total_ms": elapsed * 1000, "per_url_us": elapsed / len(all_paths) * 1_000_000}
+
+        self.stdout.write(json.dumps({"urls": len(all_paths), "results": results}, indent=2))
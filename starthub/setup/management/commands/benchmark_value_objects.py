@@ -0,0 +1,95 @@
+import json
+import statistics
+import time
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandParser
+from domain.value_objects import BaseVo
+from domain.value_objects.common import Description, FirstName, Id, LastName, Order, PhoneNumber, Slug
+from domain.value_objects.user import Email, UserProfile
+
+# Values of the columns the value objects are read from.
+VALUES: dict[type[BaseVo], Any] = {
+    Id: 1,
+    Slug: "benchmark-project",
+    Order: 1,
+    FirstName: "First",
+    LastName: "Last",
+    Description: "A short description of the user.",
+    Email: "benchmark.profile@example.com",
+    PhoneNumber: "+12025550100",
+}
+TRUSTED_IN_PROFILE: tuple[type[BaseVo], ...] = (Email, PhoneNumber)
+
+
+def percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures building the value objects of rows read from the database, validated against from_trusted, "
+        "and the profile of UserService.get_user_profile validated against built as it is now. "
+        "The listing builds no value objects per project, a page of ids would cost `--limit` times an Id."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--repeat", type=int, default=5000)
+        parser.add_argument("--phones", type=int, default=2)
+        parser.add_argument("--limit", type=int, default=50)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        repeat: int = options["repeat"]
+        value_objects: dict[str, dict[str, dict[str, float]]] = {
+            vo_class.__name__: {
+                "validated": self._measure(lambda: vo_class(value=value), repeat),
+                "from_trusted": self._measure(lambda: vo_class.from_trusted(value=value), repeat),
+            }
+            for vo_class, value in VALUES.items()
+        }
+        page_of_ids: dict[str, float] = {
+            mode: round(timings["p50_us"] * options["limit"], 3) for mode, timings in value_objects["Id"].items()
+        }
+        profile: dict[str, dict[str, float]] = {
+            "validated": self._measure(lambda: self._build_profile(options["phones"], trusted=()), repeat),
+            "current": self._measure(lambda: self._build_profile(options["phones"], TRUSTED_IN_PROFILE), repeat),
+        }
+        profile["saved_per_request"] = {
+            "p50_us": round(profile["validated"]["p50_us"] - profile["current"]["p50_us"], 3)
+        }
+        self.stdout.write(
+            json.dumps(
+                {"value_objects": value_objects, "listing_page_of_ids_p50_us": page_of_ids, "profile": profile},
+                indent=2,
+            )
+        )
+
+    @staticmethod
+    def _build_profile(phones: int, trusted: tuple[type[BaseVo], ...]) -> UserProfile:
+        def build(vo_class: type[BaseVo]) -> BaseVo:
+            if vo_class in trusted:
+                return vo_class.from_trusted(value=VALUES[vo_class])
+            return vo_class(value=VALUES[vo_class])
+
+        return UserProfile(
+            id_=build(Id),
+            first_name=build(FirstName),
+            last_name=build(LastName),
+            description=build(Description),
+            email=build(Email),
+            picture=None,
+            phone_numbers=[build(PhoneNumber) for _ in range(phones)],
+        )
+
+    @staticmethod
+    def _measure(run: Callable[[], Any], repeat: int) -> dict[str, float]:
+        run()
+        durations_us: list[float] = list()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            durations_us.append((time.perf_counter() - start) * 1_000_000)
+        return {
+            "p50_us": round(percentile(durations_us, 50), 3),
+            "p99_us": round(percentile(durations_us, 99), 3),
+        }
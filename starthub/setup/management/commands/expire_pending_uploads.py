@@ -0,0 +1,25 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from application.service_factories.domain_service.project_management import (
+    ProjectImageServiceFactory,
+    ProjectServiceFactory,
+)
+from config import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+
+class Command(BaseCommand):
+    help = (
+        "Expires project plans and images whose upload is pending for too long, it was lost with its worker. "
+        "Plans are marked as failed, images are deleted and their places freed."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--older-than", type=int, default=settings.UPLOAD_PENDING_TIMEOUT, help="In seconds.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        started_before: datetime = datetime.now(UTC) - timedelta(seconds=options["older_than"])
+        plans: int = ProjectServiceFactory.create_service().expire_pending_plan_uploads(started_before)
+        images: int = ProjectImageServiceFactory.create_service().expire_pending_uploads(started_before)
+        self.stdout.write(f"Expired {plans} pending project plans and {images} pending project images.")
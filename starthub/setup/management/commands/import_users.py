@@ -0,0 +1,59 @@
+import csv
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator
+
+import pydantic
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from domain.exceptions import DomainException
+from domain.models.user import User
+from domain.value_objects.common import FirstName, LastName
+from domain.value_objects.user import Email, RawPassword
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports users from a csv file with the columns email, password, first_name and last_name. "
+        "Every user gets the default role, emails that are already taken are skipped."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path", type=Path)
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size: int = options["batch_size"]
+        created, skipped = 0, 0
+        try:
+            with options["path"].open(newline="", encoding="utf-8") as csv_file:
+                rows: Iterator[dict[str, str]] = iter(csv.DictReader(csv_file))
+                while batch := list(islice(rows, batch_size)):
+                    users: list[User] = self._build_users(batch)
+                    taken: set[str] = set(
+                        User.objects.filter(email__in=[user.email for user in users]).values_list("email", flat=True)
+                    )
+                    new_users: list[User] = [user for user in users if user.email not in taken]
+                    User.objects.bulk_create_users(new_users, batch_size=batch_size)
+                    created, skipped = created + len(new_users), skipped + len(batch) - len(new_users)
+        except OSError as e:
+            raise CommandError(f"Can not read {options['path']}: {e}.")
+
+        self.stdout.write(f"Created {created} users, skipped {skipped}.")
+
+    def _build_users(self, rows: list[dict[str, str]]) -> list[User]:
+        """:raises CommandError: If a row is not valid, nothing of its batch is imported."""
+        users: dict[str, User] = dict()
+        for row in rows:
+            try:
+                email: Email = Email(value=row["email"])
+                password: RawPassword = RawPassword(value=row["password"])
+                first_name: str | None = FirstName(value=row["first_name"]).value if row.get("first_name") else None
+                last_name: str | None = LastName(value=row["last_name"]).value if row.get("last_name") else None
+            except (KeyError, DomainException, pydantic.ValidationError) as e:
+                raise CommandError(f"Invalid row of {row.get('email')}: {e}.")
+            user: User = User.objects.build_user(
+                email=email.value, first_name=first_name, last_name=last_name, password=password.value
+            )
+            # A repeated email keeps its first row.
+            users.setdefault(user.email, user)
+        return list(users.values())
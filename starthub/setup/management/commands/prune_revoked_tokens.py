@@ -0,0 +1,13 @@
+from datetime import UTC, datetime
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from domain.models.revoked_token import RevokedToken
+
+
+class Command(BaseCommand):
+    help = "Deletes revoked tokens that have expired, they can not be used anyway."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        count, _ = RevokedToken.objects.filter(expires_at__lte=datetime.now(UTC)).delete()
+        self.stdout.write(f"Deleted {count} expired revoked tokens.")
@@ -0,0 +1,18 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from infrastructure.repositories.project_management import DjProjectCardWriteRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the project cards of the listing from the projects, their companies and images. "
+        "Cards are kept up to date on every write, this only repairs them after writes that skipped the signals."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        amount: int = DjProjectCardWriteRepository().rebuild(batch_size=options["batch_size"])
+        self.stdout.write(f"Rebuilt {amount} project cards.")
@@ -1,16 +1,35 @@
-from typing import Any
+from typing import Any, Callable
 
 from django.core.management import call_command
-from django.db import connection
+from django.db import connection, transaction
 from django.db.migrations.executor import MigrationExecutor
-from django.db.models.signals import post_migrate
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save
 from django.dispatch import receiver
+from domain.enums.response_scope import ResponseScopeEnum
+from domain.models.company import Company, CompanyFounder
+from domain.models.country import Country
+from domain.models.funding_model import FundingModel
+from domain.models.news import News
+from domain.models.permission import Permission
+from domain.models.project import Project, ProjectImage
+from domain.models.project_category import ProjectCategory
+from domain.models.role import Role, forget_default_role_id
+from domain.models.user import User, UserPhone
+from domain.models.user_favorite import UserFavorite
+from domain.value_objects.common import Id
+from infrastructure.repositories.project_management import DjProjectCardWriteRepository
+from infrastructure.services.permission_cache import permission_cache
+from infrastructure.services.reference_data import countries, funding_models, project_categories
+from infrastructure.services.response_cache import response_cache
+from infrastructure.services.revocation_index import revocation_index
 
 _ran = False
 
 
 @receiver(post_migrate)
 def run_after_migrate(sender: Any, **kwargs: Any) -> None:
+    # Flushing the tables emits post_migrate too.
+    forget_default_role_id()
     global _ran
     if _ran:
         return
@@ -24,3 +43,139 @@ def run_after_migrate(sender: Any, **kwargs: Any) -> None:
     _ran = True
     call_command("assign_default_role")
     call_command("create_blogger_role")
+
+
+def invalidate_permissions(invalidate: Callable[[], None]) -> None:
+    """Invalidates now for the current transaction and again on commit, after other processes could cache old data."""
+    invalidate()
+    if connection.in_atomic_block:
+        transaction.on_commit(invalidate)
+
+
+@receiver(m2m_changed, sender=User.roles.through)
+def invalidate_user_permissions(
+    sender: Any, instance: User | Role, action: str, reverse: bool, pk_set: set[int] | None, **kwargs: Any
+) -> None:
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        invalidate_permissions(lambda: permission_cache.invalidate_user(Id(value=instance.pk)))
+    elif pk_set:
+        user_ids: list[Id] = [Id(value=pk) for pk in pk_set]
+
+        def invalidate_users() -> None:
+            for user_id in user_ids:
+                permission_cache.invalidate_user(user_id)
+
+        invalidate_permissions(invalidate_users)
+    else:
+        # The users of a cleared role are not known any more.
+        invalidate_permissions(permission_cache.invalidate_all)
+
+
+@receiver(m2m_changed, sender=Role.permissions.through)
+def invalidate_role_permissions(sender: Any, action: str, **kwargs: Any) -> None:
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_permissions(permission_cache.invalidate_all)
+
+
+@receiver(post_save, sender=Permission)
+@receiver(post_delete, sender=Permission)
+@receiver(post_delete, sender=Role)
+def invalidate_all_permissions(sender: Any, **kwargs: Any) -> None:
+    """Deleting cascades to the m2m tables without m2m_changed, renaming a permission changes every holder."""
+    invalidate_permissions(permission_cache.invalidate_all)
+
+
+@receiver(post_delete, sender=Role)
+def forget_deleted_default_role(sender: Any, **kwargs: Any) -> None:
+    forget_default_role_id()
+
+
+@receiver(post_delete, sender=User)
+def invalidate_deleted_user_permissions(sender: Any, instance: User, **kwargs: Any) -> None:
+    invalidate_permissions(lambda: permission_cache.invalidate_user(Id(value=instance.pk)))
+
+
+@receiver(post_delete, sender=User)
+def revoke_deleted_user_tokens(sender: Any, instance: User, **kwargs: Any) -> None:
+    """Reissuing tokens does not look the user up, their tokens are revoked instead."""
+    revocation_index.revoke_user(Id(value=instance.pk))
+
+
+@receiver(post_save, sender=ProjectCategory)
+@receiver(post_delete, sender=ProjectCategory)
+def invalidate_project_categories(sender: Any, **kwargs: Any) -> None:
+    project_categories.invalidate()
+
+
+@receiver(post_save, sender=FundingModel)
+@receiver(post_delete, sender=FundingModel)
+def invalidate_funding_models(sender: Any, **kwargs: Any) -> None:
+    funding_models.invalidate()
+
+
+@receiver(post_save, sender=Country)
+@receiver(post_delete, sender=Country)
+def invalidate_countries(sender: Any, **kwargs: Any) -> None:
+    countries.invalidate()
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=ProjectImage)
+@receiver(post_delete, sender=ProjectImage)
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+@receiver(post_save, sender=CompanyFounder)
+@receiver(post_delete, sender=CompanyFounder)
+@receiver(post_save, sender=ProjectCategory)
+@receiver(post_delete, sender=ProjectCategory)
+@receiver(post_save, sender=FundingModel)
+@receiver(post_delete, sender=FundingModel)
+@receiver(post_save, sender=Country)
+@receiver(post_delete, sender=Country)
+def invalidate_project_responses(sender: Any, **kwargs: Any) -> None:
+    """Projects are returned with their images, company and reference data."""
+    response_cache.invalidate(ResponseScopeEnum.PROJECTS)
+
+
+@receiver(post_save, sender=News)
+@receiver(post_delete, sender=News)
+def invalidate_news_responses(sender: Any, **kwargs: Any) -> None:
+    response_cache.invalidate(ResponseScopeEnum.NEWS)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=UserPhone)
+@receiver(post_delete, sender=UserPhone)
+def invalidate_user_responses(sender: Any, update_fields: frozenset[str] | None = None, **kwargs: Any) -> None:
+    # Logging in only stamps the last login, which is not in a profile.
+    if update_fields != {"last_login"}:
+        response_cache.invalidate(ResponseScopeEnum.USERS)
+
+
+@receiver(post_save, sender=UserFavorite)
+@receiver(post_delete, sender=UserFavorite)
+def invalidate_favorite_responses(sender: Any, **kwargs: Any) -> None:
+    response_cache.invalidate(ResponseScopeEnum.FAVORITES)
+
+
+@receiver(post_save, sender=Project)
+def refresh_project_card(sender: Any, instance: Project, **kwargs: Any) -> None:
+    DjProjectCardWriteRepository().refresh([Id(value=instance.pk)])
+
+
+@receiver(post_delete, sender=Project)
+def delete_project_card(sender: Any, instance: Project, **kwargs: Any) -> None:
+    DjProjectCardWriteRepository().delete(Id(value=instance.pk))
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+@receiver(post_save, sender=ProjectImage)
+@receiver(post_delete, sender=ProjectImage)
+def refresh_company_or_image_card(sender: Any, instance: Company | ProjectImage, **kwargs: Any) -> None:
+    """The card has the company name and country and the cover image, a deleted project has no card to refresh."""
+    DjProjectCardWriteRepository().refresh([Id(value=instance.project_id)])
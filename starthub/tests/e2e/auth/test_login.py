@@ -3,13 +3,13 @@ from django.test import TestCase
 from django.urls import reverse
 from domain.constants import JWT_ALGORITHM
 from domain.enums.token import TokenTypeEnum
-from domain.exceptions.auth import InvalidCredentialsException, PasswordValidationException
+from domain.exceptions.auth import InvalidCredentialsException, InvalidTokenException, PasswordValidationException
 from domain.exceptions.user import UserNotFoundException
 from domain.exceptions.validation import EmptyStringException, InvalidEmailException, MissingRequiredFieldException
 from domain.models.user import User
 from loguru import logger
 from presentation.constants import SUCCESS
-from presentation.response_factories.common import LoginErrorResponseFactory
+from presentation.response_factories.common import CommonErrorResponseFactory, LoginErrorResponseFactory
 from pydantic import ValidationError
 from rest_framework.test import APIClient
 
@@ -71,6 +71,21 @@ class TestLogin(TestCase):
         self.assertEqual(logout_response.cookies.get("access_token").value, str())
         self.assertEqual(logout_response.cookies.get("refresh_token").value, str())
 
+    def test_refresh_token_is_revoked_on_logout(self) -> None:
+        response = self.client.post(self.login_url, data=self.valid_credentials, content_type=self.content_type)
+        refresh_token: str = response.cookies.get("refresh_token").value  # type: ignore
+        self.client.cookies["refresh_token"] = refresh_token
+        reissue_url = reverse("reissue_access")
+
+        self.assertEqual(self.client.post(reissue_url).status_code, 200)
+        self.client.post(reverse("logout"))
+        self.client.cookies["refresh_token"] = refresh_token
+        reissue_response = self.client.post(reissue_url)
+
+        app_code, http_code = CommonErrorResponseFactory.error_codes[InvalidTokenException]
+        self.assertEqual(reissue_response.status_code, http_code)
+        self.assertEqual(reissue_response.json()["code"], app_code)
+
     def test_another_email(self) -> None:
         self.valid_credentials["email"] = "another-email@example.com"
         response = self.client.post(self.login_url, data=self.valid_credentials, content_type=self.content_type)
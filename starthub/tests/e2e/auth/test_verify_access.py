@@ -0,0 +1,58 @@
+from config import settings
+from django.test import TestCase
+from django.urls import reverse
+from domain.models.user import User
+from domain.services.auth import TokenService
+from rest_framework.test import APIClient
+
+
+class TestVerifyAccess(TestCase):
+    user: User
+    verify_url: str
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(
+            first_name="first_name", last_name="last_name", email="email@example.com", password="Pass1234"
+        )
+        cls.verify_url = reverse("verify_access")
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+
+    def test_valid_token(self) -> None:
+        self.client.cookies["access_token"] = self.login()
+
+        response = self.client.post(self.verify_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["sub"], str(self.user.id))
+        self.assertEqual(response.json()["email"], self.user.email)
+
+    def test_missing_token(self) -> None:
+        response = self.client.post(self.verify_url)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()["code"], "MISSING_ACCESS_TOKEN")
+
+    def test_expired_token(self) -> None:
+        token_service = TokenService(secret_key=settings.SECRET_KEY, access_token_lifetime=-1)
+        self.client.cookies["access_token"] = token_service.generate_access(self.user).value
+
+        response = self.client.post(self.verify_url)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()["code"], "TOKEN_EXPIRED")
+
+    def test_invalid_token_does_not_block_public_views(self) -> None:
+        self.client.cookies["access_token"] = "invalid"
+
+        response = self.client.get(reverse("user_detail", kwargs={"user_id": self.user.id}))
+
+        self.assertEqual(response.status_code, 200)
+
+    def login(self) -> str:
+        response = self.client.post(
+            reverse("login"), data={"email": "email@example.com", "password": "Pass1234"}, format="json"
+        )
+        return response.cookies["access_token"].value
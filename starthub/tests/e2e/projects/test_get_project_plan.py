@@ -0,0 +1,63 @@
+from datetime import date
+from unittest.mock import patch
+
+from django.test import TestCase
+from domain.enums.project_stage import ProjectStageEnum
+from domain.enums.project_status import ProjectStatusEnum
+from domain.enums.upload_status import UploadStatusEnum
+from domain.models.funding_model import FundingModel
+from domain.models.project import Project
+from domain.models.project_category import ProjectCategory
+from domain.models.user import User
+from domain.value_objects.cloud_storage import CloudStorageCreateUrlPayload
+from infrastructure.cloud_storages.google import GoogleCloudStorage
+from rest_framework.test import APIClient
+
+
+def sign_path(payload: CloudStorageCreateUrlPayload) -> str:
+    return payload.file_path
+
+
+class TestGetProjectPlan(TestCase):
+    client: APIClient
+    project: Project
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.client = APIClient()
+        cls.project = Project.objects.create(
+            name="Project",
+            description="description",
+            category=ProjectCategory.objects.create(name="Test category"),
+            creator=User.objects.create_user(email="creator@example.com", password="Pass1234"),
+            funding_model=FundingModel.objects.create(name="Test funding model"),
+            stage=ProjectStageEnum.IDEA,
+            status=ProjectStatusEnum.ACTIVE,
+            goal_sum=1000,
+            deadline=date(2030, 1, 1),
+            plan="projects/plans/plan.pdf",
+        )
+
+    def setUp(self) -> None:
+        patcher = patch.object(GoogleCloudStorage, "create_url", side_effect=sign_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_plan(self, upload_status: UploadStatusEnum) -> tuple[int, dict[str, str]]:
+        Project.objects.filter(id=self.project.id).update(plan_upload_status=upload_status)
+        response = self.client.get(f"/api/v2/projects/{self.project.id}/plan/")
+        return response.status_code, response.json()
+
+    def test_uploaded_plan_is_signed(self) -> None:
+        self.assertEqual(
+            self.get_plan(UploadStatusEnum.UPLOADED),
+            (200, {"plan_url": "projects/plans/plan.pdf", "code": "SUCCESS"}),
+        )
+
+    def test_pending_plan_is_not_ready(self) -> None:
+        status_code, body = self.get_plan(UploadStatusEnum.PENDING)
+        self.assertEqual((status_code, body["code"]), (409, "PROJECT_PLAN_NOT_READY"))
+
+    def test_failed_plan_is_not_found(self) -> None:
+        status_code, body = self.get_plan(UploadStatusEnum.FAILED)
+        self.assertEqual((status_code, body["code"]), (404, "PROJECT_PLAN_NOT_FOUND"))
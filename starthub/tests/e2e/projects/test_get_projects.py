@@ -0,0 +1,122 @@
+import time
+from datetime import date
+from unittest.mock import patch
+
+from config import settings
+from django.test import TestCase
+from domain.enums.project_stage import ProjectStageEnum
+from domain.enums.project_status import ProjectStatusEnum
+from domain.enums.response_scope import ResponseScopeEnum
+from domain.enums.upload_status import UploadStatusEnum
+from domain.models.company import Company, CompanyFounder
+from domain.models.country import Country
+from domain.models.funding_model import FundingModel
+from domain.models.project import Project, ProjectImage
+from domain.models.project_category import ProjectCategory
+from domain.models.user import User
+from domain.value_objects.cloud_storage import CloudStorageCreateUrlsPayload
+from domain.value_objects.common import Id
+from infrastructure.cloud_storages.google import GoogleCloudStorage
+from infrastructure.repositories.project_management import DjProjectImageWriteRepository
+from infrastructure.services.response_cache import VersionedResponseCache, response_cache
+from rest_framework.test import APIClient
+
+PROJECTS_URL = "/api/v2/projects/"
+
+
+def sign_paths(payload: CloudStorageCreateUrlsPayload) -> dict[str, str]:
+    return {file_path: file_path for file_path in payload.file_paths}
+
+
+class TestGetProjects(TestCase):
+    client: APIClient
+    project: Project
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.client = APIClient()
+        creator = User.objects.create_user(email="creator@example.com", password="Pass1234")
+        cls.project = Project.objects.create(
+            name="Project",
+            description="description",
+            category=ProjectCategory.objects.create(name="Test category"),
+            creator=creator,
+            funding_model=FundingModel.objects.create(name="Test funding model"),
+            stage=ProjectStageEnum.IDEA,
+            status=ProjectStatusEnum.ACTIVE,
+            goal_sum=1000,
+            deadline=date(2030, 1, 1),
+        )
+        company = Company.objects.create(
+            name="Company",
+            project=cls.project,
+            country=Country.objects.create(code="ZZ"),
+            business_id="business-id",
+            established_date=date(2020, 1, 1),
+        )
+        CompanyFounder.objects.create(name="name", surname="surname", company=company, description="description")
+
+    def setUp(self) -> None:
+        # Responses cached by a previous test may show the rows its rollback removed.
+        response_cache.invalidate(ResponseScopeEnum.PROJECTS)
+        patcher = patch.object(GoogleCloudStorage, "create_urls", side_effect=sign_paths)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cached_response_has_the_same_etag(self) -> None:
+        first = self.client.get(PROJECTS_URL, {"limit": 5, "sort": "deadline"})
+        with self.assertNumQueries(0):
+            second = self.client.get(PROJECTS_URL, {"sort": "deadline", "limit": 5})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(first["ETag"], second["ETag"])
+        self.assertTrue(first["ETag"].startswith('"'))
+
+    def test_matching_etag_is_not_modified(self) -> None:
+        etag: str = self.client.get(f"{PROJECTS_URL}{self.project.id}/")["ETag"]
+
+        response = self.client.get(f"{PROJECTS_URL}{self.project.id}/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+        response = self.client.get(f"{PROJECTS_URL}{self.project.id}/", HTTP_IF_NONE_MATCH='"other"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_saving_a_project_invalidates_the_responses(self) -> None:
+        first = self.client.get(f"{PROJECTS_URL}{self.project.id}/")
+        self.project.name = "Renamed project"
+        self.project.save()
+
+        second = self.client.get(f"{PROJECTS_URL}{self.project.id}/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json()["name"], "Renamed project")
+        self.assertNotEqual(first["ETag"], second["ETag"])
+
+    def test_uploaded_image_invalidates_the_responses(self) -> None:
+        image = ProjectImage.objects.create(
+            project=self.project, file_path="image.jpg", order=1, upload_status=UploadStatusEnum.PENDING
+        )
+        self.assertEqual(self.client.get(f"{PROJECTS_URL}{self.project.id}/").json()["images"], [])
+
+        DjProjectImageWriteRepository().update_upload_status([Id(value=image.id)], UploadStatusEnum.UPLOADED)
+        self.assertEqual(self.client.get(f"{PROJECTS_URL}{self.project.id}/").json()["images"], ["image.jpg"])
+
+    def test_missed_invalidation_ends_with_the_timeout(self) -> None:
+        self.client.get(f"{PROJECTS_URL}{self.project.id}/")
+        # Updates of a queryset send no signals, as if the invalidation did not reach this process.
+        Project.objects.filter(id=self.project.id).update(name="Renamed project")
+        self.assertEqual(self.client.get(f"{PROJECTS_URL}{self.project.id}/").json()["name"], "Project")
+
+        expired_at: float = time.time() + settings.RESPONSE_CACHE_TIMEOUT + 1
+        with patch("django.core.cache.backends.locmem.time.time", return_value=expired_at):
+            self.assertEqual(self.client.get(f"{PROJECTS_URL}{self.project.id}/").json()["name"], "Renamed project")
+
+    def test_not_found_is_not_cached(self) -> None:
+        self.assertEqual(self.client.get(f"{PROJECTS_URL}{self.project.id + 1}/").status_code, 404)
+        self.assertNotIn("ETag", self.client.get(f"{PROJECTS_URL}{self.project.id + 1}/"))
+
+    def test_responses_expire_before_their_urls(self) -> None:
+        with self.assertRaises(ValueError):
+            VersionedResponseCache(timeout=120, url_safety_margin=120)
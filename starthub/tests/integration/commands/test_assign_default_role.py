@@ -0,0 +1,43 @@
+import time
+from io import StringIO
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from domain.enums.role import RoleEnum
+from domain.models.user import User
+
+
+class TestAssignDefaultRole(TestCase):
+    user_count = 100_000
+    batch_size = 10_000
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        password: str = make_password(None)
+        User.objects.bulk_create(
+            (User(email=f"user{i}@example.com", password=password) for i in range(cls.user_count)), batch_size=10_000
+        )
+
+    def test_assigns_default_role_in_batches(self) -> None:
+        start = time.perf_counter()
+        with CaptureQueriesContext(connection) as context:
+            call_command("assign_default_role", batch_size=self.batch_size, stdout=StringIO())
+        elapsed = time.perf_counter() - start
+
+        self.assertFalse(User.objects.filter(roles__isnull=True).exists())
+        self.assertEqual(User.objects.filter(roles__name=RoleEnum.get_default()).count(), self.user_count)
+        # One insert per batch, not one per user.
+        inserts: int = sum(query["sql"].startswith("INSERT") for query in context.captured_queries)
+        self.assertEqual(inserts, self.user_count // self.batch_size)
+        self.assertLess(elapsed, 60)
+
+    def test_dry_run_changes_nothing(self) -> None:
+        stdout = StringIO()
+
+        call_command("assign_default_role", dry_run=True, stdout=stdout)
+
+        self.assertEqual(stdout.getvalue().strip(), f"{self.user_count} users have no roles.")
+        self.assertEqual(User.objects.filter(roles__isnull=True).count(), self.user_count)
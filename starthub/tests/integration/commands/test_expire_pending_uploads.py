@@ -0,0 +1,78 @@
+from datetime import UTC, date, datetime, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from domain.enums.project_stage import ProjectStageEnum
+from domain.enums.project_status import ProjectStatusEnum
+from domain.enums.upload_status import UploadStatusEnum
+from domain.models.funding_model import FundingModel
+from domain.models.project import Project, ProjectImage
+from domain.models.project_category import ProjectCategory
+from domain.models.user import User
+
+
+class TestExpirePendingUploads(TestCase):
+    project: Project
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.project = Project.objects.create(
+            name="Project",
+            description="description",
+            category=ProjectCategory.objects.create(name="Test category"),
+            creator=User.objects.create_user(email="creator@example.com", password="Pass1234"),
+            funding_model=FundingModel.objects.create(name="Test funding model"),
+            stage=ProjectStageEnum.IDEA,
+            status=ProjectStatusEnum.ACTIVE,
+            goal_sum=1000,
+            deadline=date(2030, 1, 1),
+            plan="projects/plans/plan.pdf",
+        )
+
+    def create_image(self, order: int, upload_status: UploadStatusEnum, started_ago: timedelta) -> ProjectImage:
+        return ProjectImage.objects.create(
+            project=self.project,
+            file_path=f"projects/images/{order}.jpg",
+            order=order,
+            upload_status=upload_status,
+            upload_started_at=datetime.now(UTC) - started_ago,
+        )
+
+    def set_plan_upload(self, upload_status: UploadStatusEnum, started_ago: timedelta) -> None:
+        Project.objects.filter(id=self.project.id).update(
+            plan_upload_status=upload_status, plan_upload_started_at=datetime.now(UTC) - started_ago
+        )
+
+    def expire(self) -> str:
+        stdout = StringIO()
+        call_command("expire_pending_uploads", older_than=3600, stdout=stdout)
+        return stdout.getvalue().strip()
+
+    def test_expires_lost_uploads_and_frees_their_places(self) -> None:
+        uploaded = self.create_image(1, UploadStatusEnum.UPLOADED, timedelta(days=1))
+        self.create_image(2, UploadStatusEnum.PENDING, timedelta(hours=2))
+        self.create_image(3, UploadStatusEnum.PENDING, timedelta(hours=2))
+        recent = self.create_image(4, UploadStatusEnum.PENDING, timedelta(minutes=5))
+        self.set_plan_upload(UploadStatusEnum.PENDING, timedelta(hours=2))
+
+        output: str = self.expire()
+
+        self.assertEqual(output, "Expired 1 pending project plans and 2 pending project images.")
+        self.assertEqual(
+            list(ProjectImage.objects.filter(project=self.project).order_by("order").values_list("id", "order")),
+            [(uploaded.id, 1), (recent.id, 2)],
+        )
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.plan_upload_status, UploadStatusEnum.FAILED)
+
+    def test_keeps_recent_uploads(self) -> None:
+        self.create_image(1, UploadStatusEnum.PENDING, timedelta(minutes=5))
+        self.set_plan_upload(UploadStatusEnum.PENDING, timedelta(minutes=5))
+
+        output: str = self.expire()
+
+        self.assertEqual(output, "Expired 0 pending project plans and 0 pending project images.")
+        self.assertEqual(ProjectImage.objects.filter(upload_status=UploadStatusEnum.PENDING).count(), 1)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.plan_upload_status, UploadStatusEnum.PENDING)
@@ -0,0 +1,75 @@
+from datetime import date
+from typing import Any, Callable
+
+from django.db import connection
+from django.db.models import Model
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from domain.enums.project_stage import ProjectStageEnum
+from domain.enums.project_status import ProjectStatusEnum
+from domain.models.funding_model import FundingModel
+from domain.models.project import Project
+from domain.models.project_category import ProjectCategory
+from domain.models.user import User
+from infrastructure.services.reference_data import funding_models, project_categories
+
+PROJECTS_AMOUNT = 5000
+# The projects are spread evenly over the categories and funding models, independently of each other.
+GROUPS_AMOUNT = 50
+# Every hundredth project has the rare stage and status, half of the others are active.
+RARE_EVERY = 100
+
+
+class ProjectSeedTestCase(TestCase):
+    """Seeds enough projects for the planner to choose the indexes a production database would use."""
+
+    creator: User
+    description: str = "description"
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.creator = User.objects.create_user(email="creator@example.com", password="Pass1234")
+        # The reference data is committed for the tests, rows of an open transaction are not cached.
+        with cls.captureOnCommitCallbacks(execute=True):
+            categories = [ProjectCategory.objects.create(name=f"Category {i}") for i in range(GROUPS_AMOUNT)]
+            funding_models = [FundingModel.objects.create(name=f"Model {i}") for i in range(GROUPS_AMOUNT)]
+        Project.objects.bulk_create(
+            Project(
+                name=f"Project {i}",
+                slug=f"project-{i}",
+                description=cls.description,
+                category=categories[i % GROUPS_AMOUNT],
+                creator=cls.creator,
+                funding_model=funding_models[i // GROUPS_AMOUNT % GROUPS_AMOUNT],
+                stage=ProjectStageEnum.SCALE if i % RARE_EVERY == 2 else ProjectStageEnum.IDEA,
+                status=(
+                    ProjectStatusEnum.SUSPENDED
+                    if i % RARE_EVERY == 3
+                    else ProjectStatusEnum.ACTIVE if i // RARE_EVERY % 2 else ProjectStatusEnum.DRAFT
+                ),
+                goal_sum=1000,
+                deadline=date(2030, 1, 1),
+            )
+            for i in range(PROJECTS_AMOUNT)
+        )
+
+    @staticmethod
+    def analyze(model: type[Model]) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+    def setUp(self) -> None:
+        # Rows loaded by a previous test class may be the ones its rollback removed.
+        with self.captureOnCommitCallbacks(execute=True):
+            project_categories.invalidate()
+            funding_models.invalidate()
+
+    def explain(self, model: type[Model], query: Callable[[], Any]) -> str:
+        """:return: The plan of the query the callable runs on the table of the model."""
+        with CaptureQueriesContext(connection) as context:
+            query()
+        table: str = f'FROM "{model._meta.db_table}"'
+        sql: str = next(i["sql"] for i in context.captured_queries if table in i["sql"])
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN {sql}")
+            return "\n".join(row[0] for row in cursor.fetchall())
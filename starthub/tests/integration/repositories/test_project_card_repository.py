@@ -0,0 +1,115 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from domain.enums.project_stage import ProjectStageEnum
+from domain.enums.project_status import ProjectStatusEnum
+from domain.enums.upload_status import UploadStatusEnum
+from domain.models.company import Company
+from domain.models.country import Country
+from domain.models.funding_model import FundingModel
+from domain.models.project import Project, ProjectImage
+from domain.models.project_card import ProjectCard
+from domain.models.project_category import ProjectCategory
+from domain.value_objects.common import Id, Slug
+from domain.value_objects.filter import ProjectFilter
+from domain.value_objects.project_management import ProjectPagination, ProjectSearch, ProjectStage, ProjectStatus
+from infrastructure.repositories.project_management import DjProjectCardReadRepository, DjProjectImageWriteRepository
+from tests.integration.repositories.project_seed import PROJECTS_AMOUNT, ProjectSeedTestCase
+
+
+class TestDjProjectCardRepository(ProjectSeedTestCase):
+    repository: DjProjectCardReadRepository
+    description = "description " * 100
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.repository = DjProjectCardReadRepository()
+        # Bulk inserts send no signals, the cards are built by the command.
+        call_command("rebuild_project_cards", stdout=StringIO())
+        cls.analyze(ProjectCard)
+
+    def test_rebuild_writes_a_card_per_project(self) -> None:
+        self.assertEqual(ProjectCard.objects.count(), PROJECTS_AMOUNT)
+        card: ProjectCard = ProjectCard.objects.get(slug="project-3")
+        self.assertEqual(len(card.summary), 200)
+        self.assertIsNone(card.company_name)
+        self.assertIsNone(card.cover_path)
+
+    def test_filters_use_their_indexes(self) -> None:
+        cases: dict[str, ProjectFilter] = {
+            "project_cards_status_id_idx": ProjectFilter(status=ProjectStatus(value=ProjectStatusEnum.SUSPENDED)),
+            "project_cards_stage_id_idx": ProjectFilter(stage=ProjectStage(value=ProjectStageEnum.SCALE)),
+            "project_cards_category_idx": ProjectFilter(
+                category_slug=Slug(value="category-3"), status=ProjectStatus(value=ProjectStatusEnum.ACTIVE)
+            ),
+            "project_cards_funding_idx": ProjectFilter(
+                funding_model_slug=Slug(value="model-3"), status=ProjectStatus(value=ProjectStatusEnum.ACTIVE)
+            ),
+        }
+        for index, filter_ in cases.items():
+            with self.subTest(index=index):
+                plan: str = self.explain(
+                    ProjectCard,
+                    lambda: self.repository.get_page(filter_=filter_, pagination=ProjectPagination(limit=20)),
+                )
+
+                self.assertIn(f"Index Scan using {index} on project_cards", plan)
+                self.assertNotIn("Sort", plan)
+                self.assertNotIn("Join", plan)
+
+    def test_page_is_a_single_query(self) -> None:
+        self.repository.get_page(filter_=ProjectFilter(), pagination=ProjectPagination(limit=1))
+
+        with self.assertNumQueries(1):
+            cards: list[ProjectCard] = self.repository.get_page(
+                filter_=ProjectFilter(category_slug=Slug(value="category-3")), pagination=ProjectPagination(limit=20)
+            )
+            for card in cards:
+                self.assertEqual(card.category.slug, "category-3")
+                self.assertTrue(card.funding_model.slug.startswith("model-"))
+
+    def test_cards_follow_the_writes(self) -> None:
+        project: Project = Project.objects.create(
+            name="Solar farm",
+            description="Panels",
+            category=ProjectCategory.objects.get(slug="category-1"),
+            creator=self.creator,
+            funding_model=FundingModel.objects.get(slug="model-1"),
+            stage=ProjectStageEnum.IDEA,
+            status=ProjectStatusEnum.ACTIVE,
+            goal_sum=1000,
+            deadline=date(2030, 1, 1),
+        )
+        self.assertEqual(ProjectCard.objects.get(id=project.id).name, "Solar farm")
+
+        Company.objects.create(
+            name="Company",
+            project=project,
+            country=Country.objects.create(code="ZZ"),
+            business_id="business-id",
+            established_date=date(2020, 1, 1),
+        )
+        image = ProjectImage.objects.create(
+            project=project,
+            file_path="image.jpg",
+            card_path="image-card.jpg",
+            order=1,
+            upload_status=UploadStatusEnum.PENDING,
+        )
+        card: ProjectCard = ProjectCard.objects.get(id=project.id)
+        self.assertEqual((card.company_name, card.cover_path), ("Company", None))
+
+        DjProjectImageWriteRepository().update_upload_status([Id(value=image.id)], UploadStatusEnum.UPLOADED)
+        self.assertEqual(ProjectCard.objects.get(id=project.id).cover_path, "image-card.jpg")
+
+        project.name = "Wind farm"
+        project.save()
+        cards: list[ProjectCard] = self.repository.get_page(
+            filter_=ProjectFilter(search=ProjectSearch(value="wind")), pagination=ProjectPagination(limit=20)
+        )
+        self.assertEqual([card.id for card in cards], [project.id])
+
+        project.delete()
+        self.assertFalse(ProjectCard.objects.filter(id=project.id).exists())
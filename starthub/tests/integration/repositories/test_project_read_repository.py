@@ -0,0 +1,145 @@
+import time
+from unittest.mock import patch
+
+from config import settings
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from domain.enums.project_stage import ProjectStageEnum
+from domain.enums.project_status import ProjectStatusEnum
+from domain.exceptions.project_management import ProjectCategoryNotFoundException
+from domain.models.project import Project
+from domain.models.project_category import ProjectCategory
+from domain.value_objects.common import Id, Slug
+from domain.value_objects.filter import ProjectCategoryFilter, ProjectFilter
+from domain.value_objects.project_management import ProjectPagination, ProjectSearch, ProjectStage, ProjectStatus
+from infrastructure.repositories.project_management import (
+    DjProjectCategoryReadRepository,
+    DjProjectReadRepository,
+    has_trigram_search,
+)
+from infrastructure.services.reference_data import project_categories
+from tests.integration.repositories.project_seed import ProjectSeedTestCase
+
+
+class TestDjProjectReadRepository(ProjectSeedTestCase):
+    repository: DjProjectReadRepository
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.repository = DjProjectReadRepository()
+        cls.analyze(Project)
+
+    def _explain_page(self, filter_: ProjectFilter) -> str:
+        return self.explain(
+            Project, lambda: self.repository.get_page(filter_=filter_, pagination=ProjectPagination(limit=20))
+        )
+
+    def test_filters_use_their_indexes(self) -> None:
+        cases: dict[str, ProjectFilter] = {
+            "projects_status_id_idx": ProjectFilter(status=ProjectStatus(value=ProjectStatusEnum.SUSPENDED)),
+            "projects_stage_id_idx": ProjectFilter(stage=ProjectStage(value=ProjectStageEnum.SCALE)),
+            "projects_category_status_idx": ProjectFilter(
+                category_slug=Slug(value="category-3"), status=ProjectStatus(value=ProjectStatusEnum.ACTIVE)
+            ),
+            "projects_funding_status_idx": ProjectFilter(
+                funding_model_slug=Slug(value="model-3"), status=ProjectStatus(value=ProjectStatusEnum.ACTIVE)
+            ),
+        }
+        for index, filter_ in cases.items():
+            with self.subTest(index=index):
+                plan: str = self._explain_page(filter_)
+                self.assertIn(f"Index Scan using {index} on projects", plan)
+                # The index returns the projects ordered, only the joined tables may be sorted.
+                self.assertNotIn("Sort Key: projects.", plan)
+
+    def test_slug_filters_compare_foreign_keys(self) -> None:
+        filter_ = ProjectFilter(category_slug=Slug(value="category-3"))
+        with CaptureQueriesContext(connection) as context:
+            projects: list[Project] = self.repository.get_page(filter_=filter_, pagination=ProjectPagination(limit=100))
+
+        self.assertEqual(len(projects), 100)
+        sql: str = next(query["sql"] for query in context.captured_queries if 'FROM "projects"' in query["sql"])
+        self.assertIn(f'WHERE "projects"."category_id" = {projects[0].category_id} ', sql)
+
+    def test_unknown_slug_finds_nothing(self) -> None:
+        filter_ = ProjectFilter(category_slug=Slug(value="unknown-category"))
+        self.assertEqual(self.repository.get_page(filter_=filter_, pagination=ProjectPagination(limit=20)), [])
+
+    def test_renamed_category_is_found_by_its_new_slug(self) -> None:
+        category = ProjectCategory.objects.get(slug="category-3")
+        self.repository.get_page(
+            filter_=ProjectFilter(category_slug=Slug(value="category-3")), pagination=ProjectPagination(limit=1)
+        )
+        ProjectCategory.objects.filter(id=category.id).update(slug="renamed-category")
+        category.refresh_from_db()
+        category.save()
+
+        projects: list[Project] = self.repository.get_page(
+            filter_=ProjectFilter(category_slug=Slug(value="renamed-category")), pagination=ProjectPagination(limit=1)
+        )
+        self.assertEqual(projects[0].category_id, category.id)
+
+    def test_listing_reads_reference_data_from_the_cache(self) -> None:
+        filter_ = ProjectFilter(category_slug=Slug(value="category-3"))
+        self.repository.get_page(filter_=filter_, pagination=ProjectPagination(limit=1))
+
+        with self.assertNumQueries(2):
+            projects: list[Project] = self.repository.get_page(filter_=filter_, pagination=ProjectPagination(limit=20))
+            for project in projects:
+                self.assertEqual(project.category.slug, "category-3")
+                self.assertTrue(project.funding_model.slug.startswith("model-"))
+
+    def test_created_category_is_found(self) -> None:
+        category_repository = DjProjectCategoryReadRepository()
+        category_repository.get_all(ProjectCategoryFilter())
+
+        category = ProjectCategory.objects.create(name="New category")
+
+        category_id = Id(value=category.id)
+        self.assertEqual(category_repository.get_by_id(category_id), category)
+        category.delete()
+        with self.assertRaises(ProjectCategoryNotFoundException):
+            category_repository.get_by_id(category_id)
+
+    def test_rolled_back_category_is_not_cached(self) -> None:
+        category_repository = DjProjectCategoryReadRepository()
+        with transaction.atomic():
+            category = ProjectCategory.objects.create(name="Rolled back category")
+            self.assertEqual(category_repository.get_by_id(Id(value=category.id)), category)
+            transaction.set_rollback(True)
+
+        with self.assertRaises(ProjectCategoryNotFoundException):
+            category_repository.get_by_id(Id(value=category.id))
+
+    def test_missed_invalidation_ends_with_the_version(self) -> None:
+        project_categories.get_all()
+        # Bulk inserts send no signals, as if the invalidation was missed.
+        ProjectCategory.objects.bulk_create([ProjectCategory(name="Unsignaled category", slug="unsignaled-category")])
+        self.assertIsNone(project_categories.get_id("unsignaled-category"))
+
+        expired_at: float = time.time() + settings.REFERENCE_DATA_VERSION_TIMEOUT + 1
+        with patch("django.core.cache.backends.locmem.time.time", return_value=expired_at):
+            self.assertIsNotNone(project_categories.get_id("unsignaled-category"))
+
+    def test_search_uses_its_index(self) -> None:
+        Project.objects.filter(id__in=Project.objects.order_by("id").values("id")[:10]).update(
+            description="A zebra crossing"
+        )
+
+        # A table this small is read faster whole, the plan only has to show the index serves the search.
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        plan: str = self._explain_page(ProjectFilter(search=ProjectSearch(value="zebra")))
+
+        self.assertIn("Bitmap Index Scan on projects_search_vector_idx", plan)
+
+    def test_search_tolerates_a_typo(self) -> None:
+        if not has_trigram_search():
+            self.skipTest("The database server does not provide pg_trgm.")
+        Project.objects.filter(slug="project-7").update(name="Zebra crossing")
+
+        projects: list[Project] = self.repository.get_page(
+            filter_=ProjectFilter(search=ProjectSearch(value="zebar crossing")), pagination=ProjectPagination(limit=20)
+        )
+        self.assertEqual([project.slug for project in projects], ["project-7"])
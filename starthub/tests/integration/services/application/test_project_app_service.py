@@ -0,0 +1,219 @@
+from datetime import date
+from typing import Iterable
+from unittest.mock import patch
+
+from application.dto.project import ProjectDto
+from application.services.gateway import gateway
+from application.services.project import ProjectAppService
+from django.db import connection
+from django.http import QueryDict
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from domain.enums.project_sort import ProjectSortEnum
+from domain.enums.project_stage import ProjectStageEnum
+from domain.enums.project_status import ProjectStatusEnum
+from domain.exceptions.project_management import (
+    InvalidProjectCursorException,
+    InvalidProjectFieldsException,
+    InvalidProjectSearchException,
+    InvalidProjectSortException,
+    InvalidProjectViewException,
+)
+from domain.models.company import Company, CompanyFounder
+from domain.models.country import Country
+from domain.models.funding_model import FundingModel
+from domain.models.project import Project, ProjectImage
+from domain.models.project_category import ProjectCategory
+from domain.models.user import User
+from domain.value_objects.cloud_storage import CloudStorageCreateUrlsPayload
+from domain.value_objects.common import Id
+from infrastructure.cloud_storages.google import GoogleCloudStorage
+from infrastructure.repositories.project_management import DjProjectCardWriteRepository
+
+PROJECTS_AMOUNT = 12
+IMAGES_PER_PROJECT = 3
+
+
+def sign_paths(payload: CloudStorageCreateUrlsPayload) -> dict[str, str]:
+    return {file_path: file_path for file_path in payload.file_paths}
+
+
+def refresh_cards(projects: Iterable[Project]) -> None:
+    """Queryset updates send no signals, the cards are refreshed like after a save."""
+    DjProjectCardWriteRepository().refresh([Id(value=project.id) for project in projects])
+
+
+class TestProjectAppServiceGet(TestCase):
+    service: ProjectAppService
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        creator = User.objects.create_user(
+            email="creator@example.com", first_name="first_name", last_name="last_name", password="Pass1234"
+        )
+        # The reference data is committed for the tests, rows of an open transaction are not cached.
+        with cls.captureOnCommitCallbacks(execute=True):
+            category = ProjectCategory.objects.create(name="Test category")
+            funding_model = FundingModel.objects.create(name="Test funding model")
+            country = Country.objects.create(code="ZZ")
+
+        for i in range(PROJECTS_AMOUNT):
+            project = Project.objects.create(
+                name=f"Project {i}",
+                description="description",
+                category=category,
+                creator=creator,
+                funding_model=funding_model,
+                stage=ProjectStageEnum.IDEA,
+                status=ProjectStatusEnum.ACTIVE,
+                goal_sum=1000,
+                deadline=date(2030, 1, 1),
+            )
+            company = Company.objects.create(
+                name=f"Company {i}",
+                project=project,
+                country=country,
+                business_id=f"business-id-{i}",
+                established_date=date(2020, 1, 1),
+            )
+            CompanyFounder.objects.create(name="name", surname="surname", company=company, description="description")
+            for order in range(IMAGES_PER_PROJECT, 0, -1):
+                ProjectImage.objects.create(project=project, file_path=f"project-{i}/image-{order}.jpg", order=order)
+
+    def setUp(self) -> None:
+        self.service = gateway.project_app_service
+        # Categories, funding models and countries are loaded once per process, not by every listing.
+        with patch.object(GoogleCloudStorage, "create_urls", side_effect=sign_paths):
+            self.service.get(QueryDict("limit=1"))
+
+    def test_number_of_queries_does_not_depend_on_page_size(self) -> None:
+        with patch.object(GoogleCloudStorage, "create_urls", side_effect=sign_paths):
+            for limit in (1, 5, PROJECTS_AMOUNT):
+                with self.subTest(limit=limit), self.assertNumQueries(1):
+                    project_page = self.service.get(QueryDict(f"limit={limit}"))
+                    self.assertEqual(len(project_page.results), limit)
+
+    def test_listing_returns_the_first_image_as_cover(self) -> None:
+        with patch.object(GoogleCloudStorage, "create_urls", side_effect=sign_paths):
+            project_page = self.service.get(QueryDict(f"limit={PROJECTS_AMOUNT}"))
+
+        for project_dto in project_page.results:
+            self.assertTrue(project_dto.cover_url.endswith("image-1.jpg"))
+            self.assertEqual(project_dto.summary, "description")
+
+    def test_fields_load_only_their_columns(self) -> None:
+        with patch.object(GoogleCloudStorage, "create_urls", side_effect=sign_paths):
+            with CaptureQueriesContext(connection) as context:
+                project_page = self.service.get(QueryDict("limit=5&sort=deadline&fields=name,cover_url,category"))
+
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertNotIn('"summary"', context.captured_queries[0]["sql"])
+        for result in project_page.results:
+            self.assertEqual(list(result), ["name", "cover_url", "category"])
+            self.assertTrue(result["cover_url"].endswith("image-1.jpg"))
+            self.assertEqual(result["category"].name, "Test category")
+        self.assertIsNotNone(project_page.next_cursor)
+
+    def test_full_view_returns_projects(self) -> None:
+        with patch.object(GoogleCloudStorage, "create_urls", side_effect=sign_paths):
+            project_page = self.service.get(QueryDict("limit=5&view=full"))
+
+        for project_dto in project_page.results:
+            self.assertIsInstance(project_dto, ProjectDto)
+            self.assertEqual(len(project_dto.images), 1)
+            self.assertEqual(project_dto.company.founder.name, "name")
+
+    def test_invalid_view_or_fields(self) -> None:
+        for query in (
+            "limit=1&view=tiny",
+            "limit=1&fields=name,password",
+            "limit=1&fields=",
+            "limit=1&view=full&fields=id",
+        ):
+            with (
+                self.subTest(query=query),
+                self.assertRaises((InvalidProjectViewException, InvalidProjectFieldsException)),
+            ):
+                self.service.get(QueryDict(query))
+
+    def test_cursor_pages_follow_the_sort(self) -> None:
+        """Every project has the same deadline and goal, the id breaks the ties."""
+        Project.objects.filter(id__in=Project.objects.order_by("id").values("id")[:4]).update(current_sum=10)
+        refresh_cards(Project.objects.all())
+        expected_orders: dict[str, list[int]] = {
+            ProjectSortEnum.NEWEST: list(Project.objects.order_by("-id").values_list("id", flat=True)),
+            ProjectSortEnum.DEADLINE: list(Project.objects.order_by("deadline", "id").values_list("id", flat=True)),
+            ProjectSortEnum.GOAL_SUM: list(Project.objects.order_by("-goal_sum", "-id").values_list("id", flat=True)),
+            ProjectSortEnum.CURRENT_SUM: list(
+                Project.objects.order_by("-current_sum", "-id").values_list("id", flat=True)
+            ),
+        }
+
+        with patch.object(GoogleCloudStorage, "create_urls", side_effect=sign_paths):
+            for sort, expected_order in expected_orders.items():
+                with self.subTest(sort=sort):
+                    ids: list[int] = list()
+                    query = QueryDict(f"limit=5&sort={sort}", mutable=True)
+                    while True:
+                        with self.assertNumQueries(1):
+                            project_page = self.service.get(query)
+                        ids.extend(project_dto.id for project_dto in project_page.results)
+                        if project_page.next_cursor is None:
+                            break
+                        query["cursor"] = project_page.next_cursor
+                    self.assertEqual(ids, expected_order)
+
+    def test_invalid_cursor(self) -> None:
+        newest_page = self.service.get(QueryDict("limit=1"))
+        for query in ("limit=1&cursor=not-a-cursor", f"limit=1&sort=deadline&cursor={newest_page.next_cursor}"):
+            with self.subTest(query=query), self.assertRaises(InvalidProjectCursorException):
+                self.service.get(QueryDict(query))
+
+    def test_total_is_counted_on_request(self) -> None:
+        # The unfiltered total is the planner estimate, statistics are kept when other tests roll back their rows.
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Project._meta.db_table}")
+
+        with patch.object(GoogleCloudStorage, "create_urls", side_effect=sign_paths):
+            self.assertIsNone(self.service.get(QueryDict("limit=1")).total)
+            self.assertEqual(self.service.get(QueryDict("limit=1&with_total=true")).total, PROJECTS_AMOUNT)
+            self.assertEqual(
+                self.service.get(QueryDict("limit=1&with_total=true&status=active")).total, PROJECTS_AMOUNT
+            )
+
+    def test_search_ranks_names_above_descriptions(self) -> None:
+        projects: list[Project] = list(Project.objects.order_by("id")[:3])
+        projects[0].description = "Panels for a solar farm"
+        projects[1].name = "Solar roofs"
+        projects[2].name = "Solarium"
+        Project.objects.bulk_update(projects, ["name", "description"])
+        refresh_cards(projects)
+
+        ids: list[int] = list()
+        query = QueryDict("limit=1&search=sola", mutable=True)
+        with patch.object(GoogleCloudStorage, "create_urls", side_effect=sign_paths):
+            while True:
+                project_page = self.service.get(query)
+                ids.extend(project_dto.id for project_dto in project_page.results)
+                if project_page.next_cursor is None:
+                    break
+                query["cursor"] = project_page.next_cursor
+
+        # Names weigh more than descriptions, the id breaks the tie of the names.
+        self.assertEqual(ids, [projects[2].id, projects[1].id, projects[0].id])
+
+    def test_search_filters_other_sorts(self) -> None:
+        project: Project = Project.objects.order_by("id").first()
+        Project.objects.filter(id=project.id).update(name="Green city garden")
+        refresh_cards([project])
+
+        with patch.object(GoogleCloudStorage, "create_urls", side_effect=sign_paths):
+            project_page = self.service.get(QueryDict("limit=5&search=city+GREEN&sort=deadline"))
+
+        self.assertEqual([project_dto.id for project_dto in project_page.results], [project.id])
+
+    def test_invalid_search(self) -> None:
+        with self.assertRaises(InvalidProjectSearchException):
+            self.service.get(QueryDict("limit=1&search=%26%21"))
+        with self.assertRaises(InvalidProjectSortException):
+            self.service.get(QueryDict("limit=1&sort=relevance"))
@@ -26,7 +26,9 @@ class TestUserAppService(TestCase):
             password="Pass1234",
         )
         cls.user_id = user.id
-        cls.service = gateway.user_app_service
+
+    def setUp(self) -> None:
+        self.service = gateway.user_app_service
 
     def test_success_update_first_name(self) -> None:
         self.service.update_user(
@@ -1,13 +1,22 @@
 from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import patch
 
-from django.test import TestCase
-from domain.exceptions.auth import InvalidCredentialsException, TokenExpiredException
+import jwt
+from config import settings
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from domain.constants import JWT_ALGORITHM
+from domain.enums.token import TokenTypeEnum
+from domain.exceptions.auth import InvalidCredentialsException, InvalidTokenException, TokenExpiredException
 from domain.models.user import User
 from domain.services.auth import AuthService, TokenService
 from domain.value_objects.auth import LoginCredentials
-from domain.value_objects.token import AccessTokenVo, RefreshTokenVo, TokenPairVo
+from domain.value_objects.token import AccessTokenVo, RefreshPayload, RefreshTokenVo, TokenPairVo
 from domain.value_objects.user import Email, RawPassword
 from infrastructure.repositories.user import DjUserReadRepository, DjUserWriteRepository
+from infrastructure.services.revocation_index import BloomFilter, BloomRevocationIndex, revocation_index
 from loguru import logger
 
 
@@ -17,7 +26,6 @@ class TestAuthService(TestCase):
 
     @classmethod
     def setUpTestData(cls) -> None:
-        cls.service = AuthService(TokenService(secret_key="secret"), DjUserReadRepository(), DjUserWriteRepository())
         cls.user_data = {
             "first_name": "first_name",
             "last_name": "last_name",
@@ -32,6 +40,11 @@ class TestAuthService(TestCase):
         )
         cls.user_id = user.id
 
+    def setUp(self) -> None:
+        self.service = AuthService(
+            TokenService(secret_key="secret"), DjUserReadRepository(), DjUserWriteRepository(), revocation_index
+        )
+
     def test_success_login(self) -> None:
         credentials = LoginCredentials(
             email=Email(value=self.user_data["email"]),
@@ -45,6 +58,39 @@ class TestAuthService(TestCase):
         self.assertIsInstance(token_pair.access.value, str)
         self.assertIsInstance(token_pair.refresh.value, str)
 
+    def test_login_with_fetched_user_updates_only_last_login(self) -> None:
+        credentials = LoginCredentials(
+            email=Email(value=self.user_data["email"]),
+            password=RawPassword(value=self.user_data["password"]),
+        )
+        user: User = self.service.get_user_by_email(credentials.email)
+
+        with CaptureQueriesContext(connection) as context:
+            self.service.login(credentials, user=user)
+
+        self.assertEqual(len(context.captured_queries), 1)
+        update_sql: str = context.captured_queries[0]["sql"]
+        self.assertTrue(update_sql.startswith("UPDATE"))
+        self.assertIn('"last_login"', update_sql)
+        self.assertNotIn('"password"', update_sql)
+
+    def test_login_rehashes_password_after_policy_change(self) -> None:
+        credentials = LoginCredentials(
+            email=Email(value=self.user_data["email"]),
+            password=RawPassword(value=self.user_data["password"]),
+        )
+        scrypt_hashers: list[str] = [settings.PASSWORD_HASHER_CLASSES["scrypt"], *settings.PASSWORD_HASHERS]
+        policies: list[tuple[str, dict[str, Any]]] = [
+            ("pbkdf2_sha256$1000$", {"PBKDF2_ITERATIONS": 1000}),
+            ("scrypt$1024$", {"PASSWORD_HASHERS": scrypt_hashers, "SCRYPT_WORK_FACTOR": 1024}),
+            ("scrypt$2048$", {"PASSWORD_HASHERS": scrypt_hashers, "SCRYPT_WORK_FACTOR": 2048}),
+        ]
+
+        for prefix, overrides in policies:
+            with self.subTest(prefix=prefix), override_settings(**overrides):
+                self.service.login(credentials)
+                self.assertTrue(User.objects.get(id=self.user_id).password.startswith(prefix))
+
     def test_login_with_invalid_credentials(self) -> None:
         credentials_1 = LoginCredentials(
             email=Email(value="not.existing@example.com"),
@@ -77,6 +123,7 @@ class TestAuthService(TestCase):
             TokenService(secret_key="secret", refresh_token_lifetime=-100),
             DjUserReadRepository(),
             DjUserWriteRepository(),
+            revocation_index,
         )
         credentials = LoginCredentials(
             email=Email(value=self.user_data["email"]),
@@ -90,6 +137,110 @@ class TestAuthService(TestCase):
         with self.assertRaises(TokenExpiredException):
             self.service.reissue_refresh(token_pair.refresh)
 
+    def test_reissue_does_not_look_up_the_user(self) -> None:
+        credentials = LoginCredentials(
+            email=Email(value=self.user_data["email"]),
+            password=RawPassword(value=self.user_data["password"]),
+        )
+        token_pair: TokenPairVo = self.service.login(credentials)
+        self.service.reissue(token_pair.refresh)
+
+        with CaptureQueriesContext(connection) as context:
+            reissued_pair: TokenPairVo = self.service.reissue(token_pair.refresh)
+
+        self.assertEqual(len(context.captured_queries), 0)
+        self.assertEqual(reissued_pair.refresh, token_pair.refresh)
+        self.assertEqual(TokenService(secret_key="secret").verify_access(reissued_pair.access).sub, str(self.user_id))
+
+    def test_logout_revokes_refresh_token(self) -> None:
+        credentials = LoginCredentials(
+            email=Email(value=self.user_data["email"]),
+            password=RawPassword(value=self.user_data["password"]),
+        )
+        token_pair: TokenPairVo = self.service.login(credentials)
+        other_token_pair: TokenPairVo = self.service.login(credentials)
+
+        self.service.logout(token_pair.refresh)
+
+        with self.assertRaises(InvalidTokenException):
+            self.service.reissue_access(token_pair.refresh)
+        self.assertIsInstance(self.service.reissue_access(other_token_pair.refresh), AccessTokenVo)
+
+    def test_logout_is_seen_by_other_processes_at_once(self) -> None:
+        other_index = BloomRevocationIndex(capacity=1000, rebuild_interval=300)
+        other_service = AuthService(
+            TokenService(secret_key="secret"), DjUserReadRepository(), DjUserWriteRepository(), other_index
+        )
+        credentials = LoginCredentials(
+            email=Email(value=self.user_data["email"]),
+            password=RawPassword(value=self.user_data["password"]),
+        )
+        token_pair: TokenPairVo = self.service.login(credentials)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.logout(token_pair.refresh)
+
+        # The filter of the other process has not loaded the revoked row yet.
+        with patch.object(other_index, "_sync", return_value=BloomFilter(capacity=1000)):
+            with self.assertRaises(InvalidTokenException):
+                other_service.reissue_access(token_pair.refresh)
+
+    def test_rotated_refresh_token_can_not_be_reused(self) -> None:
+        auth_service = AuthService(
+            TokenService(secret_key="secret"),
+            DjUserReadRepository(),
+            DjUserWriteRepository(),
+            revocation_index,
+            refresh_token_rotation_age=0,
+        )
+        credentials = LoginCredentials(
+            email=Email(value=self.user_data["email"]),
+            password=RawPassword(value=self.user_data["password"]),
+        )
+        token_pair: TokenPairVo = auth_service.login(credentials)
+
+        reissued_pair: TokenPairVo = auth_service.reissue(token_pair.refresh)
+
+        self.assertNotEqual(reissued_pair.refresh, token_pair.refresh)
+        with self.assertRaises(InvalidTokenException):
+            auth_service.reissue(token_pair.refresh)
+        self.assertIsInstance(auth_service.reissue(reissued_pair.refresh), TokenPairVo)
+
+    def test_legacy_refresh_token_is_rotated(self) -> None:
+        issued_at = int(datetime.now(UTC).timestamp())
+        # Issued before refresh tokens carried the email and jti claims.
+        legacy_token = RefreshTokenVo(
+            value=jwt.encode(
+                {"sub": str(self.user_id), "iat": issued_at, "exp": issued_at + 3600, "type": TokenTypeEnum.REFRESH},
+                "secret",
+                algorithm=JWT_ALGORITHM,
+            )
+        )
+
+        reissued_pair: TokenPairVo = self.service.reissue(legacy_token)
+
+        token_service = TokenService(secret_key="secret")
+        refresh_payload: RefreshPayload = token_service.verify_refresh(reissued_pair.refresh)
+        self.assertFalse(refresh_payload.is_legacy)
+        self.assertEqual(refresh_payload.email, self.user_data["email"])
+        self.assertEqual(token_service.verify_access(reissued_pair.access).email, self.user_data["email"])
+        with self.assertRaises(InvalidTokenException):
+            self.service.reissue(legacy_token)
+        self.assertIsInstance(self.service.reissue(reissued_pair.refresh), TokenPairVo)
+
+    def test_deleted_user_tokens_are_revoked(self) -> None:
+        user = User.objects.create_user(email="deleted@example.com", password=self.user_data["password"])
+        credentials = LoginCredentials(
+            email=Email(value=user.email),
+            password=RawPassword(value=self.user_data["password"]),
+        )
+        token_pair: TokenPairVo = self.service.login(credentials)
+
+        user.delete()
+
+        with self.assertRaises(InvalidTokenException):
+            self.service.reissue_access(token_pair.refresh)
+
     def test_protected_authenticate_user_with_correct_credentials(self) -> None:
         """:raises ValueError:"""
         credentials = LoginCredentials(
@@ -1,6 +1,7 @@
 from application.service_factories.domain_service.permission import PermissionServiceFactory
 from django.test import TestCase
 from domain.enums.permission import ActionEnum, ScopeEnum
+from domain.exceptions.user import UserNotFoundException
 from domain.models import Project
 from domain.models.permission import Permission
 from domain.models.role import Role
@@ -13,7 +14,6 @@ from loguru import logger
 class TestPermissionService(TestCase):
     @classmethod
     def setUpTestData(cls):
-        cls.service = PermissionServiceFactory.create_service()
         logger.info(f"all_roles: {Role.objects.all()}")
         logger.info(f"all_permissions: {Permission.objects.all()}")
         cls.blogger = User.objects.create_user(
@@ -22,6 +22,9 @@ class TestPermissionService(TestCase):
         cls.blogger_role = Role.objects.get(name="blogger")
         cls.blogger.roles.add(cls.blogger_role)
 
+    def setUp(self):
+        self.service = PermissionServiceFactory.create_service()
+
     def test_valid_permission_create(self):
         permission_1 = self.service.create_permission_vo(Project, ActionEnum.CHANGE, ScopeEnum.ANY)
         permission_2 = self.service.create_permission_vo(Project, ActionEnum.CHANGE, ScopeEnum.ANY, field="description")
@@ -54,3 +57,46 @@ class TestPermissionService(TestCase):
         permission = PermissionVo(value="add.any.another_model")
         result = self.service.has_permission(user_id=Id(value=self.blogger.id), permission_vo=permission)
         self.assertFalse(result)
+
+    def test_permissions_are_cached(self):
+        permission = PermissionVo(value="add.any.news")
+        self.service.has_permission(user_id=Id(value=self.blogger.id), permission_vo=permission)
+
+        with self.assertNumQueries(0):
+            result = self.service.has_permission(user_id=Id(value=self.blogger.id), permission_vo=permission)
+        self.assertTrue(result)
+
+    def test_has_permissions(self):
+        permissions = [PermissionVo(value="add.any.news"), PermissionVo(value="add.any.another_model")]
+
+        result = self.service.has_permissions(user_id=Id(value=self.blogger.id), permission_vos=permissions)
+
+        self.assertEqual(result, {"add.any.news": True, "add.any.another_model": False})
+
+    def test_not_existing_user(self):
+        with self.assertRaises(UserNotFoundException):
+            self.service.has_permission(user_id=Id(value=0), permission_vo=PermissionVo(value="add.any.news"))
+
+    def test_removed_role_is_not_cached(self):
+        permission = PermissionVo(value="add.any.news")
+        self.service.has_permission(user_id=Id(value=self.blogger.id), permission_vo=permission)
+
+        self.blogger.roles.remove(self.blogger_role)
+
+        self.assertFalse(self.service.has_permission(user_id=Id(value=self.blogger.id), permission_vo=permission))
+
+    def test_role_removed_from_users_side_is_not_cached(self):
+        permission = PermissionVo(value="add.any.news")
+        self.service.has_permission(user_id=Id(value=self.blogger.id), permission_vo=permission)
+
+        self.blogger_role.users.remove(self.blogger)
+
+        self.assertFalse(self.service.has_permission(user_id=Id(value=self.blogger.id), permission_vo=permission))
+
+    def test_permission_added_to_role_is_not_cached(self):
+        permission = PermissionVo(value="add.any.project")
+        self.assertFalse(self.service.has_permission(user_id=Id(value=self.blogger.id), permission_vo=permission))
+
+        self.blogger_role.permissions.add(Permission.objects.create(name=permission.value))
+
+        self.assertTrue(self.service.has_permission(user_id=Id(value=self.blogger.id), permission_vo=permission))
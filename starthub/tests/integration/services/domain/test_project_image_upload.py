@@ -0,0 +1,280 @@
+from datetime import date
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Event, Lock
+
+from config.settings import BASE_DIR
+from django.db import transaction
+from django.test import TransactionTestCase
+from domain.constants import PROJECT_IMAGES_MAX_AMOUNT
+from domain.enums.image_variant import ImageVariantEnum
+from domain.enums.project_stage import ProjectStageEnum
+from domain.enums.project_status import ProjectStatusEnum
+from domain.enums.upload_status import UploadStatusEnum
+from domain.exceptions.project_management import ProjectImageMaxAmountException
+from domain.models.funding_model import FundingModel
+from domain.models.project import Project, ProjectImage
+from domain.models.project_category import ProjectCategory
+from domain.models.user import User
+from domain.ports.cloud_storage import AbstractCloudStorage
+from domain.ports.image_processor import AbstractImageProcessor
+from domain.services.project_management import ProjectImageService
+from domain.utils.file_stream import FileStream
+from domain.value_objects.cloud_storage import (
+    CloudStorageCreateUrlPayload,
+    CloudStorageCreateUrlsPayload,
+    CloudStorageDeletePayload,
+    CloudStorageUploadPayload,
+)
+from domain.value_objects.common import Id
+from domain.value_objects.file import ImageFile
+from domain.value_objects.project_management import (
+    ProjectImageCreateCommand,
+    ProjectImageCreatePayload,
+    ProjectImageDeleteCommand,
+    ProjectImagesCreateCommand,
+)
+from infrastructure.repositories.project_management import (
+    DjProjectImageReadRepository,
+    DjProjectImageWriteRepository,
+    DjProjectReadRepository,
+)
+from infrastructure.services.upload_queue import ThreadPoolUploadQueue
+
+
+class DirectoryCloudStorage(AbstractCloudStorage):
+    """Stores files in a local directory, fails the first `failures` uploads."""
+
+    def __init__(self, root: Path, failures: int = 0):
+        self._root = root
+        self._failures = failures
+        self._lock = Lock()
+
+    def upload_file(self, payload: CloudStorageUploadPayload) -> str:
+        with self._lock:
+            if self._failures > 0:
+                self._failures -= 1
+                raise OSError("Upload failed.")
+        path = self._root / payload.file_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"".join(payload.file.chunks()))
+        return payload.file_path
+
+    def delete_file(self, payload: CloudStorageDeletePayload) -> None:
+        (self._root / payload.file_path).unlink()
+
+    def create_url(self, payload: CloudStorageCreateUrlPayload) -> str:
+        return (self._root / payload.file_path).as_uri()
+
+    def create_urls(self, payload: CloudStorageCreateUrlsPayload) -> dict[str, str]:
+        return {i: (self._root / i).as_uri() for i in payload.file_paths}
+
+
+class GatedCloudStorage(DirectoryCloudStorage):
+    """Holds every upload until `release` is set."""
+
+    def __init__(self, root: Path, failures: int = 0):
+        super().__init__(root, failures)
+        self.release = Event()
+
+    def upload_file(self, payload: CloudStorageUploadPayload) -> str:
+        self.release.wait(timeout=10)
+        return super().upload_file(payload)
+
+
+class StaticImageProcessor(AbstractImageProcessor):
+    """Returns the name of a variant as its image, so the tests do not depend on ImageMagick."""
+
+    def __init__(self) -> None:
+        self.calls: int = 0
+
+    def create_variants(
+        self, images: list[FileStream], variants: tuple[ImageVariantEnum, ...]
+    ) -> list[dict[ImageVariantEnum, bytes]]:
+        self.calls += 1
+        return [{variant: variant.encode() for variant in variants} for _ in images]
+
+
+class TestProjectImageUpload(TransactionTestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        creator = User.objects.create_user(
+            email="creator@example.com", first_name="first_name", last_name="last_name", password="Pass1234"
+        )
+        self.project = Project.objects.create(
+            name="Project",
+            description="description",
+            category=ProjectCategory.objects.create(name="Test category"),
+            creator=creator,
+            funding_model=FundingModel.objects.create(name="Test funding model"),
+            stage=ProjectStageEnum.IDEA,
+            status=ProjectStatusEnum.ACTIVE,
+            goal_sum=1000,
+            deadline=date(2030, 1, 1),
+        )
+        with open(BASE_DIR / "tests/images/miku.jpg", "rb") as image_file:
+            self.command = ProjectImageCreateCommand(
+                user_id=Id(value=creator.id),
+                project_id=Id(value=self.project.id),
+                image_file=ImageFile(value=FileStream.from_bytes(image_file.read())),
+            )
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def create_service(
+        self,
+        cloud_storage: AbstractCloudStorage,
+        upload_queue: ThreadPoolUploadQueue,
+        image_processor: AbstractImageProcessor | None = None,
+    ) -> ProjectImageService:
+        return ProjectImageService(
+            project_image_read_repository=DjProjectImageReadRepository(),
+            project_image_write_repository=DjProjectImageWriteRepository(),
+            project_read_repository=DjProjectReadRepository(),
+            cloud_storage=cloud_storage,
+            upload_queue=upload_queue,
+            image_processor=image_processor or StaticImageProcessor(),
+        )
+
+    def test_image_is_uploaded_in_background(self) -> None:
+        cloud_storage = DirectoryCloudStorage(self.root, failures=1)
+        upload_queue = ThreadPoolUploadQueue(cloud_storage=cloud_storage, max_workers=2, retry_delay=0)
+        service = self.create_service(cloud_storage, upload_queue)
+
+        project_image: ProjectImage = service.create(self.command)
+        upload_queue.wait(timeout=10)
+
+        project_image.refresh_from_db()
+        self.assertEqual(project_image.upload_status, UploadStatusEnum.UPLOADED)
+        for variant in ImageVariantEnum:
+            self.assertEqual((self.root / project_image.get_path(variant)).read_bytes(), variant.encode())
+        self.assertEqual(len(set(project_image.paths)), len(ImageVariantEnum))
+        self.assertEqual(len(service.get_urls(Id(value=self.project.id))), 1)
+
+    def test_delete_removes_all_variants(self) -> None:
+        cloud_storage = DirectoryCloudStorage(self.root)
+        upload_queue = ThreadPoolUploadQueue(cloud_storage=cloud_storage, max_workers=2, retry_delay=0)
+        service = self.create_service(cloud_storage, upload_queue)
+        project_image: ProjectImage = service.create(self.command)
+        upload_queue.wait(timeout=10)
+
+        service.delete(
+            ProjectImageDeleteCommand(
+                user_id=self.command.user_id, project_id=self.command.project_id, image_order=project_image.order
+            )
+        )
+
+        for path in project_image.paths:
+            self.assertFalse((self.root / path).exists())
+
+    def test_failed_upload_frees_its_slot(self) -> None:
+        cloud_storage = DirectoryCloudStorage(self.root, failures=3 * len(ImageVariantEnum))
+        upload_queue = ThreadPoolUploadQueue(cloud_storage=cloud_storage, max_workers=2, retry_delay=0)
+        service = self.create_service(cloud_storage, upload_queue)
+
+        service.create(self.command)
+        upload_queue.wait(timeout=10)
+
+        self.assertFalse(ProjectImage.objects.filter(project_id=self.project.id).exists())
+        self.assertEqual(service.get_urls(Id(value=self.project.id)), [])
+        service.create_many(self.create_many_command(amount=PROJECT_IMAGES_MAX_AMOUNT))
+        upload_queue.wait(timeout=10)
+        self.assertEqual(len(service.get_urls(Id(value=self.project.id))), PROJECT_IMAGES_MAX_AMOUNT)
+
+    def test_failed_images_are_not_counted(self) -> None:
+        for order, upload_status in enumerate(UploadStatusEnum, start=1):
+            ProjectImage.objects.create(
+                project=self.project, file_path=f"{upload_status}.jpg", order=order, upload_status=upload_status
+            )
+
+        self.assertEqual(DjProjectImageReadRepository().get_images_count_for_project(self.command.project_id), 2)
+
+    def test_create_keeps_variant_paths(self) -> None:
+        project_image: ProjectImage = DjProjectImageWriteRepository().create(
+            ProjectImageCreatePayload(
+                project_id=self.command.project_id,
+                file_path="full.jpg",
+                thumbnail_path="thumbnail.jpg",
+                card_path="card.jpg",
+                order=1,
+            )
+        )
+
+        project_image.refresh_from_db()
+        self.assertEqual(project_image.paths, ["full.jpg", "card.jpg", "thumbnail.jpg"])
+
+    def test_create_many_uploads_all_images(self) -> None:
+        cloud_storage = DirectoryCloudStorage(self.root)
+        upload_queue = ThreadPoolUploadQueue(cloud_storage=cloud_storage, max_workers=3, retry_delay=0)
+        service = self.create_service(cloud_storage, upload_queue)
+
+        with self.assertNumQueries(3):
+            service.create_many(self.create_many_command(amount=3))
+        upload_queue.wait(timeout=10)
+
+        project_images = list(ProjectImage.objects.filter(project_id=self.project.id).order_by("order"))
+        self.assertEqual([i.order for i in project_images], [1, 2, 3])
+        self.assertEqual({i.upload_status for i in project_images}, {UploadStatusEnum.UPLOADED})
+        for project_image in project_images:
+            for path in project_image.paths:
+                self.assertTrue((self.root / path).is_file())
+
+    def test_create_many_deletes_uploaded_files_when_one_upload_fails(self) -> None:
+        cloud_storage = DirectoryCloudStorage(self.root, failures=1)
+        upload_queue = ThreadPoolUploadQueue(cloud_storage=cloud_storage, max_workers=3, max_attempts=1)
+        service = self.create_service(cloud_storage, upload_queue)
+
+        service.create_many(self.create_many_command(amount=3))
+        upload_queue.wait(timeout=10)
+
+        self.assertFalse(ProjectImage.objects.filter(project_id=self.project.id).exists())
+        self.assertFalse(any(path.is_file() for path in self.root.rglob("*")))
+
+    def test_failed_batch_frees_its_orders(self) -> None:
+        cloud_storage = GatedCloudStorage(self.root, failures=1)
+        upload_queue = ThreadPoolUploadQueue(cloud_storage=cloud_storage, max_workers=3, max_attempts=1)
+        service = self.create_service(cloud_storage, upload_queue)
+
+        service.create_many(self.create_many_command(amount=2))
+        later_image = ProjectImage.objects.create(
+            project=self.project, file_path="later.jpg", order=3, upload_status=UploadStatusEnum.UPLOADED
+        )
+        cloud_storage.release.set()
+        upload_queue.wait(timeout=10)
+
+        self.assertEqual(
+            list(ProjectImage.objects.filter(project_id=self.project.id).values_list("id", "order")),
+            [(later_image.id, 1)],
+        )
+
+    def test_images_are_resized_after_commit(self) -> None:
+        cloud_storage = DirectoryCloudStorage(self.root)
+        upload_queue = ThreadPoolUploadQueue(cloud_storage=cloud_storage, max_workers=3, retry_delay=0)
+        image_processor = StaticImageProcessor()
+        service = self.create_service(cloud_storage, upload_queue, image_processor)
+
+        with transaction.atomic():
+            service.create_many(self.create_many_command(amount=2))
+            self.assertEqual(image_processor.calls, 0)
+        upload_queue.wait(timeout=10)
+
+        self.assertEqual(image_processor.calls, 1)
+        self.assertEqual(len(service.get_urls(Id(value=self.project.id))), 2)
+
+    def test_create_many_checks_max_amount_before_creating(self) -> None:
+        cloud_storage = DirectoryCloudStorage(self.root)
+        upload_queue = ThreadPoolUploadQueue(cloud_storage=cloud_storage, max_workers=3, retry_delay=0)
+        service = self.create_service(cloud_storage, upload_queue)
+
+        with self.assertRaises(ProjectImageMaxAmountException):
+            service.create_many(self.create_many_command(amount=PROJECT_IMAGES_MAX_AMOUNT + 1))
+        self.assertFalse(ProjectImage.objects.filter(project_id=self.project.id).exists())
+
+    def create_many_command(self, amount: int) -> ProjectImagesCreateCommand:
+        return ProjectImagesCreateCommand(
+            user_id=self.command.user_id,
+            project_id=self.command.project_id,
+            image_files=[self.command.image_file] * amount,
+        )
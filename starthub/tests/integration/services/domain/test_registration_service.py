@@ -1,5 +1,10 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from domain.enums.role import RoleEnum
 from domain.exceptions.user import EmailAlreadyExistsException
+from domain.models import role
+from domain.models.role import Role, get_default_role_id
 from domain.models.user import User
 from domain.services.auth import RegistrationService
 from domain.value_objects.common import FirstName, LastName
@@ -22,6 +27,50 @@ class TestRegistrationService(TestCase):
         self.service.register(payload)
         self.assertTrue(User.objects.filter(email="test@example.com").exists())
 
+    def test_registration_inserts_user_and_role_only(self) -> None:
+        payload = UserCreatePayload(
+            email=Email(value="test@example.com"),
+            password=RawPassword(value="Pass1234"),
+        )
+        get_default_role_id()
+
+        with CaptureQueriesContext(connection) as context:
+            user: User = self.service.register(payload)
+
+        statements: list[str] = [
+            query["sql"] for query in context.captured_queries if not query["sql"].startswith(("SAVEPOINT", "RELEASE"))
+        ]
+        self.assertEqual(len(statements), 2)
+        self.assertTrue(all(statement.startswith("INSERT") for statement in statements))
+        self.assertEqual(list(user.roles.values_list("name", flat=True)), [RoleEnum.get_default()])
+
+    def test_default_role_deleted_by_another_process_is_looked_up_again(self) -> None:
+        role_id: int = get_default_role_id()
+        kept_role_id = role._default_role_id
+
+        Role.objects.filter(id=role_id).delete()
+        # Only the shared version is replaced for a process that did not delete the role.
+        role._default_role_id = kept_role_id
+
+        user: User = self.service.register(
+            UserCreatePayload(email=Email(value="test@example.com"), password=RawPassword(value="Pass1234"))
+        )
+
+        self.assertEqual(list(user.roles.values_list("name", flat=True)), [RoleEnum.get_default()])
+        self.assertNotEqual(user.roles.get().id, role_id)
+
+    def test_bulk_create_users_assigns_default_role(self) -> None:
+        users: list[User] = [
+            User.objects.build_user(email=f"user{i}@example.com", password="Pass1234") for i in range(3)
+        ]
+
+        created_users: list[User] = User.objects.bulk_create_users(users)
+
+        self.assertTrue(all(user.pk for user in created_users))
+        self.assertEqual(
+            User.objects.filter(email__startswith="user", roles__name=RoleEnum.get_default()).count(), len(users)
+        )
+
     def test_email_already_exists_register(self) -> None:
         User.objects.create_user(
             first_name="first_name", last_name="last_name", email="test@example.com", password="Pass1234"
@@ -11,7 +11,6 @@ from domain.services.file import ImageService
 from domain.services.user_management import UserService
 from domain.value_objects.common import Description, FirstName, Id, LastName, PhoneNumber
 from domain.value_objects.user import ProfilePictureUploadCommand, RawPassword, UserProfile, UserUpdateCommand
-from infrastructure.cloud_storages.google import google_cloud_storage
 from infrastructure.repositories.user import DjUserReadRepository, DjUserWriteRepository
 from loguru import logger
 
@@ -37,9 +36,11 @@ class TestUserService(TestCase):
             "first_name": "name",
             "last_name": "surname",
         }
-        cls.user_service = UserServiceFactory.create_service()
         cls.image_path = BASE_DIR / "tests/images/frieren.jpg"
 
+    def setUp(self) -> None:
+        self.user_service = UserServiceFactory.create_service()
+
     def check_raises(self, exc: type[Exception], func: Callable[[Any], Any]) -> None:
         self.assertTrue(f":raises {exc.__name__}:" in func.__doc__)
 
@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+from domain.value_objects.cloud_storage import (
+    CloudStorageCreateUrlPayload,
+    CloudStorageCreateUrlsPayload,
+    CloudStorageDeletePayload,
+)
+from infrastructure.cloud_storages.cached import CachedCloudStorage, InProcessSignedUrlCache
+
+
+class TestCachedCloudStorage(SimpleTestCase):
+    def setUp(self) -> None:
+        self.storage = MagicMock()
+        self.storage.create_url.side_effect = lambda payload: f"https://signed/{payload.file_path}"
+        self.storage.create_urls.side_effect = lambda payload: {p: f"https://signed/{p}" for p in payload.file_paths}
+        self.cache = InProcessSignedUrlCache(max_size=2)
+        self.cached_storage = CachedCloudStorage(
+            storage=self.storage, cache=self.cache, url_lifetime=900, safety_margin=60
+        )
+
+    def test_url_is_signed_once(self) -> None:
+        payload = CloudStorageCreateUrlPayload(file_path="projects/photos/1.jpg")
+        first_url = self.cached_storage.create_url(payload)
+        second_url = self.cached_storage.create_url(payload)
+
+        self.assertEqual(first_url, second_url)
+        self.assertEqual(self.storage.create_url.call_count, 1)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_url_is_resigned_within_safety_margin(self) -> None:
+        payload = CloudStorageCreateUrlPayload(file_path="projects/photos/1.jpg")
+        with patch("infrastructure.cloud_storages.cached.time.monotonic", return_value=1000.0):
+            self.cached_storage.create_url(payload)
+        with patch("infrastructure.cloud_storages.cached.time.monotonic", return_value=1000.0 + 900 - 30):
+            self.cached_storage.create_url(payload)
+
+        self.assertEqual(self.storage.create_url.call_count, 2)
+
+    def test_least_recently_used_url_is_evicted(self) -> None:
+        paths = ["a.jpg", "b.jpg", "c.jpg"]
+        self.cached_storage.create_url(CloudStorageCreateUrlPayload(file_path=paths[0]))
+        self.cached_storage.create_url(CloudStorageCreateUrlPayload(file_path=paths[1]))
+        self.cached_storage.create_url(CloudStorageCreateUrlPayload(file_path=paths[0]))
+        self.cached_storage.create_url(CloudStorageCreateUrlPayload(file_path=paths[2]))
+
+        self.assertIsNotNone(self.cache.get(paths[0]))
+        self.assertIsNone(self.cache.get(paths[1]))
+
+    def test_deleted_file_url_is_evicted(self) -> None:
+        self.cached_storage.create_url(CloudStorageCreateUrlPayload(file_path="a.jpg"))
+        self.cached_storage.delete_file(CloudStorageDeletePayload(file_path="a.jpg"))
+
+        self.assertIsNone(self.cache.get("a.jpg"))
+        self.storage.delete_file.assert_called_once()
+
+    def test_only_missing_urls_are_signed_in_batch(self) -> None:
+        self.cached_storage.create_url(CloudStorageCreateUrlPayload(file_path="a.jpg"))
+        urls = self.cached_storage.create_urls(CloudStorageCreateUrlsPayload(file_paths=["a.jpg", "b.jpg", "b.jpg"]))
+
+        self.assertEqual(urls, {"a.jpg": "https://signed/a.jpg", "b.jpg": "https://signed/b.jpg"})
+        self.storage.create_urls.assert_called_once_with(CloudStorageCreateUrlsPayload(file_paths=["b.jpg"]))
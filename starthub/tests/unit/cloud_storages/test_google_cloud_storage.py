@@ -0,0 +1,93 @@
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import requests
+import rsa
+from django.test import SimpleTestCase
+from domain.utils.file_stream import FileStream
+from domain.value_objects.cloud_storage import (
+    CloudStorageCreateUrlPayload,
+    CloudStorageCreateUrlsPayload,
+    CloudStorageUploadPayload,
+)
+from google.cloud.storage import Blob
+from infrastructure.cloud_storages.google import UPLOAD_CHUNK_SIZE, GoogleCloudStorage
+
+
+class TestGoogleCloudStorageSigning(SimpleTestCase):
+    temp_dir: TemporaryDirectory[str]
+    credentials_file: Path
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        _, private_key = rsa.newkeys(1024)
+        cls.temp_dir = TemporaryDirectory()
+        cls.credentials_file = Path(cls.temp_dir.name) / "credentials.json"
+        cls.credentials_file.write_text(
+            json.dumps(
+                {
+                    "type": "service_account",
+                    "project_id": "test-project",
+                    "private_key_id": "test-key-id",
+                    "private_key": private_key.save_pkcs1().decode(),
+                    "client_email": "test@test-project.iam.gserviceaccount.com",
+                    "client_id": "1",
+                    "token_uri": "https://oauth2.googleapis.com/token",
+                }
+            )
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.temp_dir.cleanup()
+        super().tearDownClass()
+
+    def test_urls_are_signed_without_http_requests(self) -> None:
+        storage = GoogleCloudStorage(bucket_name="test-bucket", credentials_file=self.credentials_file)
+
+        with patch.object(requests.Session, "request", side_effect=AssertionError("Unexpected http request.")) as m:
+            url = storage.create_url(CloudStorageCreateUrlPayload(file_path="test/projects/photos/1.jpg"))
+            urls = storage.create_urls(CloudStorageCreateUrlsPayload(file_paths=["a.jpg", "b.jpg", "a.jpg"]))
+
+        m.assert_not_called()
+        parsed_url = urlparse(url)
+        self.assertEqual(parsed_url.path, "/test-bucket/test/projects/photos/1.jpg")
+        self.assertIn("X-Goog-Signature", parse_qs(parsed_url.query))
+        self.assertEqual(list(urls), ["a.jpg", "b.jpg"])
+
+
+class TestGoogleCloudStorageUpload(SimpleTestCase):
+    def setUp(self) -> None:
+        self.storage = GoogleCloudStorage(bucket_name="test-bucket", client=MagicMock())
+        self.storage._bucket = self.storage.client.bucket("test-bucket")
+        self.storage._bucket.blob.side_effect = lambda blob_name, chunk_size: Blob(
+            blob_name, bucket=MagicMock(), chunk_size=chunk_size
+        )
+
+    def upload(self, size: int) -> tuple[Blob, FileStream, dict[str, Any]]:
+        file = FileStream.from_bytes(b"0" * size)
+        with patch.object(Blob, "upload_from_file", autospec=True) as upload_from_file:
+            self.storage.upload_file(CloudStorageUploadPayload(file=file, file_path="projects/plans/1.pdf"))
+        blob, *_ = upload_from_file.call_args.args
+        return blob, file, upload_from_file.call_args.kwargs
+
+    def test_small_file_is_uploaded_in_one_request(self) -> None:
+        blob, file, kwargs = self.upload(UPLOAD_CHUNK_SIZE)
+
+        self.assertIsNone(blob.chunk_size)
+        self.assertEqual(kwargs, {"file_obj": file, "rewind": True, "size": UPLOAD_CHUNK_SIZE})
+
+    def test_large_file_is_streamed_in_chunks(self) -> None:
+        blob, file, kwargs = self.upload(UPLOAD_CHUNK_SIZE + 1)
+
+        self.assertEqual(blob.chunk_size, UPLOAD_CHUNK_SIZE)
+        self.assertIs(kwargs["file_obj"], file)
+
+    def test_chunk_size_must_be_multiple_of_256_kib(self) -> None:
+        with self.assertRaises(ValueError):
+            GoogleCloudStorage(bucket_name="test-bucket", upload_chunk_size=1000)
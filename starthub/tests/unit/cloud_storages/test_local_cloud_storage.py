@@ -0,0 +1,125 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest.mock import PropertyMock, patch
+from urllib.parse import parse_qs, urlsplit
+
+from application.services.gateway import Gateway
+from django.test import SimpleTestCase
+from domain.exceptions.cloud_storage import FileNotFoundCloudStorageException, InvalidSignatureCloudStorageException
+from domain.utils.file_stream import FileStream
+from domain.value_objects.cloud_storage import (
+    CloudStorageCreateUrlPayload,
+    CloudStorageCreateUrlsPayload,
+    CloudStorageDeletePayload,
+    CloudStorageUploadPayload,
+)
+from infrastructure.cloud_storages.local import InMemoryCloudStorage, LocalCloudStorage, LocalFileSystemCloudStorage
+
+BASE_URL = "/api/v2/storage/"
+
+
+def split_url(url: str) -> tuple[str, str, str]:
+    """:return: The file path, expiration time and signature of a signed url."""
+    parts = urlsplit(url)
+    query = parse_qs(parts.query)
+    return parts.path.removeprefix(BASE_URL), query["expires"][0], query["signature"][0]
+
+
+class TestLocalFileSystemCloudStorage(SimpleTestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.storage = LocalFileSystemCloudStorage(root=self.root, base_url=BASE_URL, secret_key="secret")
+        self.storage.upload_file(
+            CloudStorageUploadPayload(file_path="projects/photos/1.jpg", file=FileStream.from_bytes(b"image"))
+        )
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_uploaded_file_is_served_by_signed_url(self) -> None:
+        url = self.storage.create_url(CloudStorageCreateUrlPayload(file_path="projects/photos/1.jpg"))
+
+        with self.storage.open_signed_file(*split_url(url)) as file:
+            self.assertEqual(file.read(), b"image")
+        self.assertEqual(list(self.root.rglob(".*")), [])
+
+    def test_tampered_and_expired_urls_are_rejected(self) -> None:
+        url = self.storage.create_url(CloudStorageCreateUrlPayload(file_path="projects/photos/1.jpg"))
+        file_path, expires, signature = split_url(url)
+
+        with self.assertRaises(InvalidSignatureCloudStorageException):
+            self.storage.open_signed_file("projects/photos/2.jpg", expires, signature)
+        with self.assertRaises(InvalidSignatureCloudStorageException):
+            self.storage.open_signed_file(file_path, str(int(expires) + 1), signature)
+        with patch("infrastructure.cloud_storages.local.time.time", return_value=int(expires) + 1):
+            with self.assertRaises(InvalidSignatureCloudStorageException):
+                self.storage.open_signed_file(file_path, expires, signature)
+
+    def test_paths_outside_root_are_not_found(self) -> None:
+        with self.assertRaises(FileNotFoundCloudStorageException):
+            self.storage.upload_file(
+                CloudStorageUploadPayload(file_path="../outside.jpg", file=FileStream.from_bytes(b"image"))
+            )
+        with self.assertRaises(FileNotFoundCloudStorageException):
+            self.storage.open_file("../outside.jpg")
+
+    def test_deleted_file_is_not_found(self) -> None:
+        self.storage.delete_file(CloudStorageDeletePayload(file_path="projects/photos/1.jpg"))
+
+        with self.assertRaises(FileNotFoundCloudStorageException):
+            self.storage.open_file("projects/photos/1.jpg")
+        with self.assertRaises(FileNotFoundCloudStorageException):
+            self.storage.delete_file(CloudStorageDeletePayload(file_path="projects/photos/1.jpg"))
+
+
+class TestInMemoryCloudStorage(SimpleTestCase):
+    def setUp(self) -> None:
+        self.storage = InMemoryCloudStorage(base_url=BASE_URL, secret_key="secret")
+
+    def test_uploaded_files_are_served_by_signed_urls(self) -> None:
+        for i in range(2):
+            self.storage.upload_file(
+                CloudStorageUploadPayload(file_path=f"news/{i}.jpg", file=FileStream.from_bytes(bytes([i])))
+            )
+        urls = self.storage.create_urls(CloudStorageCreateUrlsPayload(file_paths=["news/0.jpg", "news/1.jpg"]))
+
+        for i, url in enumerate(urls.values()):
+            self.assertEqual(self.storage.open_signed_file(*split_url(url)).read(), bytes([i]))
+
+    def test_deleting_missing_file_raises(self) -> None:
+        with self.assertRaises(FileNotFoundCloudStorageException):
+            self.storage.delete_file(CloudStorageDeletePayload(file_path="news/0.jpg"))
+
+
+class TestLocalStorageFileView(SimpleTestCase):
+    def setUp(self) -> None:
+        self.storage = InMemoryCloudStorage(base_url=BASE_URL, secret_key="secret")
+        self.storage.upload_file(
+            CloudStorageUploadPayload(file_path="users/avatar.png", file=FileStream.from_bytes(b"avatar"))
+        )
+
+    def get(self, url: str, storage: LocalCloudStorage | None) -> Any:
+        with patch.object(Gateway, "local_cloud_storage", new_callable=PropertyMock, return_value=storage):
+            return self.client.get(url)
+
+    def test_file_is_served(self) -> None:
+        response = self.get(
+            self.storage.create_url(CloudStorageCreateUrlPayload(file_path="users/avatar.png")), self.storage
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/png")
+        self.assertEqual(b"".join(response.streaming_content), b"avatar")
+
+    def test_unsigned_url_is_forbidden(self) -> None:
+        response = self.get(f"{BASE_URL}users/avatar.png", self.storage)
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()["code"], "INVALID_SIGNATURE")
+
+    def test_files_are_not_served_for_remote_backends(self) -> None:
+        response = self.get(self.storage.create_url(CloudStorageCreateUrlPayload(file_path="users/avatar.png")), None)
+
+        self.assertEqual(response.status_code, 404)
@@ -22,6 +22,7 @@ from domain.exceptions.validation import (
     LastNameIsTooLongException,
     MissingRequiredFieldException,
 )
+from domain.utils.file_stream import FileStream
 from domain.value_objects.file import ImageFile
 from domain.value_objects.project_management import ProjectCreateCommand
 from loguru import logger
@@ -90,7 +91,7 @@ class TestProjectCreateCommandConversion(SimpleTestCase):
         self.assertEqual(command.goal_sum.value, self.valid_data["project"]["goal_sum"])
         self.assertEqual(command.deadline.value.isoformat(), self.valid_data["project"]["deadline"])
         self.assertEqual(command.phone_number.value, self.valid_data["project"]["phone_number"])
-        self.assertTrue(isinstance(command.plan_file.value, bytes))
+        self.assertTrue(isinstance(command.plan_file.value, FileStream))
 
         # Team members
         self.assertEqual(len(command.team_members), len(self.valid_data["team_members"]))
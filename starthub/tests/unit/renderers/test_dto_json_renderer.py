@@ -0,0 +1,52 @@
+from dataclasses import asdict, dataclass
+from datetime import date
+from decimal import Decimal
+
+from application.dto.project import CategoryDto, FundingModelDto, ProjectCardDto
+from django.test import SimpleTestCase
+from presentation.renderers import DtoJSONRenderer
+from rest_framework.renderers import JSONRenderer
+
+
+@dataclass(slots=True)
+class SlottedDto:
+    name: str
+    deadline: date
+
+
+class DtoJSONRendererTest(SimpleTestCase):
+    def setUp(self) -> None:
+        self.card = ProjectCardDto(
+            id=1,
+            name="Project",
+            slug="project",
+            summary="summary",
+            cover_url=None,
+            category=CategoryDto(id=1, name="Category", slug="category"),
+            funding_model=FundingModelDto(id=1, name="Funding model", slug="funding-model"),
+            company_name="Company",
+            country_code="ZZ",
+            creator_id=1,
+            goal_sum=1000.0,
+            current_sum=Decimal("10.5"),
+            deadline=date(2030, 1, 1),
+            stage="idea",
+            status="active",
+        )
+
+    def test_renders_dtos_as_asdict_does(self) -> None:
+        card: dict = asdict(self.card)
+        cases = [
+            (self.card, card),
+            ([self.card, self.card], [card, card]),
+            ({"results": [self.card]}, {"results": [card]}),
+        ]
+        for data, copied in cases:
+            with self.subTest(data=type(data)):
+                self.assertEqual(DtoJSONRenderer().render(data), JSONRenderer().render(copied))
+
+    def test_renders_slotted_dtos(self) -> None:
+        self.assertEqual(
+            DtoJSONRenderer().render(SlottedDto(name="name", deadline=date(2030, 1, 1))),
+            b'{"name":"name","deadline":"2030-01-01"}',
+        )
@@ -4,9 +4,12 @@ from pathlib import Path
 import filetype
 from config.settings import BASE_DIR
 from django.test import SimpleTestCase
+from domain.constants import IMAGE_VARIANTS
+from domain.enums.image_variant import ImageVariantEnum
 from domain.exceptions.file import NotSupportedImageFormatException
 from domain.services.file import ImageService
 from loguru import logger
+from wand.image import Image
 
 
 class TestImageService(SimpleTestCase):
@@ -55,3 +58,16 @@ class TestImageService(SimpleTestCase):
                     converted: BytesIO = ImageService().convert_to_jpg(img_file)
                 kind = filetype.guess(converted)
                 self.assertEqual(kind.mime, "image/jpeg")
+
+    def test_create_variants(self) -> None:
+        for i in self.supported_image_files:
+            with self.subTest(file=i.name), open(i, mode="rb") as img_file:
+                variants: dict[ImageVariantEnum, bytes] = ImageService().create_variants(
+                    img_file, tuple(ImageVariantEnum)
+                )
+                self.assertEqual(set(variants), set(ImageVariantEnum))
+                for variant, image_data in variants.items():
+                    self.assertEqual(filetype.guess(image_data).mime, "image/jpeg")
+                    with Image(blob=image_data) as image:
+                        self.assertLessEqual(max(image.width, image.height), IMAGE_VARIANTS[variant][0])
+                        self.assertFalse([key for key in image.metadata if key.startswith("exif:")])
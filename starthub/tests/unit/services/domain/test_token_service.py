@@ -78,7 +78,10 @@ class TokenServiceTestCase(SimpleTestCase):
         self.check_exp(cast(int, decoded_payload["exp"]), self.refresh_token_lifetime)
 
         self.assertEqual(decoded_payload["sub"], str(self.user.id))
+        self.assertEqual(decoded_payload["email"], self.user.email)
         self.assertEqual(decoded_payload["type"], TokenTypeEnum.REFRESH)
+        other_refresh_token: RefreshTokenVo = self.token_service.generate_refresh(user=self.user)
+        self.assertNotEqual(decoded_payload["jti"], self.token_service.verify_refresh(other_refresh_token).jti)
 
     def test_verify_valid_access_token(self) -> None:
         access_token: AccessTokenVo = self.token_service.generate_access(self.user)
@@ -127,9 +130,16 @@ class TokenServiceTestCase(SimpleTestCase):
             "type": TokenTypeEnum.ACCESS,
         }
         expired_token: str = jwt.encode(payload, self.secret_key, algorithm=JWT_ALGORITHM)
-        with self.assertRaises(TokenExpiredException) as context:
-            self.token_service.verify_access(AccessTokenVo(value=expired_token))
+        messages: list[str] = list()
+        handler_id: int = logger.add(messages.append, level="INFO")
+        try:
+            with self.assertRaises(TokenExpiredException) as context:
+                self.token_service.verify_access(AccessTokenVo(value=expired_token))
+        finally:
+            logger.remove(handler_id)
         self.assertEqual(str(context.exception), "Access token has expired.")
+        # Every request with an expired cookie gets here, it is not worth a traceback in the logs.
+        self.assertEqual(messages, [])
 
     def test_expired_refresh_token(self) -> None:
         iat = int((datetime.now(UTC)).timestamp()) - 100
@@ -138,6 +148,7 @@ class TokenServiceTestCase(SimpleTestCase):
         payload = {
             "sub": str(self.user.id),
             "email": self.user.email,
+            "jti": "jti",
             "iat": iat,
             "exp": exp,
             "type": TokenTypeEnum.REFRESH,
@@ -173,6 +184,8 @@ class TokenServiceTestCase(SimpleTestCase):
 
         base_payload = {
             "sub": str(self.user.id),
+            "email": self.user.email,
+            "jti": "jti",
             "iat": iat,
             "exp": exp,
             "type": TokenTypeEnum.REFRESH,
@@ -196,6 +209,8 @@ class TokenServiceTestCase(SimpleTestCase):
 
         payload = {
             "sub": str(self.user.id),
+            "email": self.user.email,
+            "jti": "jti",
             "iat": str(iat),
             "exp": str(exp),
             "type": TokenTypeEnum.ACCESS,
@@ -247,6 +262,8 @@ class TokenServiceTestCase(SimpleTestCase):
         exp = iat + self.refresh_token_lifetime
         payload = {
             "sub": str(self.user.id),
+            "email": self.user.email,
+            "jti": "jti",
             "iat": iat,
             "exp": exp,
             "type": "invalid",
@@ -0,0 +1,39 @@
+from unittest.mock import Mock, patch
+
+from django.core.cache import caches
+from django.test import SimpleTestCase
+from domain.value_objects.common import Id
+from infrastructure.services.permission_cache import VersionedPermissionCache
+
+PERMISSIONS = frozenset({"view.own.project"})
+
+
+class TestVersionedPermissionCache(SimpleTestCase):
+    def setUp(self) -> None:
+        caches["default"].clear()
+        self.cache = VersionedPermissionCache(max_size=10, timeout=60, local_timeout=30)
+        self.user_id = Id(value=1)
+
+    def test_process_keeps_permissions_until_invalidated(self) -> None:
+        load = Mock(return_value=PERMISSIONS)
+        self.cache.get_or_set(self.user_id, load)
+        self.cache.get_or_set(self.user_id, load)
+        self.assertEqual(load.call_count, 1)
+
+        self.cache.invalidate_user(self.user_id)
+        self.cache.get_or_set(self.user_id, load)
+        self.assertEqual(load.call_count, 2)
+
+    def test_process_entries_expire_without_invalidation(self) -> None:
+        load = Mock(return_value=PERMISSIONS)
+        with patch("infrastructure.services.permission_cache.time.monotonic", return_value=1000.0):
+            self.cache.get_or_set(self.user_id, load)
+        # The shared entry is gone and no invalidation arrives, as when another process missed it.
+        caches["default"].delete(self.cache._entry_key(self.user_id.value))
+
+        with patch("infrastructure.services.permission_cache.time.monotonic", return_value=1029.0):
+            self.cache.get_or_set(self.user_id, load)
+        self.assertEqual(load.call_count, 1)
+        with patch("infrastructure.services.permission_cache.time.monotonic", return_value=1031.0):
+            self.cache.get_or_set(self.user_id, load)
+        self.assertEqual(load.call_count, 2)
@@ -0,0 +1,20 @@
+from django.test import SimpleTestCase
+from infrastructure.services.revocation_index import BloomFilter
+
+
+class TestBloomFilter(SimpleTestCase):
+    def test_added_keys_are_always_found(self) -> None:
+        bloom_filter = BloomFilter(capacity=1000)
+        keys: list[str] = [f"jti:{i}" for i in range(1000)]
+        for key in keys:
+            bloom_filter.add(key)
+
+        self.assertTrue(all(key in bloom_filter for key in keys))
+
+    def test_false_positive_rate_is_near_error_rate(self) -> None:
+        bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom_filter.add(f"jti:{i}")
+
+        false_positives: int = sum(f"user:{i}" in bloom_filter for i in range(10_000))
+        self.assertLess(false_positives / 10_000, 0.03)
@@ -0,0 +1,70 @@
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+from domain.exceptions.auth import InvalidTokenException, TokenExpiredException
+from domain.models.user import User
+from domain.services.auth import TokenService
+from domain.value_objects.token import AccessPayload, AccessTokenVo
+from infrastructure.services.token_verifier import CachedAccessTokenVerifier
+
+
+class TestCachedAccessTokenVerifier(SimpleTestCase):
+    def setUp(self) -> None:
+        self.token_service = TokenService(secret_key="secret_key")
+        self.verifier = CachedAccessTokenVerifier(token_service=self.token_service, max_size=2)
+
+    def generate_access(self, user_id: int) -> AccessTokenVo:
+        user = MagicMock(spec=User)
+        user.id = user_id
+        user.email = f"user{user_id}@example.com"
+        return self.token_service.generate_access(user)
+
+    def test_token_is_decoded_once(self) -> None:
+        token: AccessTokenVo = self.generate_access(user_id=1)
+
+        first_payload: AccessPayload = self.verifier.verify(token)
+        second_payload: AccessPayload = self.verifier.verify(token)
+
+        self.assertEqual(first_payload, second_payload)
+        self.assertEqual(first_payload.sub, "1")
+        self.assertEqual(self.verifier.hits, 1)
+        self.assertEqual(self.verifier.misses, 1)
+
+    def test_token_is_not_served_after_expiration(self) -> None:
+        token: AccessTokenVo = self.generate_access(user_id=1)
+        payload: AccessPayload = self.verifier.verify(token)
+
+        with patch("infrastructure.services.token_verifier.time.time", return_value=payload.exp):
+            self.verifier.verify(token)
+
+        self.assertEqual(self.verifier.hits, 0)
+        self.assertEqual(self.verifier.misses, 2)
+
+    def test_expired_token_is_not_cached(self) -> None:
+        token: AccessTokenVo = TokenService(secret_key="secret_key", access_token_lifetime=-1).generate_access(
+            MagicMock(spec=User, id=1, email="user1@example.com")
+        )
+
+        for _ in range(2):
+            with self.assertRaises(TokenExpiredException):
+                self.verifier.verify(token)
+        self.assertEqual(self.verifier.misses, 2)
+
+    def test_other_token_with_cached_signature_is_verified(self) -> None:
+        token: AccessTokenVo = self.generate_access(user_id=1)
+        self.verifier.verify(token)
+        header, _, signature = token.value.split(".")
+        _, forged_payload, _ = self.generate_access(user_id=2).value.split(".")
+
+        with self.assertRaises(InvalidTokenException):
+            self.verifier.verify(AccessTokenVo(value=f"{header}.{forged_payload}.{signature}"))
+
+    def test_least_recently_used_token_is_evicted(self) -> None:
+        tokens: list[AccessTokenVo] = [self.generate_access(user_id=i) for i in range(1, 4)]
+        for token in tokens:
+            self.verifier.verify(token)
+
+        self.verifier.verify(tokens[0])
+
+        self.assertEqual(self.verifier.hits, 0)
+        self.assertEqual(self.verifier.misses, 4)
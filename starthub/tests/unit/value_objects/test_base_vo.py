@@ -0,0 +1,13 @@
+from django.test import SimpleTestCase
+from domain.value_objects.common import PhoneNumber
+from domain.value_objects.user import Email
+
+
+class BaseVoFromTrustedTest(SimpleTestCase):
+    def test_equals_validated_value_object(self) -> None:
+        self.assertEqual(Email.from_trusted(value="user@example.com"), Email(value="user@example.com"))
+        self.assertEqual(PhoneNumber.from_trusted(value="+12025550100"), PhoneNumber(value="+12025550100"))
+
+    def test_skips_validation(self) -> None:
+        self.assertEqual(Email.from_trusted(value="not an email").value, "not an email")
+        self.assertEqual(PhoneNumber.from_trusted(value="12345").value, "12345")
@@ -0,0 +1,45 @@
+from io import BytesIO
+
+from config.settings import BASE_DIR
+from django.test import SimpleTestCase
+from domain.constants import FILE_SIGNATURE_SIZE, PDF_MAX_SIZE_IN_BYTES
+from domain.exceptions.file import NotPdfFileException, PdfFileTooLargeException
+from domain.utils.file_stream import FileStream
+from domain.value_objects.file import ImageFile, PdfFile
+
+
+class CountingBytesIO(BytesIO):
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size: int | None = -1) -> bytes:
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+class TestFileValueObjects(SimpleTestCase):
+    def test_only_file_signature_is_read(self) -> None:
+        pdf_data: bytes = (BASE_DIR / "tests/files/The_C_Programming_Language.pdf").read_bytes()
+        file = CountingBytesIO(pdf_data)
+
+        pdf_file = PdfFile(value=FileStream(file))
+
+        self.assertEqual(pdf_file.value.size, len(pdf_data))
+        self.assertLessEqual(file.bytes_read, FILE_SIGNATURE_SIZE)
+        self.assertEqual(b"".join(pdf_file.value.chunks()), pdf_data)
+
+    def test_too_large_file_is_rejected_by_size(self) -> None:
+        file = CountingBytesIO(b"%PDF-1.7\n")
+
+        with self.assertRaises(PdfFileTooLargeException):
+            PdfFile(value=FileStream(file, size=PDF_MAX_SIZE_IN_BYTES + 1))
+        self.assertEqual(file.bytes_read, 0)
+
+    def test_file_type_is_checked(self) -> None:
+        image_data: bytes = (BASE_DIR / "tests/images/miku.jpg").read_bytes()
+
+        self.assertEqual(ImageFile(value=FileStream.from_bytes(image_data)).value.size, len(image_data))
+        with self.assertRaises(NotPdfFileException):
+            PdfFile(value=FileStream.from_bytes(image_data))